@@ -7,6 +7,8 @@ from datetime import datetime
 from dotenv import load_dotenv
 import weather_router
 import power_router
+from compute_pool import compute_pools
+from response_cache import ResponseCacheMiddleware, response_cache
 
 # 환경변수 로드
 load_dotenv()
@@ -23,6 +25,9 @@ app = FastAPI(title="전력 발전량 통합 시스템",
               description="기상 데이터를 기반으로 전력 발전량을 예측하는 API", 
               version="2.0.0")
 
+# 결정적 엔드포인트 조건부 캐시 (ETag/304, LRU, Cache-Control) - CORS 미들웨어 안쪽에 위치하도록 먼저 등록
+app.add_middleware(ResponseCacheMiddleware, version_fn=power_router.response_cache_version)
+
 # CORS 설정 - React 앱과 통신 허용
 app.add_middleware(
     CORSMiddleware,
@@ -48,9 +53,29 @@ async def health_check():
             "upload_dir": UPLOAD_DIR,
             "model_dir": MODEL_DIR,
             "cache_dir": CACHE_DIR
-        }
+        },
+        "compute_pools": compute_pools.status(),
+        "response_cache": response_cache.status()
     }
 
+# 모델 준비 상태 API (모든 모델이 준비되면 200, 준비 중/실패 모델이 있으면 503)
+@app.get("/api/health/ready")
+async def readiness_check():
+    readiness = power_router.model_readiness()
+    readiness["timestamp"] = datetime.now().isoformat()
+    return JSONResponse(status_code=200 if readiness["ready"] else 503, content=readiness)
+
+# 앱 시작 시 모델 로드/학습 및 기본 응답 구체화 (작업 스레드 - 요청 처리를 막지 않음)
+@app.on_event("startup")
+async def start_model_warmup():
+    power_router.model_warmup.start()
+    power_router.materialized_views.start()
+
+# 앱 종료 시 계산 풀 종료
+@app.on_event("shutdown")
+async def stop_compute_pools():
+    compute_pools.shutdown()
+
 # 라우터 등록
 try:
     # 전력 계산 모듈 및 라우터 로드
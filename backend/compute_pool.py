@@ -0,0 +1,157 @@
+"""
+계산 작업 실행 풀 모듈
+- CPU 사용량이 큰 핸들러 계산(기간별 예측, 스윕, ESS 시뮬레이션, ML 추론)을 이벤트 루프 밖의 제한된 스레드 풀에서 실행
+- 엔드포인트(작업 이름) → 풀 이름 라우팅과 풀별 스레드 수를 환경 변수로 설정
+  예) COMPUTE_POOL_SIZES="horizon=2,simulation=2,ml=1", COMPUTE_ROUTES="annual=inline,uncertainty=heavy"
+- 풀을 나누어 긴 기간 예측이 실행 중이어도 실시간/ML 경로의 지연이 늘지 않도록 함
+- 계산기/캐시 객체를 공유해야 하므로 프로세스 풀 대신 스레드 풀 사용 (NumPy/sklearn 연산은 GIL을 해제)
+"""
+import os
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 이벤트 루프에서 바로 실행하는 라우트 값
+INLINE_POOL = 'inline'
+
+# 풀별 기본 스레드 수
+DEFAULT_POOL_SIZES = {
+    'horizon': 2,
+    'simulation': 2,
+    'ml': 1
+}
+
+# 작업 이름 → 풀 이름 기본 라우팅 (등록되지 않은 작업은 이벤트 루프에서 실행)
+DEFAULT_ROUTES = {
+    # 전력 예측 (power_router)
+    'daily': 'horizon',
+    'weekly': 'horizon',
+    'monthly': 'horizon',
+    'annual': 'horizon',
+    'fleet': 'horizon',
+    'uncertainty': 'horizon',
+    'backcast': 'horizon',
+    'expected': 'horizon',
+    'design_sweep': 'horizon',
+    'predict_batch': 'horizon',
+    'ml_predict': 'ml',
+    # ESS (ess_router)
+    'ess_simulate': 'simulation',
+    'ess_schedule': 'simulation'
+}
+
+
+def _parse_mapping(text):
+    """'a=1,b=2' 형식 문자열 → dict (값은 문자열)"""
+    mapping = {}
+    for item in (text or '').split(','):
+        if '=' in item:
+            key, value = item.split('=', 1)
+            if key.strip():
+                mapping[key.strip()] = value.strip()
+    return mapping
+
+
+class ComputePools:
+    """
+    이름별 제한된 스레드 풀과 작업 라우팅
+
+    Attributes:
+        sizes (dict): 풀 이름 → 최대 스레드 수
+        routes (dict): 작업 이름 → 풀 이름 (INLINE_POOL = 이벤트 루프에서 실행)
+    """
+
+    def __init__(self, sizes=None, routes=None):
+        if sizes is None:
+            sizes = dict(DEFAULT_POOL_SIZES)
+            sizes.update({name: int(value) for name, value in _parse_mapping(os.getenv("COMPUTE_POOL_SIZES")).items()})
+        if routes is None:
+            routes = dict(DEFAULT_ROUTES)
+            routes.update(_parse_mapping(os.getenv("COMPUTE_ROUTES")))
+
+        self.sizes = {name: max(1, size) for name, size in sizes.items()}
+        self.routes = routes
+        self._executors = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def pool_for(self, task):
+        """작업 이름 → 풀 이름"""
+        return self.routes.get(task, INLINE_POOL)
+
+    def _executor(self, pool):
+        """풀 이름 → 스레드 풀 (처음 사용 시 생성, 크기 미지정 풀은 1 스레드)"""
+        with self._lock:
+            if pool not in self._executors:
+                self._executors[pool] = ThreadPoolExecutor(
+                    max_workers=self.sizes.get(pool, 1), thread_name_prefix=f"compute-{pool}"
+                )
+                self._stats[pool] = {'submitted': 0, 'running': 0, 'completed': 0, 'failed': 0}
+            return self._executors[pool]
+
+    def _tracked(self, pool, fn):
+        """실행 중/완료 작업 수를 기록하는 래퍼 (풀 스레드에서 실행)"""
+        stats = self._stats[pool]
+        with self._lock:
+            stats['running'] += 1
+        try:
+            result = fn()
+        except Exception:
+            with self._lock:
+                stats['failed'] += 1
+            raise
+        finally:
+            with self._lock:
+                stats['running'] -= 1
+        with self._lock:
+            stats['completed'] += 1
+        return result
+
+    async def run(self, task, fn, *args, **kwargs):
+        """
+        작업 실행 후 결과 대기 (라우팅된 풀에서 실행, inline이면 바로 실행)
+
+        Args:
+            task (str): 작업 이름 (routes의 키)
+            fn (callable): 실행할 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값 (예외는 호출자에게 그대로 전달)
+        """
+        pool = self.pool_for(task)
+        call = functools.partial(fn, *args, **kwargs)
+        if pool == INLINE_POOL:
+            return call()
+
+        executor = self._executor(pool)
+        with self._lock:
+            self._stats[pool]['submitted'] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._tracked, pool, call)
+
+    def status(self):
+        """
+        풀 설정 및 작업 통계
+
+        Returns:
+            dict: sizes, routes, 풀별 통계 (submitted, running, completed, failed, queued)
+        """
+        with self._lock:
+            pools = {}
+            for pool, stats in self._stats.items():
+                pools[pool] = dict(stats)
+                pools[pool]['queued'] = stats['submitted'] - stats['running'] - stats['completed'] - stats['failed']
+            return {'sizes': dict(self.sizes), 'routes': dict(self.routes), 'pools': pools}
+
+    def shutdown(self, wait=False):
+        """스레드 풀 종료 (앱 종료 시)"""
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# 앱 전체 공용 실행 풀 (power_router, ess_router, ML 배처에서 공유)
+compute_pools = ComputePools()
@@ -0,0 +1,198 @@
+"""
+설계 변수 스윕 모듈 - 풍력 발전기/지압 타일 규모 결정
+- 설계 변수 격자(count, area, efficiency, tiles_count)의 모든 조합에 대해 연간 발전량과
+  가로등 소비 전력(led_streetlight_power x streetlight_count x 일몰 ~ 일출 점등 시간) 대비 수지를 한 번의 브로드캐스트 계산으로 평가
+- 터빈 1대 연간 발전량은 area x efficiency 곱에만 의존하므로, 시간별 출력 계수를 정렬/누적합한 뒤
+  정격 출력 도달 지점을 이분 탐색하여 조합 수와 무관하게 O(log H)로 계산
+- 결과: 비용 대비 발전량 파레토 집합, 수요를 충족하는 최소 비용 구성
+"""
+import numpy as np
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from power_series import round_like_python
+
+# 스윕 가능한 설계 변수 (site_registry 열 이름과 동일)
+DESIGN_PARAMETERS = ('count', 'area', 'efficiency', 'tiles_count')
+
+# 한 번에 평가하는 최대 조합 수
+MAX_SWEEP_CONFIGS = 2_000_000
+
+
+class DesignSweeper:
+    """
+    사이트별 설계 변수 스윕 계산기
+
+    연간 시간별 풍속/기온/인원 수 모델은 PowerCalculator.predict_calendar_year_power와 같습니다.
+    지압 발전량 계산식에는 타일 개수가 들어가지 않으므로 tiles_count는 비용 항목으로만 반영됩니다.
+
+    Attributes:
+        power_calculator (PowerCalculator): 발전량 계산기
+    """
+
+    def __init__(self, power_calculator):
+        self.power_calculator = power_calculator
+        self._profile_cache = {}
+
+    def _annual_profile(self, location, year, avg_wind_speed):
+        """
+        터빈 1대의 시간별 출력 계수 (area x efficiency = 1 기준, 시동 풍속 미만 = 0)를 정렬한 배열과 누적합
+
+        Returns:
+            dict: sorted_coefficients, cumulative, piezo_wh, days, streetlight_hours
+        """
+        calculator = self.power_calculator
+        cache_key = (location, year, avg_wind_speed, id(calculator.site_registry), calculator.settings_version)
+        if cache_key in self._profile_cache:
+            return self._profile_cache[cache_key]
+
+        params = calculator.site_registry.arrays
+        site = calculator.site_registry.index_of(location)
+        calendar = calculator.calendar_hours(year)
+        month = calendar['month']
+        hour = calendar['hour']
+
+        monthly_wind_speeds = np.array([avg_wind_speed * factor for factor in calculator.monthly_wind_factors])
+        temp_table = np.array([calculator._temp_info_values(temp_info) for temp_info in calculator._annual_temp_infos()], dtype=float)
+        temp_factor, range_factor = calculator.temperature_factors_batch(temp_table[month, 0], temp_table[month, 1], temp_table[month, 2])
+
+        adjusted_wind_speed = monthly_wind_speeds[month] * calculator.hourly_wind_factors[hour] * params['wind_factor'][site]
+        coefficients = 0.5 * 1.225 * adjusted_wind_speed * adjusted_wind_speed * adjusted_wind_speed * temp_factor * range_factor
+        coefficients = np.where(adjusted_wind_speed < params['start_wind_speed'][site], 0.0, coefficients)
+
+        hourly_people = calculator._weekly_hourly_people(location)[hour]
+        sorted_coefficients = np.sort(coefficients)
+        profile = {
+            'sorted_coefficients': sorted_coefficients,
+            'cumulative': np.concatenate(([0.0], np.cumsum(sorted_coefficients))),
+            'piezo_wh': float(calculator.calculate_piezo_power_batch(location, hourly_people, 1).sum()),
+            'days': calendar['num_days'],
+            'streetlight_hours': float(calendar['night_fraction'].sum())
+        }
+        self._profile_cache[cache_key] = profile
+        return profile
+
+    def turbine_energy(self, location, area_efficiency, year, avg_wind_speed=3.5):
+        """
+        터빈 1대 연간 발전량 (area x efficiency 값 배열에 대해 벡터화)
+
+        sum_h min(p * c_h, 정격) = p * (정격 미만 시간의 c_h 합) + 정격 * (정격 도달 시간 수)
+
+        Args:
+            location (str): 위치명
+            area_efficiency (array-like): area x efficiency 값 배열
+            year (int): 연도
+            avg_wind_speed (float): 연평균 기준 풍속 (m/s)
+
+        Returns:
+            np.ndarray: 터빈 1대 연간 발전량 (Wh, AC/DC 변환 효율 적용 전)
+        """
+        profile = self._annual_profile(location, year, avg_wind_speed)
+        rated_power = self.power_calculator.site_registry.arrays['rated_power'][self.power_calculator.site_registry.index_of(location)]
+        products = np.asarray(area_efficiency, dtype=float)
+        coefficients = profile['sorted_coefficients']
+
+        # 정격 도달 계수 경계 (p = 0이면 정격에 도달하지 않음)
+        with np.errstate(divide='ignore'):
+            threshold = np.where(products > 0, rated_power / products, np.inf)
+        below = np.searchsorted(coefficients, threshold, side='left')
+        return products * profile['cumulative'][below] + rated_power * (len(coefficients) - below)
+
+    def sweep(self, location, grids=None, year=None, avg_wind_speed=3.5, cost_weights=None):
+        """
+        설계 변수 격자의 모든 조합 평가
+
+        비용은 설계 변수 값을 격자 최댓값으로 나눈 상대 규모의 가중합입니다 (기본 가중치 1).
+        파레토 집합은 비용이 더 낮으면서 연간 발전량이 같거나 많은 조합이 없는 구성입니다.
+
+        Args:
+            location (str): 위치명
+            grids (dict, optional): 설계 변수 → 값 목록 (지정하지 않은 변수는 현재 사이트 설정값)
+            year (int, optional): 연도 (실제 달력 일수 및 시간, 기본값: 올해 - 한국 시간 기준)
+            avg_wind_speed (float): 연평균 기준 풍속 (m/s, 월별 계절 계수 적용)
+            cost_weights (dict, optional): 설계 변수 → 비용 가중치
+
+        Returns:
+            dict: 격자 정보, 연간 수요, 파레토 집합(비용 오름차순), 수요 충족 최소 비용 구성
+        """
+        if year is None:
+            year = datetime.now(ZoneInfo("Asia/Seoul")).year
+        calculator = self.power_calculator
+        registry = calculator.site_registry
+        site = registry.index_of(location)
+        grids = dict(grids or {})
+        cost_weights = dict(cost_weights or {})
+
+        unknown = [name for name in list(grids) + list(cost_weights) if name not in DESIGN_PARAMETERS]
+        if unknown:
+            raise ValueError(f"지원되지 않는 설계 변수: {unknown}. 지원되는 변수: {list(DESIGN_PARAMETERS)}")
+
+        values = {}
+        for name in DESIGN_PARAMETERS:
+            grid = np.unique(np.asarray(grids.get(name, [registry.arrays[name][site]]), dtype=float))
+            if grid.size == 0 or np.any(grid < 0) or np.any(~np.isfinite(grid)):
+                raise ValueError(f"{name} 격자는 0 이상의 값을 하나 이상 포함해야 합니다.")
+            values[name] = grid
+
+        shape = tuple(len(values[name]) for name in DESIGN_PARAMETERS)
+        num_configs = int(np.prod(shape))
+        if num_configs > MAX_SWEEP_CONFIGS:
+            raise ValueError(f"조합 수가 너무 많습니다: {num_configs} (최대 {MAX_SWEEP_CONFIGS})")
+
+        # 축별 브로드캐스트: (count, area, efficiency, tiles_count)
+        count = values['count'][:, np.newaxis, np.newaxis, np.newaxis]
+        area = values['area'][np.newaxis, :, np.newaxis, np.newaxis]
+        efficiency = values['efficiency'][np.newaxis, np.newaxis, :, np.newaxis]
+        tiles_count = values['tiles_count'][np.newaxis, np.newaxis, np.newaxis, :]
+
+        profile = self._annual_profile(location, year, avg_wind_speed)
+        turbine_wh = self.turbine_energy(location, area * efficiency, year, avg_wind_speed)
+        wind_wh = np.broadcast_to(turbine_wh * count * calculator.ac_dc_efficiency, shape)
+        total_wh = wind_wh + profile['piezo_wh']
+
+        demand_wh = calculator.led_streetlight_power * registry.arrays['streetlight_count'][site] * profile['streetlight_hours']
+        balance_wh = total_wh - demand_wh
+
+        cost = np.zeros(shape)
+        for name, axis_values in (('count', count), ('area', area), ('efficiency', efficiency), ('tiles_count', tiles_count)):
+            scale = values[name].max()
+            if scale > 0:
+                cost = cost + cost_weights.get(name, 1.0) * axis_values / scale
+
+        # 파레토 집합: 비용 오름차순(같으면 발전량 내림차순)으로 정렬 후 발전량 누적 최댓값을 넘는 구성
+        flat_cost = cost.ravel()
+        flat_total = total_wh.ravel()
+        order = np.lexsort((-flat_total, flat_cost))
+        sorted_total = flat_total[order]
+        previous_best = np.concatenate(([-np.inf], np.maximum.accumulate(sorted_total)[:-1]))
+        pareto = order[sorted_total > previous_best]
+
+        # 수요 충족 최소 비용 구성 (비용이 같으면 발전량이 많은 구성)
+        covering = order[balance_wh.ravel()[order] >= 0]
+        min_covering = int(covering[0]) if covering.size else None
+
+        def config(flat_index):
+            index = np.unravel_index(flat_index, shape)
+            return {
+                **{name: float(values[name][index[axis]]) for axis, name in enumerate(DESIGN_PARAMETERS)},
+                'annual_wind_power_kwh': float(round_like_python(wind_wh[index] / 1000, 3)),
+                'annual_total_power_kwh': float(round_like_python(total_wh[index] / 1000, 3)),
+                'power_balance_kwh': float(round_like_python(balance_wh[index] / 1000, 3)),
+                'sufficiency_percentage': float(round_like_python(total_wh[index] / max(0.1, demand_wh) * 100, 1)),
+                'is_sufficient': bool(balance_wh[index] >= 0),
+                'cost': float(round_like_python(cost[index], 4))
+            }
+
+        return {
+            'location': location,
+            'year': year,
+            'days': profile['days'],
+            'avg_wind_speed': avg_wind_speed,
+            'grids': {name: values[name].tolist() for name in DESIGN_PARAMETERS},
+            'cost_weights': {name: cost_weights.get(name, 1.0) for name in DESIGN_PARAMETERS},
+            'num_configs': num_configs,
+            'annual_piezo_power_kwh': round(profile['piezo_wh'] / 1000, 3),
+            'annual_streetlight_consumption_kwh': round(demand_wh / 1000, 3),
+            'sufficient_configs': int(covering.size),
+            'min_covering_config': config(min_covering) if min_covering is not None else None,
+            'pareto_configs': [config(i) for i in pareto.tolist()]
+        }
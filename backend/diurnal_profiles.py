@@ -0,0 +1,95 @@
+"""
+시간대별 변동 프로파일 모듈 - 풍속/유동 인구의 하루 변동 계수를 한 곳에서 관리
+- 24시간 계수 배열(풍속, 인원 수)을 모듈 상수로 정의
+- 사이트별 시간대 인원 수 표 (사이트 수 x 24)를 등록부에서 한 번 생성하여 조회
+- 요일별 표 (7 x 24)는 현재 모든 요일이 같은 프로파일
+"""
+import numpy as np
+
+# 시간대별 풍속 변동 계수 (0-6시: -20%, 6-12시: 기준, 12-18시: +20%, 18-24시: 기준)
+HOURLY_WIND_FACTORS = np.array([0.8] * 6 + [1.0] * 6 + [1.2] * 6 + [1.0] * 6)
+
+# 시간대별 인원 수 변동 계수
+# - weekly: 심야(0-6) 0.1, 출근(6-9) 1.5, 오전(9-12) 1.2, 점심(12-14) 1.8, 오후(14-18) 1.2, 저녁(18-21) 0.8, 야간(21-24) 0.3
+#   (주간/월간/연간 예측, 역산, 전체 위치 예측)
+# - daily: 출근(6-9) 1.2, 오전(9-12) 1.5 (나머지는 weekly와 동일) (일일 예측 API, 실시간 예측)
+HOURLY_PEOPLE_FACTORS = {
+    'weekly': np.array([0.1] * 6 + [1.5] * 3 + [1.2] * 3 + [1.8] * 2 + [1.2] * 4 + [0.8] * 3 + [0.3] * 3),
+    'daily': np.array([0.1] * 6 + [1.2] * 3 + [1.5] * 3 + [1.8] * 2 + [1.2] * 4 + [0.8] * 3 + [0.3] * 3)
+}
+
+
+class DiurnalProfiles:
+    """
+    사이트별 시간대 인원 수 표
+
+    Attributes:
+        site_registry (SiteRegistry): 사이트 등록부
+        people_tables (dict): 프로파일 이름 → 사이트별 시간대 인원 수 (사이트 수 x 24, 정수 내림)
+    """
+
+    def __init__(self, site_registry):
+        self.site_registry = site_registry
+        avg_hourly_people = site_registry.arrays['avg_hourly_people'][:, np.newaxis]
+        self.people_tables = {
+            name: np.floor(avg_hourly_people * factors).astype(np.int64)
+            for name, factors in HOURLY_PEOPLE_FACTORS.items()
+        }
+
+    @staticmethod
+    def wind_speeds(avg_wind_speed):
+        """
+        평균 풍속 → 시간별 풍속 (24개 요소 배열)
+
+        Args:
+            avg_wind_speed (float | array-like): 평균 풍속 (배열이면 (..., 24) 반환)
+
+        Returns:
+            np.ndarray: 시간별 풍속 (m/s)
+        """
+        return np.asarray(avg_wind_speed, dtype=float)[..., np.newaxis] * HOURLY_WIND_FACTORS
+
+    def _profile_table(self, profile):
+        if profile not in self.people_tables:
+            raise ValueError(f"지원되지 않는 인원 수 프로파일: {profile}. 지원되는 프로파일: {list(self.people_tables)}")
+        return self.people_tables[profile]
+
+    def people_counts(self, location, profile='weekly'):
+        """
+        위치별 시간대 인원 수 (24개 요소 정수 배열)
+
+        Args:
+            location (str): 위치명
+            profile (str): 인원 수 프로파일 (weekly, daily)
+
+        Returns:
+            np.ndarray: 시간별 인원 수
+        """
+        return self._profile_table(profile)[self.site_registry.index_of(location)]
+
+    def people_count(self, location, hour, profile='daily'):
+        """
+        위치별 특정 시각의 인원 수
+
+        Args:
+            location (str): 위치명
+            hour (int): 시각 (0-23)
+            profile (str): 인원 수 프로파일 (weekly, daily)
+
+        Returns:
+            int: 인원 수
+        """
+        return int(self._profile_table(profile)[self.site_registry.index_of(location), hour % 24])
+
+    def weekday_people_counts(self, location, profile='weekly'):
+        """
+        위치별 요일 x 시간대 인원 수 (7 x 24, 월요일 시작)
+
+        Args:
+            location (str): 위치명
+            profile (str): 인원 수 프로파일 (weekly, daily)
+
+        Returns:
+            np.ndarray: 요일별 시간별 인원 수
+        """
+        return np.broadcast_to(self.people_counts(location, profile), (7, 24))
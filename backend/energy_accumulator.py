@@ -0,0 +1,182 @@
+"""
+실시간 발전량 누적 모듈
+- 위치별 실시간 발전 출력(W) 샘플을 시각과 함께 받아 사다리꼴 적분으로 누적 (샘플당 O(1))
+- 오늘/이번 주(월요일 시작)/이번 달 누적량을 한국 시간(Asia/Seoul) 자정 기준으로 초기화
+- 상태 조회는 저장된 합계만 반환 (재계산 없음)
+"""
+import os
+import threading
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+# 누적 기간 단위
+ACCUMULATION_PERIODS = ('today', 'week', 'month')
+
+# 누적 발전량 항목
+ENERGY_COMPONENTS = ('wind_power_wh', 'piezo_power_wh', 'total_power_wh')
+
+KOREA_TIMEZONE = ZoneInfo("Asia/Seoul")
+
+
+def _period_keys(local_time):
+    """한국 시간 기준 기간 키 (오늘 날짜, 주 시작일(월요일), 월 시작일)"""
+    day = local_time.date()
+    return {
+        'today': day,
+        'week': day - timedelta(days=day.weekday()),
+        'month': day.replace(day=1)
+    }
+
+
+class RealtimeEnergyAccumulator:
+    """
+    위치별 실시간 발전량 누적기
+
+    연속된 두 샘플 사이 구간은 출력을 선형으로 보고 적분하며, 자정을 지나는 구간은 자정에서 나누어
+    각 날짜에 배분합니다. 샘플 간격이 max_gap보다 길면 (데이터 공백) 해당 구간은 적분하지 않습니다.
+
+    Attributes:
+        max_gap (timedelta): 적분하는 최대 샘플 간격
+    """
+
+    def __init__(self, max_gap_minutes=None):
+        if max_gap_minutes is None:
+            max_gap_minutes = float(os.getenv("REALTIME_MAX_GAP_MINUTES", "90"))
+        self.max_gap = timedelta(minutes=max_gap_minutes)
+        self._sites = {}
+        self._lock = threading.Lock()
+
+    def _new_site_state(self, local_time):
+        keys = _period_keys(local_time)
+        return {
+            'last_time': None,
+            'last_power': None,
+            'sample_count': 0,
+            'periods': {
+                period: {'start': keys[period], 'energy': dict.fromkeys(ENERGY_COMPONENTS, 0.0)}
+                for period in ACCUMULATION_PERIODS
+            }
+        }
+
+    def _roll_periods(self, state, local_time):
+        """기간이 바뀐 누적값 초기화"""
+        keys = _period_keys(local_time)
+        for period in ACCUMULATION_PERIODS:
+            if state['periods'][period]['start'] != keys[period]:
+                state['periods'][period] = {'start': keys[period], 'energy': dict.fromkeys(ENERGY_COMPONENTS, 0.0)}
+
+    def _add_segment(self, state, start, end, start_power, end_power):
+        """같은 날짜 안의 구간 [start, end] 적분 (사다리꼴)"""
+        self._roll_periods(state, start)
+        hours = (end - start).total_seconds() / 3600
+        for component in ENERGY_COMPONENTS:
+            energy = (start_power[component] + end_power[component]) / 2 * hours
+            for period in ACCUMULATION_PERIODS:
+                state['periods'][period]['energy'][component] += energy
+
+    def ingest(self, location, timestamp, wind_power_w, piezo_power_w):
+        """
+        실시간 출력 샘플 누적
+
+        Args:
+            location (str): 위치명
+            timestamp (datetime): 샘플 시각 (시간대 정보가 없으면 한국 시간으로 간주)
+            wind_power_w (float): 풍력 발전 출력 (W, 1시간 발전량 Wh와 같은 값)
+            piezo_power_w (float): 지압 발전 출력 (W)
+
+        Returns:
+            bool: 직전 샘플과의 구간을 적분했는지 여부
+        """
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=KOREA_TIMEZONE)
+        local_time = timestamp.astimezone(KOREA_TIMEZONE)
+        power = {
+            'wind_power_wh': float(wind_power_w),
+            'piezo_power_wh': float(piezo_power_w),
+            'total_power_wh': float(wind_power_w) + float(piezo_power_w)
+        }
+
+        with self._lock:
+            state = self._sites.get(location)
+            if state is None:
+                state = self._sites[location] = self._new_site_state(local_time)
+
+            last_time = state['last_time']
+            integrated = False
+            if last_time is not None and local_time < last_time:
+                # 이전 시각의 샘플은 무시
+                return False
+
+            if last_time is not None and local_time - last_time <= self.max_gap:
+                # 자정을 지나면 자정 시점의 출력을 선형 보간하여 구간 분할
+                total_seconds = (local_time - last_time).total_seconds()
+                segment_start, segment_power = last_time, state['last_power']
+                while segment_start < local_time:
+                    next_midnight = datetime.combine(
+                        segment_start.date() + timedelta(days=1), datetime.min.time(), KOREA_TIMEZONE
+                    )
+                    segment_end = min(next_midnight, local_time)
+                    fraction = (segment_end - last_time).total_seconds() / total_seconds
+                    end_power = {
+                        component: state['last_power'][component] + (power[component] - state['last_power'][component]) * fraction
+                        for component in ENERGY_COMPONENTS
+                    }
+                    self._add_segment(state, segment_start, segment_end, segment_power, end_power)
+                    segment_start, segment_power = segment_end, end_power
+                integrated = True
+
+            self._roll_periods(state, local_time)
+            state['last_time'] = local_time
+            state['last_power'] = power
+            state['sample_count'] += 1
+            return integrated
+
+    def state(self, location, now=None):
+        """
+        위치별 누적 상태 (현재 시각 기준으로 지난 기간은 0으로 표시)
+
+        Args:
+            location (str): 위치명
+            now (datetime, optional): 기준 시각 (기본값: 현재 한국 시간)
+
+        Returns:
+            dict: 기간별 누적 발전량 (Wh/kWh), 마지막 샘플 시각과 출력
+        """
+        now = (now or datetime.now(KOREA_TIMEZONE)).astimezone(KOREA_TIMEZONE)
+        keys = _period_keys(now)
+
+        with self._lock:
+            state = self._sites.get(location)
+            result = {
+                'location': location,
+                'timezone': 'Asia/Seoul',
+                'as_of': now.isoformat(),
+                'sample_count': state['sample_count'] if state else 0,
+                'last_sample_time': state['last_time'].isoformat() if state and state['last_time'] else None,
+                'last_power_w': {
+                    component.replace('_wh', '_w'): round(value, 2) for component, value in state['last_power'].items()
+                } if state and state['last_power'] else None
+            }
+            for period in ACCUMULATION_PERIODS:
+                stored = state['periods'][period] if state else None
+                energy = stored['energy'] if stored and stored['start'] == keys[period] else dict.fromkeys(ENERGY_COMPONENTS, 0.0)
+                result[period] = {
+                    'start_date': str(keys[period]),
+                    **{component: round(value, 2) for component, value in energy.items()},
+                    'total_power_kwh': round(energy['total_power_wh'] / 1000, 3)
+                }
+
+        return result
+
+    def reset(self, location=None):
+        """
+        누적 상태 초기화
+
+        Args:
+            location (str, optional): 위치명 (기본값: 전체 위치)
+        """
+        with self._lock:
+            if location is None:
+                self._sites.clear()
+            else:
+                self._sites.pop(location, None)
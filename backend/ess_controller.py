@@ -533,7 +533,7 @@ class ESSController:
                 'power_production': power_production
             }
 
-    def simulate_day_cycle(self, daily_power_data, start_hour=6, end_hour=18):
+    def simulate_day_cycle(self, daily_power_data, start_hour=6, end_hour=18, step_power_data=None):
         """
         하루 충방전 사이클 시뮬레이션
         
@@ -541,6 +541,8 @@ class ESSController:
             daily_power_data (list): 시간별 발전량 데이터 (24개 요소)
             start_hour (int): 주간 시작 시간
             end_hour (int): 주간 종료 시간
+            step_power_data (list, optional): 시간 내 단위 발전량 데이터 (24 x 시간당 단위 수 요소,
+                예: 10분 단위 144개). 지정하면 시간별 발전량을 균등 분할하는 대신 사용
             
         Returns:
             dict: 시뮬레이션 결과
@@ -548,23 +550,33 @@ class ESSController:
         if len(daily_power_data) != 24:
             return {'error': '시간별 발전량 데이터는 24개 요소를 가진 목록이어야 합니다.'}
         
+        if step_power_data is None:
+            # 10분 단위로 제어 (6회/시간, 시간별 발전량 균등 분할)
+            steps_per_hour = 6
+            step_power_data = [power / 6 for power in daily_power_data for _ in range(steps_per_hour)]
+        else:
+            steps_per_hour = len(step_power_data) // 24
+            if steps_per_hour == 0 or len(step_power_data) != 24 * steps_per_hour or 60 % steps_per_hour != 0:
+                return {'error': '시간 내 단위 발전량 데이터는 24 x (60의 약수) 개 요소를 가진 목록이어야 합니다.'}
+        step_minutes = 60 // steps_per_hour
+        
         simulation_results = []
         
         # 24시간 시뮬레이션
         for hour in range(24):
             is_nighttime = hour < start_hour or hour >= end_hour
-            power_production = daily_power_data[hour]
             
-            # 10분 단위로 제어 (6회/시간)
-            for minute in range(0, 60, 10):
-                result = self.automatic_control(power_production / 6, is_nighttime)
+            # 단위 시간별 제어
+            for step in range(steps_per_hour):
+                power_production = step_power_data[hour * steps_per_hour + step]
+                result = self.automatic_control(power_production, is_nighttime)
                 
                 # 결과 기록
                 simulation_results.append({
                     'hour': hour,
-                    'minute': minute,
+                    'minute': step * step_minutes,
                     'is_nighttime': is_nighttime,
-                    'power_production': power_production / 6,  # 10분 동안의 생산량
+                    'power_production': power_production,  # 단위 시간 동안의 생산량
                     'state': result.get('state'),
                     'soc': result.get('soc', round(self.current_soc * 100, 1)),
                     'voltage': result.get('voltage', self.current_voltage)
@@ -18,6 +18,7 @@ from ess_controller import ESSController
 from power_calculation import PowerCalculator
 from time_series_analysis import TimeSeriesAnalyzer
 from zoneinfo import ZoneInfo
+from compute_pool import compute_pools
 
 # 라우터 생성
 router = APIRouter(prefix="/api/ess", tags=["ess"])
@@ -84,8 +85,9 @@ class SimulationRequest(BaseModel):
     location: str
     date: str  # YYYYMMDD 형식
     avg_wind_speed: float = 3.5
-    start_hour: int = 6
-    end_hour: int = 18
+    start_hour: Optional[int] = None  # 주간 시작 시간 (기본값: 해당 날짜 일출 시각)
+    end_hour: Optional[int] = None  # 주간 종료 시간 (기본값: 해당 날짜 일몰 시각)
+    resolution_minutes: Optional[int] = None  # 지정 시 시간 내 단위 발전량 계산 (예: 10, 1)
 
 class ESSSimulationResponse(BaseModel):
     location: str
@@ -197,23 +199,25 @@ async def simulate_daily_ess_operation(request: SimulationRequest):
         if request.location not in SUPPORTED_LOCATIONS:
             raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {request.location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
         
-        if request.start_hour >= request.end_hour:
+        # 주간 시간 (지정하지 않으면 해당 날짜의 일출/일몰 시각을 반올림한 시간)
+        start_hour, end_hour = request.start_hour, request.end_hour
+        if start_hour is None or end_hour is None:
+            try:
+                simulation_date = np.datetime64(datetime.strptime(request.date, "%Y%m%d").date(), 'D')
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"날짜 형식이 올바르지 않습니다 (YYYYMMDD): {request.date}")
+            if start_hour is None:
+                start_hour = int(round(float(power_calculator.solar_schedule.sunrise_hours(simulation_date))))
+            if end_hour is None:
+                end_hour = int(round(float(power_calculator.solar_schedule.sunset_hours(simulation_date))))
+        
+        if start_hour >= end_hour:
             raise HTTPException(status_code=400, detail="주간 시작 시간은 종료 시간보다 작아야 합니다.")
         
         # 일별 전력 예측
         try:
             # 일별 발전량 계산을 위한 시간별 풍속 생성
-            hourly_wind_speeds = []
-            for hour in range(24):
-                # 시간에 따른 풍속 변동 모델 (0-6시: -20%, 6-12시: 기준, 12-18시: +20%, 18-24시: 기준)
-                if 0 <= hour < 6:
-                    hourly_wind_speeds.append(request.avg_wind_speed * 0.8)
-                elif 6 <= hour < 12:
-                    hourly_wind_speeds.append(request.avg_wind_speed)
-                elif 12 <= hour < 18:
-                    hourly_wind_speeds.append(request.avg_wind_speed * 1.2)
-                else:
-                    hourly_wind_speeds.append(request.avg_wind_speed)
+            hourly_wind_speeds = power_calculator.diurnal_profiles.wind_speeds(request.avg_wind_speed)
             
             # 전력 예측
             daily_power = power_calculator.predict_daily_power(request.location, hourly_wind_speeds)
@@ -225,29 +229,51 @@ async def simulate_daily_ess_operation(request: SimulationRequest):
         # 시간별 발전량 추출
         hourly_power_data = [result['total_power_wh'] for result in daily_power['hourly_results']]
         
-        # ESS 상태 초기화 (테스트용)
-        ess_controller.current_soc = 0.3  # 30% 충전 상태로 시작
-        ess_controller.current_voltage = ess_controller.calculate_ocv(ess_controller.current_soc)
-        ess_controller.system_state = "IDLE"
+        # 시간 내 단위 발전량 (정시 풍속 사이 선형 보간 후 단위 시간별 계산)
+        step_power_data = None
+        if request.resolution_minutes is not None:
+            try:
+                step_series = power_calculator.predict_subhourly_series(
+                    request.location, hourly_wind_speeds, request.resolution_minutes
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            step_power_data = step_series['total_power_wh'].tolist()
+            hourly_power_data = step_series['total_power_wh'].reshape(24, -1).sum(axis=1).tolist()
         
-        # 시뮬레이션 실행
-        simulation_result = ess_controller.simulate_day_cycle(
-            hourly_power_data, 
-            start_hour=request.start_hour, 
-            end_hour=request.end_hour
-        )
+        def run_simulation():
+            # 시뮬레이션 전용 컨트롤러 (실시간/충방전 엔드포인트의 공유 컨트롤러 상태를 변경하지 않음)
+            simulation_controller = ESSController()
+            
+            # ESS 상태 초기화 (테스트용)
+            simulation_controller.current_soc = 0.3  # 30% 충전 상태로 시작
+            simulation_controller.current_voltage = simulation_controller.calculate_ocv(simulation_controller.current_soc)
+            simulation_controller.system_state = "IDLE"
+            
+            # 시뮬레이션 실행
+            simulation_result = simulation_controller.simulate_day_cycle(
+                hourly_power_data, 
+                start_hour=start_hour, 
+                end_hour=end_hour,
+                step_power_data=step_power_data
+            )
+            
+            # 방전 전력 계산 (이번 시뮬레이션의 총 방전량)
+            total_discharge_power = 0
+            for cycle in simulation_controller.discharge_history:
+                if 'initial_soc' in cycle and 'final_soc' in cycle:
+                    soc_change = cycle['initial_soc'] - cycle['final_soc']
+                    discharge_power = soc_change * simulation_controller.cell_capacity * simulation_controller.cells_in_parallel / 1000 * 3.7  # Wh (대략적 계산)
+                    total_discharge_power += discharge_power
+            
+            return simulation_result, total_discharge_power
+        
+        # 시뮬레이션 실행 (계산 풀에서 실행)
+        simulation_result, total_discharge_power = await compute_pools.run('ess_simulate', run_simulation)
         
         # 결과 변환
         total_power_production = sum(hourly_power_data)
         
-        # 방전 전력 계산 (총 방전량)
-        total_discharge_power = 0
-        for cycle in ess_controller.discharge_history:
-            if 'initial_soc' in cycle and 'final_soc' in cycle:
-                soc_change = cycle['initial_soc'] - cycle['final_soc']
-                discharge_power = soc_change * ess_controller.cell_capacity * ess_controller.cells_in_parallel / 1000 * 3.7  # Wh (대략적 계산)
-                total_discharge_power += discharge_power
-        
         response = ESSSimulationResponse(
             location=request.location,
             date=request.date,
@@ -300,11 +326,8 @@ async def get_realtime_ess_operation(location: str = Path(..., description="위
             from power_router import predict_realtime_power
             power_data = await predict_realtime_power(location)
             
-            # 현재 시간
-            current_hour = datetime.now().hour
-            
-            # 주간/야간 판단 (6시~18시: 주간, 그 외: 야간)
-            is_nighttime = current_hour < 6 or current_hour >= 18
+            # 주간/야간 판단 (일출 ~ 일몰: 주간, 그 외: 야간)
+            is_nighttime = power_calculator.solar_schedule.is_night()
             
             # 자동 ESS 제어
             ess_control_result = ess_controller.automatic_control(
@@ -356,7 +379,7 @@ async def get_realtime_ess_operation(location: str = Path(..., description="위
             return {
                 'location': location,
                 'current_time': datetime.now().isoformat(),
-                'is_nighttime': datetime.now().hour < 6 or datetime.now().hour >= 18,
+                'is_nighttime': power_calculator.solar_schedule.is_night(),
                 'battery_status': ess_controller.get_battery_status(),
                 'error': str(e)
             }
@@ -384,29 +407,31 @@ async def get_daily_ess_schedule(
         
         # 날짜 설정 (기본값: 오늘)
         if not date:
-            date = datetime.now().strftime("%Y%m%d")
+            date = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y%m%d")
+        try:
+            schedule_date = np.datetime64(datetime.strptime(date, "%Y%m%d").date(), 'D')
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"날짜 형식이 올바르지 않습니다 (YYYYMMDD): {date}")
+        
+        # 일출/일몰 기준 시간별 가로등 점등 비율 (점등 시간 = 비율 합)
+        solar_schedule = power_calculator.solar_schedule
+        night_fraction = solar_schedule.night_fractions(np.arange(24) + schedule_date.astype('datetime64[h]'))
+        night_hours = float(night_fraction.sum())
+        sunrise = solar_schedule.format_hours(solar_schedule.sunrise_hours(schedule_date))
+        sunset = solar_schedule.format_hours(solar_schedule.sunset_hours(schedule_date))
         
         # 시간별 풍속 생성
-        hourly_wind_speeds = []
-        for hour in range(24):
-            # 시간에 따른 풍속 변동 모델 (0-6시: -20%, 6-12시: 기준, 12-18시: +20%, 18-24시: 기준)
-            if 0 <= hour < 6:
-                hourly_wind_speeds.append(avg_wind_speed * 0.8)
-            elif 6 <= hour < 12:
-                hourly_wind_speeds.append(avg_wind_speed)
-            elif 12 <= hour < 18:
-                hourly_wind_speeds.append(avg_wind_speed * 1.2)
-            else:
-                hourly_wind_speeds.append(avg_wind_speed)
+        hourly_wind_speeds = power_calculator.diurnal_profiles.wind_speeds(avg_wind_speed)
         
-        # 일간 전력 예측
-        daily_power = power_calculator.predict_daily_power(location, hourly_wind_speeds)
+        # 일간 전력 예측 (계산 풀에서 실행)
+        daily_power = await compute_pools.run('ess_schedule', power_calculator.predict_daily_power, location, hourly_wind_speeds)
         
         # 시간별 전력 생산 및 소비 계획
         hourly_plan = []
         
-        # 총 가로등 소비 전력
-        total_streetlight_consumption = daily_power['streetlight_consumption_wh']
+        # 총 가로등 소비 전력 (일몰 ~ 일출 점등 시간 기준)
+        streetlight_power = power_calculator.led_streetlight_power * power_calculator.streetlight_count.get(location, 0)
+        total_streetlight_consumption = round(streetlight_power * night_hours, 2)
         daily_required_battery_capacity = total_streetlight_consumption 
         
         # 표준 충전 시간 (8시 ~ 16시)
@@ -420,12 +445,9 @@ async def get_daily_ess_schedule(
             if charge_start_hour <= hour < charge_end_hour:
                 charge_period_production += result['total_power_wh']
         
-        # 표준 방전 시간 (18시 ~ 6시)
-        discharge_start_hour = 18
-        discharge_end_hour = 6  # 다음날
-        
-        # 방전 필요 시간 계산
-        discharge_hours = (24 - discharge_start_hour) + discharge_end_hour
+        # 방전 시간 (일몰 ~ 다음날 일출, 점등 비율이 있는 시간)
+        discharge_start_hour = int(solar_schedule.sunset_hours(schedule_date))
+        discharge_end_hour = int(np.ceil(solar_schedule.sunrise_hours(schedule_date)))  # 다음날
         
         # 시간별 계획 생성
         for result in daily_power['hourly_results']:
@@ -435,7 +457,7 @@ async def get_daily_ess_schedule(
             plan = {
                 'hour': hour,
                 'power_production': result['total_power_wh'],
-                'power_consumption': total_streetlight_consumption / 12 if (hour >= 18 or hour < 6) else 0,
+                'power_consumption': round(streetlight_power * float(night_fraction[hour]), 2),
                 'ess_mode': 'IDLE',
                 'ess_power': 0
             }
@@ -454,11 +476,11 @@ async def get_daily_ess_schedule(
                     plan['charge_c_rate'] = 0.1  # 기본 0.1C
                 
             # 방전 시간
-            elif hour >= discharge_start_hour or hour < discharge_end_hour:
+            elif night_fraction[hour] > 0:
                 plan['ess_mode'] = 'DISCHARGING'
                 
-                # 필요 방전량 계산
-                required_discharge = daily_required_battery_capacity / discharge_hours
+                # 필요 방전량 계산 (해당 시간의 점등 비율만큼)
+                required_discharge = daily_required_battery_capacity * float(night_fraction[hour]) / night_hours
                 
                 # 생산량이 임계값을 초과하는지 확인
                 if result['total_power_wh'] > ess_controller.threshold_power / 24:
@@ -479,6 +501,9 @@ async def get_daily_ess_schedule(
             'required_battery_capacity_wh': daily_required_battery_capacity,
             'charging_period': f"{charge_start_hour}시 ~ {charge_end_hour}시",
             'discharging_period': f"{discharge_start_hour}시 ~ {discharge_end_hour}시 (다음날)",
+            'sunrise': sunrise,
+            'sunset': sunset,
+            'streetlight_hours': round(night_hours, 2),
             'max_charging_capacity_wh': charging_capacity,
             'charge_discharge_balance': charging_capacity - daily_required_battery_capacity,
             'is_sufficient': charging_capacity >= daily_required_battery_capacity
@@ -0,0 +1,117 @@
+"""
+머신러닝 추론 마이크로 배치 모듈
+- 동시에 들어온 단건 추론 요청을 짧은 시간(기본 5ms) 또는 최대 행 수까지 모아 한 번의 predict로 계산
+- 모은 특성 행렬의 결과를 요청별로 나누어 대기 중인 호출자에게 전달
+- sklearn 모델은 호출당 고정 비용(트리 순회 준비, 입력 검증 등)이 커서 행을 모을수록 처리량이 증가
+"""
+import os
+import asyncio
+import weakref
+import numpy as np
+
+# 배치 수집 시간 (밀리초) 및 최대 행 수
+ML_BATCH_WINDOW_MS = float(os.getenv("ML_BATCH_WINDOW_MS", "5"))
+ML_BATCH_MAX_ROWS = int(os.getenv("ML_BATCH_MAX_ROWS", "256"))
+
+
+class _PendingBatch:
+    """이벤트 루프별 수집 중인 요청 (특성 행, Future) 목록"""
+
+    def __init__(self):
+        self.rows = []
+        self.futures = []
+        self.timer = None
+
+
+class InferenceBatcher:
+    """
+    단건 추론 요청 마이크로 배처
+
+    predict_fn은 (행 수, 특성 수) 행렬을 받아 행별 결과 배열(또는 배열 튜플)을 반환해야 하며,
+    각 호출자는 자신의 행에 해당하는 결과(튜플이면 항목별 값의 튜플)를 받습니다.
+
+    Attributes:
+        predict_fn (callable): 배치 추론 함수
+        window (float): 첫 요청 이후 수집 시간 (초)
+        max_rows (int): 한 번에 추론하는 최대 행 수 (도달 시 즉시 추론)
+        executor_run (callable, optional): 추론 실행 코루틴 함수 (fn, *args) (기본값: 이벤트 루프 기본 스레드 풀)
+    """
+
+    def __init__(self, predict_fn, window_ms=None, max_rows=None, executor_run=None):
+        self.predict_fn = predict_fn
+        self.executor_run = executor_run
+        self.window = (ML_BATCH_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_rows = max(1, ML_BATCH_MAX_ROWS if max_rows is None else max_rows)
+        self._pending = weakref.WeakKeyDictionary()
+        self._tasks = set()
+        self.stats = {'requests': 0, 'batches': 0, 'max_batch_rows': 0}
+
+    async def predict(self, features):
+        """
+        특성 행 하나를 배치에 추가하고 결과 대기
+
+        Args:
+            features (array-like): 특성 벡터 (1차원)
+
+        Returns:
+            결과 값 (predict_fn이 튜플을 반환하면 항목별 값의 튜플)
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = _PendingBatch()
+
+        future = loop.create_future()
+        batch.rows.append(features)
+        batch.futures.append(future)
+        self.stats['requests'] += 1
+
+        # 추론은 별도 작업에서 실행 (배치를 채운 호출자가 취소되어도 다른 호출자의 결과는 전달됨)
+        if len(batch.rows) >= self.max_rows:
+            self._flush(loop)
+        elif batch.timer is None:
+            batch.timer = loop.call_later(self.window, self._flush, loop)
+
+        return await future
+
+    def _flush(self, loop):
+        """수집된 요청을 꺼내 추론 작업 시작 (작업 참조는 완료 시까지 보관)"""
+        batch = self._pending.pop(loop, None)
+        if batch is None or not batch.rows:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = loop.create_task(self._predict_batch(loop, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _predict_batch(self, loop, batch):
+        """배치 한 번에 추론하고 결과 분배 (실패/취소 시 남은 호출자에게 예외/취소 전달)"""
+        self.stats['batches'] += 1
+        self.stats['max_batch_rows'] = max(self.stats['max_batch_rows'], len(batch.rows))
+
+        try:
+            # 추론 중에도 다음 배치를 수집할 수 있도록 스레드에서 실행
+            matrix = np.asarray(batch.rows, dtype=float)
+            if self.executor_run is not None:
+                outputs = await self.executor_run(self.predict_fn, matrix)
+            else:
+                outputs = await loop.run_in_executor(None, self.predict_fn, matrix)
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for future in batch.futures:
+                future.cancel()
+            raise
+
+        for i, future in enumerate(batch.futures):
+            if future.done():
+                continue
+            if isinstance(outputs, tuple):
+                future.set_result(tuple(output[i] for output in outputs))
+            else:
+                future.set_result(outputs[i])
@@ -0,0 +1,168 @@
+"""
+구체화 뷰(materialized view) 모듈 - 자주 조회되는 기본 응답을 미리 계산하여 직렬화된 본문으로 보관
+- 앱 시작 시 작업 스레드에서 등록된 뷰를 모두 계산
+- 버전(사이트 설정 등)이 바뀌면 작업 스레드에서 다시 계산 (주기 확인 + 조회 시 버전 불일치 감지)
+- 조회는 보관된 JSON 바이트를 그대로 반환 (계산/직렬화 없음), 버전이 다른 뷰는 반환하지 않아 호출자가 직접 계산
+- 뷰별 계산 시간, 계산 시각, 버전, 경과 시간, 최신 여부를 상태 API로 제공
+"""
+import os
+import time
+import threading
+import traceback
+from datetime import datetime
+
+# 구체화 뷰 사용 여부
+MATERIALIZED_VIEWS_ENABLED = os.getenv("MATERIALIZED_VIEWS", "1") == "1"
+
+# 버전 변경 확인 주기 (초)
+MATERIALIZED_CHECK_SECONDS = float(os.getenv("MATERIALIZED_CHECK_SECONDS", "5"))
+
+
+class MaterializedView:
+    """
+    계산된 뷰 하나
+
+    Attributes:
+        body (bytes): 직렬화된 응답 본문 (JSON)
+        version: 계산 시점의 버전
+        built_at (str): 계산 완료 시각 (ISO 형식)
+        build_seconds (float): 계산 소요 시간 (초)
+    """
+
+    def __init__(self, body, version, build_seconds):
+        self.body = body
+        self.version = version
+        self.built_at = datetime.now().isoformat()
+        self.build_seconds = build_seconds
+        self._built_monotonic = time.monotonic()
+
+    @property
+    def age_seconds(self):
+        return time.monotonic() - self._built_monotonic
+
+
+class MaterializedViews:
+    """
+    구체화 뷰 등록부 및 백그라운드 계산 작업
+
+    Attributes:
+        version_fn (callable): 현재 버전 반환 함수 (뷰 결과가 의존하는 설정 등)
+        builders (dict): 뷰 이름 → 계산 함수 (인자 없이 호출, 직렬화된 본문 bytes 반환)
+        check_seconds (float): 버전 변경 확인 주기 (초)
+    """
+
+    def __init__(self, version_fn, check_seconds=None):
+        self.version_fn = version_fn
+        self.check_seconds = MATERIALIZED_CHECK_SECONDS if check_seconds is None else check_seconds
+        self.builders = {}
+        self._views = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def register(self, name, builder):
+        """
+        뷰 계산 함수 등록 (등록 순서대로 계산)
+
+        Args:
+            name (str): 뷰 이름
+            builder (callable): 직렬화된 응답 본문(bytes)을 반환하는 함수
+        """
+        with self._lock:
+            self.builders[name] = builder
+
+    def start(self):
+        """
+        계산 작업 스레드 시작 (이미 시작했거나 비활성화되어 있으면 아무 작업도 하지 않음)
+
+        Returns:
+            bool: 이번 호출로 작업을 시작했는지 여부
+        """
+        with self._lock:
+            if self._thread is not None or not MATERIALIZED_VIEWS_ENABLED:
+                return False
+            self._thread = threading.Thread(target=self._run, name="materialized-views", daemon=True)
+            self._thread.start()
+            return True
+
+    def _run(self):
+        while True:
+            self.refresh_stale()
+            self._wakeup.wait(self.check_seconds)
+            self._wakeup.clear()
+
+    def refresh_stale(self):
+        """
+        현재 버전과 다른(또는 아직 없는) 뷰 다시 계산
+
+        Returns:
+            int: 다시 계산한 뷰 수
+        """
+        refreshed = 0
+        for name, builder in list(self.builders.items()):
+            version = self.version_fn()
+            view = self._views.get(name)
+            if view is not None and view.version == version:
+                continue
+            self._build(name, builder, version)
+            refreshed += 1
+        return refreshed
+
+    def _build(self, name, builder, version):
+        """뷰 하나 계산 (실패 시 오류 메시지 기록, 기존 뷰는 유지)"""
+        started = time.perf_counter()
+        try:
+            body = builder()
+        except Exception as e:
+            print(f"구체화 뷰 계산 오류 ({name}): {e}")
+            traceback.print_exc()
+            with self._lock:
+                self._errors[name] = str(e)
+            return
+        view = MaterializedView(body, version, time.perf_counter() - started)
+        with self._lock:
+            self._views[name] = view
+            self._errors.pop(name, None)
+        print(f"구체화 뷰 계산 완료: {name} ({view.build_seconds:.2f}초)")
+
+    def get(self, name):
+        """
+        최신 뷰 본문 조회 (대기하지 않음, 버전이 다르면 백그라운드 재계산 요청)
+
+        Args:
+            name (str): 뷰 이름
+
+        Returns:
+            bytes: 직렬화된 응답 본문 또는 None (없음/이전 버전)
+        """
+        view = self._views.get(name)
+        if view is None or view.version != self.version_fn():
+            if self._thread is not None:
+                self._wakeup.set()
+            return None
+        return view.body
+
+    def status(self):
+        """
+        뷰별 상태
+
+        Returns:
+            dict: enabled, version, 뷰 이름 → (state, built_at, build_seconds, age_seconds, version, stale, bytes, error)
+        """
+        version = self.version_fn()
+        views = {}
+        for name in self.builders:
+            view = self._views.get(name)
+            info = {'state': 'pending' if view is None else ('ready' if view.version == version else 'stale'), 'error': self._errors.get(name)}
+            if view is not None:
+                info.update(
+                    built_at=view.built_at,
+                    build_seconds=round(view.build_seconds, 3),
+                    age_seconds=round(view.age_seconds, 1),
+                    version=view.version,
+                    stale=view.version != version,
+                    bytes=len(view.body)
+                )
+            views[name] = info
+        return {'enabled': MATERIALIZED_VIEWS_ENABLED, 'version': version, 'views': views}
@@ -0,0 +1,260 @@
+"""
+머신러닝 발전량 모델 격자 대리(surrogate) 모듈
+- 위치별로 (풍속, 기온, 습도, 시간, 인원 수) 격자에서 ML 모델을 미리 계산하여 표로 보관
+- 트리 모델은 분기 임계값 사이에서 값이 일정하므로, 임계값이 주어진 축은 기본 격자 대신 [최솟값, 임계값 t, t 바로 오른쪽, 최댓값]만 사용
+  (축 범위는 기본 격자 범위와 모든 임계값을 포함하도록 넓힘, t < x < t + 간격 구간을 제외하면 보간 값이 모델 값과 같음 / 임계값이 없는 축은 점 하나)
+- 격자 점 t의 값은 t 바로 왼쪽에서 계산 (x <= t 분기 값, float32 변환 시 반올림으로 오른쪽 분기로 가는 것을 방지)
+- 조회는 5차원 다중 선형 보간 (격자 밖 입력은 경계값으로 제한)
+- 격자 범위 안의 무작위 입력에서 실제 모델과 비교한 최대/평균 오차를 측정하여 함께 제공
+"""
+import numpy as np
+
+# 격자 축 (특성 벡터 순서와 동일, 위치 인코딩 제외)
+SURROGATE_AXES = ('wind_speed', 'temperature', 'humidity', 'hour', 'people_count')
+
+# 기본 격자 (인원 수 축은 위치별 평균 인원 수 기준으로 생성)
+DEFAULT_GRIDS = {
+    'wind_speed': np.arange(0.0, 15.0 + 1e-9, 0.5),
+    'temperature': np.arange(-10.0, 35.0 + 1e-9, 5.0),
+    'humidity': np.array([30.0, 60.0, 90.0]),
+    'hour': np.arange(24.0)
+}
+
+# 인원 수 축: 0 ~ 평균 인원 수 x 배수, 점 개수
+PEOPLE_GRID_MULTIPLIER = 2.0
+PEOPLE_GRID_POINTS = 9
+
+# 축별 분기 임계값 최대 개수 (넘으면 해당 축은 기본 격자 사용)
+MAX_AXIS_BREAKPOINTS = 64
+
+# 임계값 양쪽 격자 점 간격 (상대값, float32 해상도보다 크게)
+BREAKPOINT_OFFSET = 1e-5
+
+# 출력 항목 (predict_fn 반환 순서)
+SURROGATE_OUTPUTS = ('wind_power_wh', 'piezo_power_wh')
+
+
+class GridSurrogate:
+    """
+    위치별 격자 대리 모델
+
+    Attributes:
+        predict_fn (callable): (행 수, 8) 특성 행렬 → (풍력 발전량 배열, 지압 발전량 배열)
+        location_encodings (dict): 위치명 → 위치 인코딩 (특성 벡터 뒤 3개 값)
+        axes (dict): 위치명 → 축별 격자 값 목록
+        samples (dict): 위치명 → 축별 모델 계산 입력 값 목록 (axes와 같은 크기, 임계값 점은 바로 왼쪽 값)
+        tables (dict): 위치명 → 격자 값 배열 (축 크기..., 출력 수)
+        breakpoints (dict): 축 이름 → 분기 임계값 (트리 모델은 임계값 t 이하/초과에서 값이 바뀜, 빈 배열 = 값이 바뀌지 않음)
+        errors (dict): 측정 오차 (measure_error 결과)
+    """
+
+    def __init__(self, predict_fn, location_encodings, avg_people=None, grids=None, breakpoints=None, chunk_rows=20000):
+        self.predict_fn = predict_fn
+        self.location_encodings = dict(location_encodings)
+        self.chunk_rows = chunk_rows
+        self.axes = {}
+        self.samples = {}
+        self.tables = {}
+        self.errors = None
+
+        self.breakpoints = {
+            name: np.unique(np.asarray(values, dtype=float))
+            for name, values in (breakpoints or {}).items()
+            if name in SURROGATE_AXES and np.unique(values).size <= MAX_AXIS_BREAKPOINTS
+        }
+
+        grids = {**DEFAULT_GRIDS, **(grids or {})}
+        for location in self.location_encodings:
+            people_axis = grids.get('people_count')
+            if people_axis is None:
+                people_max = PEOPLE_GRID_MULTIPLIER * float((avg_people or {}).get(location, 1000))
+                people_axis = np.linspace(0.0, people_max, PEOPLE_GRID_POINTS)
+            axes = [
+                self._with_breakpoints(name, np.asarray(grids[name] if name != 'people_count' else people_axis, dtype=float))
+                for name in SURROGATE_AXES
+            ]
+            self.axes[location] = [axis for axis, _ in axes]
+            self.samples[location] = [sample for _, sample in axes]
+
+    def _with_breakpoints(self, name, axis):
+        """
+        임계값이 주어진 축 → 양 끝과 임계값 t, t 바로 오른쪽 값 (임계값이 없으면 최솟값 하나)
+
+        축 범위는 모든 임계값의 양쪽 점을 포함하도록 넓힘 (범위 밖 입력은 마지막 분기 바깥이므로 경계값 제한이 모델과 같음)
+
+        Returns:
+            tuple: (격자 값, 모델 계산 입력 값)
+        """
+        thresholds = self.breakpoints.get(name)
+        if thresholds is None or axis.size == 0:
+            axis = np.unique(axis)
+            return axis, axis
+        if thresholds.size == 0:
+            return np.array([axis.min()]), np.array([axis.min()])
+        offset = np.maximum(np.abs(thresholds), 1.0) * BREAKPOINT_OFFSET
+        left, right = thresholds - offset, thresholds + offset
+        low, high = min(axis.min(), left.min()), max(axis.max(), right.max())
+        grid = np.concatenate([[low], np.column_stack([thresholds, right]).ravel(), [high]])
+        sample = np.concatenate([[low], np.column_stack([left, right]).ravel(), [high]])
+        # 중복 제거 (오른쪽 값이 최댓값과 같은 경우)
+        _, keep = np.unique(grid, return_index=True)
+        return grid[keep], sample[keep]
+
+    def _features(self, location, points):
+        """(행 수, 5) 격자 축 값 → (행 수, 8) 모델 특성 행렬"""
+        encoding = np.broadcast_to(np.asarray(self.location_encodings[location], dtype=float), (len(points), 3))
+        return np.hstack([points, encoding])
+
+    def _model_values(self, location, points):
+        """실제 모델 예측 (행을 나누어 계산) → (행 수, 출력 수)"""
+        outputs = []
+        for start in range(0, len(points), self.chunk_rows):
+            chunk = self._features(location, points[start:start + self.chunk_rows])
+            outputs.append(np.column_stack(self.predict_fn(chunk)))
+        return np.vstack(outputs) if outputs else np.empty((0, len(SURROGATE_OUTPUTS)))
+
+    def build(self):
+        """
+        위치별 격자 계산
+
+        Returns:
+            GridSurrogate: self
+        """
+        for location, axes in self.samples.items():
+            mesh = np.meshgrid(*axes, indexing='ij')
+            points = np.column_stack([axis_values.ravel() for axis_values in mesh])
+            values = self._model_values(location, points)
+            self.tables[location] = values.reshape(tuple(len(axis) for axis in axes) + (len(SURROGATE_OUTPUTS),))
+        return self
+
+    def interpolate(self, location, points):
+        """
+        다중 선형 보간 (격자 밖 입력은 축 경계로 제한)
+
+        Args:
+            location (str): 위치명
+            points (array-like): (행 수, 5) 입력 (SURROGATE_AXES 순서)
+
+        Returns:
+            np.ndarray: (행 수, 출력 수) 보간 값
+        """
+        if location not in self.tables:
+            raise ValueError(f"대리 모델이 없는 위치: {location}")
+
+        points = np.array(points, dtype=float, ndmin=2)
+        table = self.tables[location]
+        lower, upper, weights = [], [], []
+        for d, axis in enumerate(self.axes[location]):
+            x = np.clip(points[:, d], axis[0], axis[-1])
+            if len(axis) == 1:
+                index = np.zeros(len(x), dtype=np.intp)
+                lower.append(index)
+                upper.append(index)
+                weights.append(np.zeros(len(x)))
+                continue
+            index = np.clip(np.searchsorted(axis, x, side='right') - 1, 0, len(axis) - 2)
+            lower.append(index)
+            upper.append(index + 1)
+            weights.append((x - axis[index]) / (axis[index + 1] - axis[index]))
+
+        # 2^5개 꼭짓점 가중합
+        result = np.zeros((len(points), table.shape[-1]))
+        num_axes = len(lower)
+        for corner in range(1 << num_axes):
+            index = []
+            weight = np.ones(len(points))
+            for d in range(num_axes):
+                if corner >> d & 1:
+                    index.append(upper[d])
+                    weight = weight * weights[d]
+                else:
+                    index.append(lower[d])
+                    weight = weight * (1 - weights[d])
+            result += weight[:, np.newaxis] * table[tuple(index)]
+        return result
+
+    def predict(self, location, wind_speed, temperature, humidity, hour, people_count):
+        """
+        단건 예측 (꼭짓점 2^5개 블록을 잘라 축마다 선형 보간으로 줄임)
+
+        Returns:
+            tuple: (풍력 발전량, 지압 발전량) (Wh)
+        """
+        if location not in self.tables:
+            raise ValueError(f"대리 모델이 없는 위치: {location}")
+
+        block = self.tables[location]
+        slices, weights = [], []
+        for axis, value in zip(self.axes[location], (wind_speed, temperature, humidity, hour, people_count)):
+            x = min(max(float(value), axis[0]), axis[-1])
+            if len(axis) == 1:
+                slices.append(slice(0, 1))
+                weights.append(0.0)
+                continue
+            index = min(max(int(np.searchsorted(axis, x, side='right')) - 1, 0), len(axis) - 2)
+            slices.append(slice(index, index + 2))
+            weights.append((x - axis[index]) / (axis[index + 1] - axis[index]))
+
+        block = block[tuple(slices)]
+        for weight in weights:
+            # 첫 축 보간 후 제거 (길이 1 축은 그대로 선택)
+            block = block[0] * (1 - weight) + block[-1] * weight
+        return float(block[0]), float(block[1])
+
+    def measure_error(self, num_samples=2000, seed=0):
+        """
+        격자 범위 안 무작위 입력(시간은 정수)에서 실제 모델 대비 오차 측정
+
+        Args:
+            num_samples (int): 위치별 표본 수
+            seed (int): 난수 시드
+
+        Returns:
+            dict: 위치별/전체 출력별 최대·평균 절대 오차 (Wh)
+        """
+        rng = np.random.default_rng(seed)
+        by_location = {}
+        all_errors = []
+        for location, axes in self.axes.items():
+            points = np.column_stack([rng.uniform(axis[0], axis[-1], num_samples) for axis in axes])
+            points[:, SURROGATE_AXES.index('hour')] = np.round(points[:, SURROGATE_AXES.index('hour')])
+            errors = np.abs(self.interpolate(location, points) - self._model_values(location, points))
+            all_errors.append(errors)
+            by_location[location] = {
+                output: {'max_abs_error_wh': float(errors[:, k].max()), 'mean_abs_error_wh': float(errors[:, k].mean())}
+                for k, output in enumerate(SURROGATE_OUTPUTS)
+            }
+
+        stacked = np.vstack(all_errors)
+        self.errors = {
+            'samples_per_location': num_samples,
+            'overall': {
+                output: {'max_abs_error_wh': float(stacked[:, k].max()), 'mean_abs_error_wh': float(stacked[:, k].mean())}
+                for k, output in enumerate(SURROGATE_OUTPUTS)
+            },
+            'locations': by_location
+        }
+        return self.errors
+
+    def summary(self):
+        """
+        격자 정보 및 측정 오차
+
+        Returns:
+            dict: 축별 범위/점 개수, 위치별 격자 크기, 측정 오차
+        """
+        return {
+            'axes': list(SURROGATE_AXES),
+            'breakpoints': {name: values.tolist() for name, values in self.breakpoints.items()},
+            'locations': {
+                location: {
+                    'grid': {
+                        name: {'min': float(axis[0]), 'max': float(axis[-1]), 'points': len(axis)}
+                        for name, axis in zip(SURROGATE_AXES, axes)
+                    },
+                    'grid_points': int(np.prod([len(axis) for axis in axes]))
+                }
+                for location, axes in self.axes.items()
+            },
+            'errors': self.errors
+        }
@@ -0,0 +1,127 @@
+"""
+모델 준비(warm-up) 모듈
+- 앱 시작 시 등록된 모델의 로드/학습을 작업 스레드 하나에서 한 번만 수행 (이벤트 루프 차단 방지)
+- 모델별 상태(pending → loading → ready / failed)와 소요 시간을 준비 상태 API로 제공
+- 준비되지 않은 모델 조회는 기다리지 않고 None을 반환하여 호출자가 기본 계산식으로 대체
+"""
+import threading
+import time
+import traceback
+from datetime import datetime
+
+# 모델 준비 상태
+MODEL_STATES = ('pending', 'loading', 'ready', 'failed')
+
+
+class ModelWarmup:
+    """
+    모델 로더 등록부 및 백그라운드 준비 작업
+
+    Attributes:
+        loaders (dict): 모델 이름 → 로더 함수 (인자 없이 호출, 모델 객체 반환)
+    """
+
+    def __init__(self):
+        self.loaders = {}
+        self._models = {}
+        self._status = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def register(self, name, loader):
+        """
+        모델 로더 등록 (등록 순서대로 준비)
+
+        Args:
+            name (str): 모델 이름
+            loader (callable): 모델 로드/학습 함수
+        """
+        with self._lock:
+            self.loaders[name] = loader
+            self._status[name] = {'state': 'pending', 'started_at': None, 'finished_at': None, 'elapsed_seconds': None, 'error': None}
+
+    def start(self):
+        """
+        준비 작업 스레드 시작 (이미 시작했으면 아무 작업도 하지 않음)
+
+        Returns:
+            bool: 이번 호출로 작업을 시작했는지 여부
+        """
+        with self._lock:
+            if self._thread is not None:
+                return False
+            self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+            self._thread.start()
+            return True
+
+    def _run(self):
+        for name, loader in list(self.loaders.items()):
+            self._load(name, loader)
+
+    def _load(self, name, loader):
+        """모델 하나 로드 (실패 시 failed 상태와 오류 메시지 기록)"""
+        status = self._status[name]
+        status.update(state='loading', started_at=datetime.now().isoformat())
+        started = time.perf_counter()
+        try:
+            model = loader()
+            with self._lock:
+                self._models[name] = model
+            status['state'] = 'ready'
+            print(f"모델 준비 완료: {name} ({time.perf_counter() - started:.2f}초)")
+        except Exception as e:
+            print(f"모델 준비 오류 ({name}): {e}")
+            traceback.print_exc()
+            status.update(state='failed', error=str(e))
+        status.update(finished_at=datetime.now().isoformat(), elapsed_seconds=round(time.perf_counter() - started, 3))
+
+    def get(self, name):
+        """
+        준비된 모델 조회 (준비 작업이 시작되지 않았으면 시작, 대기하지 않음)
+
+        Args:
+            name (str): 모델 이름
+
+        Returns:
+            준비된 모델 객체 또는 None (준비 중/실패)
+        """
+        if self._thread is None:
+            self.start()
+        return self._models.get(name)
+
+    def is_ready(self, name=None):
+        """
+        준비 완료 여부
+
+        Args:
+            name (str, optional): 모델 이름 (기본값: 등록된 전체 모델)
+
+        Returns:
+            bool: 준비 완료 여부
+        """
+        names = [name] if name is not None else list(self._status)
+        return all(self._status.get(n, {}).get('state') == 'ready' for n in names)
+
+    def wait(self, timeout=None):
+        """
+        준비 작업 종료 대기 (스크립트/테스트용)
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초)
+
+        Returns:
+            bool: 작업이 종료되었는지 여부
+        """
+        if self._thread is None:
+            self.start()
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def status(self):
+        """
+        모델별 준비 상태
+
+        Returns:
+            dict: 모델 이름 → 상태 정보 (state, started_at, finished_at, elapsed_seconds, error)
+        """
+        return {name: dict(status) for name, status in self._status.items()}
@@ -0,0 +1,254 @@
+"""
+과거 발전량 역산(backcast) 모듈
+- 기상 관측 CSV(일별 풍속/기온)를 한 번 로드하여 시간별로 확장
+- 전체 사이트를 배치 커널로 한 번에 계산하고 사이트별 일별 발전량을 캐시
+- 기간(날짜 범위) 및 집계 단위(일/주/월/연)로 조회
+"""
+import os
+import threading
+import numpy as np
+import pandas as pd
+from power_series import round_like_python
+
+# 조회 집계 단위
+BACKCAST_RESOLUTIONS = ('day', 'week', 'month', 'year')
+
+
+class PowerBackcaster:
+    """
+    관측 기상 데이터 기반 사이트별 과거 발전량 계산기
+
+    Attributes:
+        power_calculator (PowerCalculator): 발전량 계산기 (사이트 등록부 포함)
+        data_dir (str): 기상 데이터 디렉토리 (wind_data.csv, temp_data.csv)
+    """
+
+    def __init__(self, power_calculator, data_dir=None):
+        self.power_calculator = power_calculator
+        self.data_dir = data_dir or os.getenv("DATA_DIR", "data")
+        self._cache = None
+        self._cache_key = None
+        self._build_lock = threading.Lock()
+
+    def _file_paths(self):
+        return {
+            'wind': os.path.join(self.data_dir, 'wind_data.csv'),
+            'temp': os.path.join(self.data_dir, 'temp_data.csv')
+        }
+
+    def _load_observations(self):
+        """
+        일별 관측 데이터 로드 (날짜 오름차순, 풍속 결측은 선형 보간, 기온 결측은 NaN = 기온 보정 없음)
+
+        Returns:
+            pd.DataFrame: Date, AvgWindSpeed_mps, AvgTemp_C, MinTemp_C, MaxTemp_C 열
+        """
+        file_paths = self._file_paths()
+        if not os.path.exists(file_paths['wind']):
+            raise FileNotFoundError(f"풍속 데이터 파일을 찾을 수 없습니다: {file_paths['wind']}")
+
+        wind_df = pd.read_csv(file_paths['wind'], encoding='utf-8')
+        wind_df['Date'] = pd.to_datetime(wind_df['Date'].astype(str), errors='coerce')
+        df = wind_df.dropna(subset=['Date'])[['Date', 'AvgWindSpeed_mps']]
+
+        temp_columns = ['AvgTemp_C', 'MinTemp_C', 'MaxTemp_C']
+        if os.path.exists(file_paths['temp']):
+            temp_df = pd.read_csv(file_paths['temp'], encoding='utf-8')
+            temp_df['Date'] = pd.to_datetime(temp_df['Date'].astype(str), errors='coerce')
+            available = [column for column in temp_columns if column in temp_df.columns]
+            df = df.merge(temp_df.dropna(subset=['Date'])[['Date'] + available], on='Date', how='left')
+        for column in temp_columns:
+            if column not in df.columns:
+                df[column] = np.nan
+
+        df = df.drop_duplicates(subset='Date').sort_values('Date').reset_index(drop=True)
+        df['AvgWindSpeed_mps'] = pd.to_numeric(df['AvgWindSpeed_mps'], errors='coerce').interpolate(limit_direction='both').fillna(0.0)
+        return df
+
+    def _cache_state(self):
+        """캐시 유효성 키 (사이트 등록부 + 설정 버전 + 데이터 파일 수정 시각)"""
+        mtimes = tuple(
+            os.path.getmtime(path) if os.path.exists(path) else None
+            for path in self._file_paths().values()
+        )
+        return id(self.power_calculator.site_registry), self.power_calculator.settings_version, mtimes
+
+    def build(self, force=False):
+        """
+        전체 사이트 일별 발전량 계산 및 캐시 (사이트 등록부/설정이나 데이터 파일이 바뀌면 다시 계산)
+
+        Args:
+            force (bool): 캐시 무시 여부
+
+        Returns:
+            dict: 캐시 (dates, daily_wind_wh, daily_piezo_wh, locations 등)
+        """
+        # 계산 풀의 여러 스레드가 동시에 조회해도 한 번만 계산
+        with self._build_lock:
+            cache_key = self._cache_state()
+            if not force and self._cache is not None and self._cache_key == cache_key:
+                return self._cache
+            return self._build(cache_key)
+
+    def _build(self, cache_key):
+        """build 본체 (잠금 안에서 호출)"""
+        calculator = self.power_calculator
+        registry = calculator.site_registry
+        df = self._load_observations()
+
+        # 일별 평균 풍속 → 시간별 풍속 (일수, 24)
+        daily_wind_speeds = df['AvgWindSpeed_mps'].to_numpy(dtype=float)
+        hourly_wind_speeds = calculator._weekly_wind_grid(daily_wind_speeds)
+        current_temps = df['AvgTemp_C'].to_numpy(dtype=float)[:, np.newaxis]
+        min_temps = df['MinTemp_C'].to_numpy(dtype=float)[:, np.newaxis]
+        max_temps = df['MaxTemp_C'].to_numpy(dtype=float)[:, np.newaxis]
+
+        # 시간별 인원 수 변동 모델 (사이트, 24) → 일별 지압 발전량은 날짜와 무관
+        num_sites = len(registry)
+        site_idx = np.arange(num_sites)
+        hourly_people = calculator.diurnal_profiles.people_tables['weekly'].astype(float)
+        daily_piezo = calculator.calculate_piezo_power_batch(site_idx[:, np.newaxis], hourly_people, 1).sum(axis=1)
+
+        # 사이트를 나누어 (사이트, 일수, 24) 배열로 계산 (한 번에 약 400만 요소)
+        num_days = len(df)
+        chunk_size = max(1, (1 << 22) // max(1, num_days * 24))
+        daily_wind = np.empty((num_sites, num_days))
+        for start in range(0, num_sites, chunk_size):
+            stop = min(start + chunk_size, num_sites)
+            wind_power = calculator.calculate_wind_power_batch(
+                site_idx[start:stop, np.newaxis, np.newaxis], hourly_wind_speeds, 1,
+                current_temps, min_temps, max_temps
+            )
+            daily_wind[start:stop] = wind_power.sum(axis=-1)
+
+        dates = df['Date'].to_numpy(dtype='datetime64[D]')
+        self._cache = {
+            'dates': dates,
+            'locations': list(registry.names),
+            'daily_wind_wh': daily_wind,
+            'daily_piezo_wh': np.broadcast_to(daily_piezo[:, np.newaxis], (num_sites, num_days)),
+            'daily_wind_speed': daily_wind_speeds,
+            'daily_night_hours': calculator.solar_schedule.night_hours(dates)
+        }
+        self._cache_key = cache_key
+        print(f"발전량 역산 완료: {num_sites}개 사이트 x {num_days}일")
+        return self._cache
+
+    def monthly_wind_histograms(self, bin_width=0.25):
+        """
+        관측 일평균 풍속의 월별 히스토그램 (PowerCalculator.predict_expected_energy의 경험 분포)
+
+        Args:
+            bin_width (float): 풍속 구간 폭 (m/s)
+
+        Returns:
+            list: 월별 (구간 경계, 빈도) 12개
+        """
+        cache = self.build()
+        wind_speeds = cache['daily_wind_speed']
+        months = cache['dates'].astype('datetime64[M]').astype(int) % 12
+
+        edges = np.arange(0.0, wind_speeds.max() + 2 * bin_width, bin_width)
+        histograms = []
+        for month in range(12):
+            counts, _ = np.histogram(wind_speeds[months == month], bins=edges)
+            if not counts.any():
+                raise ValueError(f"{month + 1}월 관측 데이터가 없습니다.")
+            histograms.append((edges, counts))
+        return histograms
+
+    def date_range(self):
+        """
+        관측 데이터 기간
+
+        Returns:
+            tuple: (시작일, 종료일) 문자열
+        """
+        dates = self.build()['dates']
+        return (str(dates[0]), str(dates[-1])) if len(dates) else (None, None)
+
+    def query(self, start_date=None, end_date=None, locations=None, resolution='day'):
+        """
+        기간별 사이트 발전량 조회
+
+        Args:
+            start_date (str, optional): 시작일 (YYYY-MM-DD, 포함)
+            end_date (str, optional): 종료일 (YYYY-MM-DD, 포함)
+            locations (list, optional): 위치 목록 (기본값: 전체 사이트)
+            resolution (str): 집계 단위 (day, week, month, year)
+
+        Returns:
+            dict: 기간 라벨(periods)과 사이트별 발전량 열 배열 및 기간 합계
+        """
+        if resolution not in BACKCAST_RESOLUTIONS:
+            raise ValueError(f"지원되지 않는 집계 단위: {resolution}. 지원되는 단위: {list(BACKCAST_RESOLUTIONS)}")
+
+        cache = self.build()
+        calculator = self.power_calculator
+        dates = cache['dates']
+
+        start = np.searchsorted(dates, np.datetime64(start_date, 'D')) if start_date else 0
+        stop = np.searchsorted(dates, np.datetime64(end_date, 'D'), side='right') if end_date else len(dates)
+        if start >= stop:
+            raise ValueError(f"해당 기간의 관측 데이터가 없습니다: {start_date} ~ {end_date}")
+        dates = dates[start:stop]
+
+        if locations is None:
+            site_idx = np.arange(len(cache['locations']))
+        else:
+            site_idx = calculator._site_indices(list(locations)).ravel()
+
+        wind = cache['daily_wind_wh'][site_idx, start:stop]
+        piezo = cache['daily_piezo_wh'][site_idx, start:stop]
+
+        # 집계 단위별 그룹 (날짜가 정렬되어 있으므로 연속 구간 합산)
+        if resolution == 'day':
+            labels = dates.astype(str).tolist()
+            group_starts = np.arange(len(dates))
+        else:
+            if resolution == 'week':
+                # 월요일 시작 주 (1970-01-01은 목요일)
+                keys = dates - ((dates.astype(int) + 3) % 7).astype('timedelta64[D]')
+            elif resolution == 'month':
+                keys = dates.astype('datetime64[M]')
+            else:
+                keys = dates.astype('datetime64[Y]')
+            group_starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            labels = keys[group_starts].astype(str).tolist()
+            wind = np.add.reduceat(wind, group_starts, axis=1)
+            piezo = np.add.reduceat(piezo, group_starts, axis=1)
+        group_days = np.diff(np.r_[group_starts, len(dates)])
+
+        # 가로등 소비 전력 (날짜별 일몰 ~ 일출 점등 시간)
+        night_hours = cache['daily_night_hours'][start:stop]
+        group_night_hours = np.add.reduceat(night_hours, group_starts)
+        streetlight_power = calculator.led_streetlight_power * calculator.site_registry.arrays['streetlight_count'][site_idx]
+        streetlight = streetlight_power[:, np.newaxis] * group_night_hours
+        total = wind + piezo
+
+        sites = []
+        for i, site in enumerate(site_idx.tolist()):
+            location = cache['locations'][site]
+            sites.append({
+                'location': location,
+                'wind_power_wh': round_like_python(wind[i], 2).tolist(),
+                'piezo_power_wh': round_like_python(piezo[i], 2).tolist(),
+                'total_power_wh': round_like_python(total[i], 2).tolist(),
+                'streetlight_consumption_wh': round_like_python(streetlight[i], 2).tolist(),
+                'power_balance_wh': round_like_python(total[i] - streetlight[i], 2).tolist(),
+                'summary': calculator._horizon_result(
+                    'period', location, wind[i].sum(), piezo[i].sum(), len(dates), streetlight_hours=night_hours.sum()
+                )
+            })
+
+        return {
+            'start_date': str(dates[0]),
+            'end_date': str(dates[-1]),
+            'days': len(dates),
+            'resolution': resolution,
+            'periods': labels,
+            'period_days': group_days.tolist(),
+            'streetlight_hours': round_like_python(group_night_hours, 2).tolist(),
+            'avg_wind_speed': round_like_python(np.add.reduceat(cache['daily_wind_speed'][start:stop], group_starts) / group_days, 2).tolist(),
+            'sites': sites
+        }
@@ -4,12 +4,50 @@
 위치별 풍속 특성(건물 사이 통로 효과 등)을 고려합니다.
 """
 import math
+import os
 import numpy as np
 from datetime import datetime, timedelta
+from power_series import HourlyPowerSeries, round_like_python
+from site_registry import SiteRegistry
+from power_curve import PowerCurveTable
+from diurnal_profiles import DiurnalProfiles, HOURLY_WIND_FACTORS, HOURLY_PEOPLE_FACTORS
+from solar_schedule import SolarSchedule
+
+
+def sequential_sum(values, axis=-1):
+    """
+    파이썬 루프 누적(+=)과 같은 순서로 합산 (np.sum의 pairwise 합산과 결과가 다를 수 있음)
+
+    Args:
+        values (array-like): 합산할 값
+        axis (int): 합산 축
+
+    Returns:
+        np.ndarray: 합계
+    """
+    return np.cumsum(values, axis=axis).take(-1, axis=axis)
+
+
+# 기간별 예측 결과의 상세 수준 (뒤로 갈수록 하위 결과 포함)
+DETAIL_LEVELS = ('summary', 'month', 'week', 'day', 'hour')
+
+# 시간별 스트리밍 블록 단위 (iter_hourly_blocks)
+STREAM_BLOCKS = ('day', 'week', 'month', 'year')
+
+# 시간 내 단위 계산 간격 (분, 60의 약수)
+SUBHOURLY_STEPS = (1, 2, 5, 10, 15, 20, 30, 60)
+
+# 불확실성 분석용 풍속 분포 (weibull: shape = 형상 계수 k, lognormal: shape = 로그 표준편차)
+WIND_DISTRIBUTIONS = ('weibull', 'lognormal')
+
 
 class PowerCalculator:
-    def __init__(self):
-        # 풍력 발전기 설정
+    def __init__(self, site_registry=None):
+        """
+        Args:
+            site_registry (SiteRegistry, optional): 사이트 등록부 (기본값: DATA_DIR/sites.csv, 파일이 없으면 아래 기본 설정)
+        """
+        # 풍력 발전기 설정 (기본값 - 사이트 등록부 파일이 없을 때 사용)
         self.wind_turbine_settings = {
             '5호관_60주년_사이': {
                 'model': 'Lotus-V 1kW',
@@ -79,6 +117,16 @@ class PowerCalculator:
             '하이데거숲': 14
         }
         
+        # 설정 버전 (사이트 설정이 바뀔 때마다 증가 - 조회표/캐시 무효화용)
+        self.settings_version = 0
+        
+        # 사이트 등록부 (데이터 파일 우선, 없으면 위 기본 설정) - 설정 dict는 등록부 기준으로 다시 생성
+        if site_registry is None:
+            site_registry = SiteRegistry.load(fallback=lambda: SiteRegistry.from_settings(
+                self.wind_turbine_settings, self.piezo_tile_settings, self.streetlight_count
+            ))
+        self.set_site_registry(site_registry)
+        
         # 온도 영향 계수 (온도별 공기 밀도 변화로 인한 풍력 발전 효율 영향)
         self.temperature_factors = {
             'very_cold': 1.12,  # -10°C 이하 (매우 추운 날씨): 공기 밀도 높음 = 효율 증가
@@ -97,6 +145,43 @@ class PowerCalculator:
             'very_large': 1.15  # 15°C 이상: 효율 크게 증가
         }
 
+        # 배치 계산용 구간 경계 (calculate_wind_power의 if/elif 분기 경계와 동일)
+        self.temperature_bin_edges = np.array([-10.0, 0.0, 10.0, 20.0, 30.0])  # 현재 기온 (이하 기준)
+        self.temp_range_bin_edges = np.array([5.0, 10.0, 15.0])  # 일교차 (미만 기준)
+        self.temperature_bin_keys = ['very_cold', 'cold', 'cool', 'mild', 'warm', 'hot']
+        self.temp_range_bin_keys = ['small', 'medium', 'large', 'very_large']
+
+        # 시간대별 풍속 변동 계수 (diurnal_profiles 공용 프로파일)
+        self.hourly_wind_factors = HOURLY_WIND_FACTORS
+
+        # 계절에 따른 월별 풍속 변동 계수 (봄: 3-5월, 여름: 6-8월, 가을: 9-11월, 겨울: 12-2월)
+        self.monthly_wind_factors = [
+            1.2, 1.3,  # 1-2월: 겨울 (강한 풍속)
+            1.1, 1.0, 0.9,  # 3-5월: 봄 (중간 풍속)
+            0.7, 0.6, 0.7,  # 6-8월: 여름 (약한 풍속)
+            0.9, 1.0, 1.1,  # 9-11월: 가을 (중간 풍속)
+            1.2  # 12월: 겨울 (강한 풍속)
+        ]
+
+        # 시간대별 인원 수 변동 계수 (predict_weekly_power 기준, diurnal_profiles 공용 프로파일)
+        self.hourly_people_factors = HOURLY_PEOPLE_FACTORS['weekly']
+
+        # 연도별 달력 시간 배열 캐시 (calendar_hours)
+        self._calendar_cache = {}
+        
+        # 일출/일몰 시각표 (달력 기준 예측의 가로등 점등 시간, 기존 기간 예측은 12시간 고정)
+        self.solar_schedule = SolarSchedule()
+
+        # 풍력 출력 곡선 조회표 사용 여부 (선택, 기본값은 정확한 계산)
+        self.use_power_curve_table = os.getenv("POWER_CURVE_TABLE", "false").lower() in ("1", "true", "yes")
+        self.power_curve_speed_step = float(os.getenv("POWER_CURVE_SPEED_STEP", "0.05"))
+        self._power_curve_table = None
+        self._power_curve_table_key = None
+
+        # 기대 발전량 적분용 Gauss-Legendre 구적점/가중치 ([-1, 1] 구간, 미리 계산)
+        self.quadrature_nodes, self.quadrature_weights = np.polynomial.legendre.leggauss(16)  # 3제곱 구간 (분포 밀도 x 출력)
+        self.histogram_nodes, self.histogram_weights = np.polynomial.legendre.leggauss(4)  # 히스토그램 구간별 (균등 밀도)
+
     def calculate_wind_power(self, location, wind_speed, hours=1, temp_info=None):
         """
         풍력 발전량 계산 (기온 정보 활용 가능)
@@ -113,6 +198,10 @@ class PowerCalculator:
         """
         if location not in self.wind_turbine_settings:
             raise ValueError(f"지원되지 않는 위치: {location}")
+        
+        # 출력 곡선 조회표 사용 시 조회 + 선형 보간
+        if self.use_power_curve_table:
+            return float(self.calculate_wind_power_batch(location, wind_speed, hours, *self._temp_info_values(temp_info)))
             
         settings = self.wind_turbine_settings[location]
         
@@ -163,7 +252,9 @@ class PowerCalculator:
         
         # 풍력 에너지 계산식: P = 0.5 * ρ * A * v^3 * η * t * temp_factor * temp_range_factor
         # ρ: 공기 밀도, A: 단면적, v: 풍속, η: 효율, t: 시간
-        raw_power = 0.5 * air_density * settings['area'] * (adjusted_wind_speed ** 3) * settings['efficiency'] * temp_factor * temp_range_factor
+        # v^3은 곱셈으로 계산 (배치 계산과 부동소수점 결과 일치)
+        wind_speed_cubed = adjusted_wind_speed * adjusted_wind_speed * adjusted_wind_speed
+        raw_power = 0.5 * air_density * settings['area'] * wind_speed_cubed * settings['efficiency'] * temp_factor * temp_range_factor
         
         # 정격 출력 제한
         power = min(raw_power, settings['rated_power'])
@@ -271,8 +362,430 @@ class PowerCalculator:
             'temperature_info': temp_effect
         }
 
+    def set_site_registry(self, site_registry):
+        """
+        사이트 등록부 교체 (위치명 기반 설정 dict도 등록부 기준으로 갱신)
+
+        Args:
+            site_registry (SiteRegistry): 사이트 등록부
+        """
+        self.site_registry = site_registry
+        self.wind_turbine_settings, self.piezo_tile_settings, self.streetlight_count = site_registry.to_settings()
+        self.diurnal_profiles = DiurnalProfiles(site_registry)
+        self.settings_version += 1
+
+    def update_site_settings(self, location, **fields):
+        """
+        사이트 설정 변경 (등록부 배열과 위치명 기반 설정 dict를 함께 갱신)
+
+        Args:
+            location (str): 위치명
+            **fields: 변경할 수치 설정 항목 (예: rated_power=1500, count=3)
+        """
+        self.site_registry.update(location, **fields)
+        self.wind_turbine_settings, self.piezo_tile_settings, self.streetlight_count = self.site_registry.to_settings()
+        self.diurnal_profiles = DiurnalProfiles(self.site_registry)
+        self.settings_version += 1
+
+    def power_curve_table(self):
+        """
+        풍력 출력 곡선 조회표 (설정이나 영향 계수가 바뀐 경우에만 다시 생성)
+
+        Returns:
+            PowerCurveTable: 사이트별 출력 조회표
+        """
+        temp_factors = tuple(self.temperature_factors[k] for k in self.temperature_bin_keys)
+        range_factors = tuple(self.temp_range_factors[k] for k in self.temp_range_bin_keys)
+        table_key = (id(self.site_registry), self.settings_version, temp_factors, range_factors, self.power_curve_speed_step)
+
+        if self._power_curve_table is None or self._power_curve_table_key != table_key:
+            self._power_curve_table = PowerCurveTable(
+                self.site_registry.arrays, temp_factors, range_factors, speed_step=self.power_curve_speed_step
+            )
+            self._power_curve_table_key = table_key
+            print(f"풍력 출력 곡선 조회표 생성: {self._power_curve_table.table.shape}, "
+                  f"최대 오차 {float(np.max(self._power_curve_table.max_abs_error, initial=0.0)):.4f} W")
+
+        return self._power_curve_table
+
+    def _site_indices(self, locations):
+        """
+        위치명(또는 정수 인덱스) 배열을 사이트 등록부 인덱스 배열로 변환
+
+        Args:
+            locations (str | array-like): 위치명 또는 사이트 등록부 정수 인덱스
+
+        Returns:
+            np.ndarray: 정수 인덱스 배열
+        """
+        return self.site_registry.indices(locations)
+
+    def temperature_bins_batch(self, current_temps=None, min_temps=None, max_temps=None):
+        """
+        기온/일교차 구간 인덱스 배치 계산 (정보가 없으면 마지막 인덱스 = 계수 1.0)
+
+        Args:
+            current_temps (array-like, optional): 현재 기온 배열 (NaN = 정보 없음)
+            min_temps (array-like, optional): 최저 기온 배열 (NaN = 정보 없음)
+            max_temps (array-like, optional): 최고 기온 배열 (NaN = 정보 없음)
+
+        Returns:
+            tuple: (기온 구간 인덱스 배열, 일교차 구간 인덱스 배열)
+        """
+        no_temp = len(self.temperature_bin_keys)
+        no_range = len(self.temp_range_bin_keys)
+        if current_temps is None:
+            return np.int64(no_temp), np.int64(no_range)
+
+        current_temps = np.asarray(current_temps, dtype=float)
+
+        # side='left': t <= 경계 이면 해당 구간 (very_cold: t <= -10)
+        has_current = ~np.isnan(current_temps)
+        temp_bins = np.where(has_current, np.searchsorted(self.temperature_bin_edges, current_temps, side='left'), no_temp)
+
+        if min_temps is None or max_temps is None:
+            return temp_bins, np.full_like(temp_bins, no_range)
+
+        # side='right': r < 경계 이면 해당 구간 (small: r < 5)
+        temp_ranges = np.asarray(max_temps, dtype=float) - np.asarray(min_temps, dtype=float)
+        has_range = has_current & ~np.isnan(temp_ranges)
+        range_bins = np.where(has_range, np.searchsorted(self.temp_range_bin_edges, temp_ranges, side='right'), no_range)
+
+        return temp_bins, range_bins
+
+    def temperature_factors_batch(self, current_temps=None, min_temps=None, max_temps=None):
+        """
+        기온/일교차 영향 계수 배치 계산 (분기 없는 구간 조회)
+
+        Args:
+            current_temps (array-like, optional): 현재 기온 배열 (NaN = 정보 없음)
+            min_temps (array-like, optional): 최저 기온 배열 (NaN = 정보 없음)
+            max_temps (array-like, optional): 최고 기온 배열 (NaN = 정보 없음)
+
+        Returns:
+            tuple: (온도 영향 계수 배열, 일교차 영향 계수 배열)
+        """
+        if current_temps is None:
+            return np.float64(1.0), np.float64(1.0)
+
+        # 구간 계수 + '정보 없음'(마지막 인덱스) = 1.0
+        temp_factor_table = np.array([self.temperature_factors[k] for k in self.temperature_bin_keys] + [1.0])
+        range_factor_table = np.array([self.temp_range_factors[k] for k in self.temp_range_bin_keys] + [1.0])
+        temp_bins, range_bins = self.temperature_bins_batch(current_temps, min_temps, max_temps)
+
+        return temp_factor_table[temp_bins], range_factor_table[range_bins]
+
+    def calculate_wind_power_batch(self, locations, wind_speeds, hours=1, current_temps=None, min_temps=None, max_temps=None):
+        """
+        풍력 발전량 배치 계산 (calculate_wind_power와 동일한 결과)
+
+        Args:
+            locations (str | array-like): 위치명 또는 사이트 인덱스 배열
+            wind_speeds (array-like): 기상청 기준 풍속 배열 (m/s)
+            hours (float | array-like): 발전 시간 (시간 단위)
+            current_temps (array-like, optional): 현재 기온 배열 (NaN = 정보 없음)
+            min_temps (array-like, optional): 최저 기온 배열
+            max_temps (array-like, optional): 최고 기온 배열
+
+        Returns:
+            np.ndarray: 발전량 배열 (Wh)
+        """
+        site_idx = self._site_indices(locations)
+        params = self.site_registry.arrays
+        wind_speeds = np.asarray(wind_speeds, dtype=float)
+
+        adjusted_wind_speed = wind_speeds * params['wind_factor'][site_idx]
+
+        # 출력 곡선 조회표 사용 시 (보정 풍속, 기온 구간, 일교차 구간) 조회 + 선형 보간
+        if self.use_power_curve_table:
+            temp_bins, range_bins = self.temperature_bins_batch(current_temps, min_temps, max_temps)
+            power = self.power_curve_table().lookup(site_idx, adjusted_wind_speed, temp_bins, range_bins)
+            return power * params['count'][site_idx] * hours * self.ac_dc_efficiency
+
+        temp_factor, temp_range_factor = self.temperature_factors_batch(current_temps, min_temps, max_temps)
+
+        # 스칼라 계산과 동일한 연산 순서 유지 (부동소수점 결과 일치)
+        air_density = 1.225
+        wind_speed_cubed = adjusted_wind_speed * adjusted_wind_speed * adjusted_wind_speed
+        raw_power = 0.5 * air_density * params['area'][site_idx] * wind_speed_cubed * params['efficiency'][site_idx] * temp_factor * temp_range_factor
+        power = np.minimum(raw_power, params['rated_power'][site_idx])
+        energy = power * params['count'][site_idx] * hours * self.ac_dc_efficiency
+
+        # 시동 풍속 미만인 경우 발전량 없음
+        return np.where(adjusted_wind_speed < params['start_wind_speed'][site_idx], 0.0, energy)
+
+    def calculate_piezo_power_batch(self, locations, people_counts=None, hours=1):
+        """
+        지압 발전량 배치 계산 (calculate_piezo_power와 동일한 결과)
+
+        Args:
+            locations (str | array-like): 위치명 또는 사이트 인덱스 배열
+            people_counts (array-like, optional): 인원 수 배열 (NaN 또는 None = 위치별 평균값)
+            hours (float | array-like): 발전 시간 (시간 단위)
+
+        Returns:
+            np.ndarray: 발전량 배열 (Wh)
+        """
+        site_idx = self._site_indices(locations)
+        params = self.site_registry.arrays
+
+        avg_people = params['avg_hourly_people'][site_idx]
+        if people_counts is None:
+            people = avg_people * hours
+        else:
+            people_counts = np.asarray(people_counts, dtype=float)
+            people = np.where(np.isnan(people_counts), avg_people, people_counts) * hours
+
+        total_steps = people * params['step_per_person'][site_idx]
+        return total_steps * params['power_per_step'][site_idx] * self.ac_dc_efficiency
+
+    def calculate_total_power_batch(self, locations, wind_speeds, people_counts=None, hours=1, current_temps=None, min_temps=None, max_temps=None,
+                                    streetlight_hours=None):
+        """
+        총 발전량 배치 계산 (풍력 + 지압)
+
+        calculate_total_power와 같은 값을 반올림 없이 배열로 반환합니다.
+
+        Args:
+            locations (str | array-like): 위치명 또는 사이트 인덱스 배열
+            wind_speeds (array-like): 풍속 배열 (m/s)
+            people_counts (array-like, optional): 인원 수 배열 (NaN = 위치별 평균값)
+            hours (float | array-like): 발전 시간
+            current_temps (array-like, optional): 현재 기온 배열
+            min_temps (array-like, optional): 최저 기온 배열
+            max_temps (array-like, optional): 최고 기온 배열
+            streetlight_hours (array-like, optional): 가로등 점등 시간 (기본값: min(hours, 12))
+
+        Returns:
+            dict: 항목별 NumPy 배열 (풍력, 지압, 총합, 가로등 소비량, 잉여/부족량)
+        """
+        site_idx = self._site_indices(locations)
+        params = self.site_registry.arrays
+        wind_speeds = np.asarray(wind_speeds, dtype=float)
+
+        wind_power = self.calculate_wind_power_batch(site_idx, wind_speeds, hours, current_temps, min_temps, max_temps)
+        piezo_power = self.calculate_piezo_power_batch(site_idx, people_counts, hours)
+        total_power = wind_power + piezo_power
+
+        if streetlight_hours is None:
+            streetlight_hours = np.minimum(hours, self.led_streetlight_hours)
+        streetlight_consumption = self.led_streetlight_power * params['streetlight_count'][site_idx] * streetlight_hours
+        power_balance = total_power - streetlight_consumption
+
+        return {
+            'site_index': site_idx,
+            'adjusted_wind_speed': wind_speeds * params['wind_factor'][site_idx],
+            'wind_power_wh': wind_power,
+            'piezo_power_wh': piezo_power,
+            'total_power_wh': total_power,
+            'streetlight_consumption_wh': streetlight_consumption,
+            'power_balance_wh': power_balance,
+            'is_sufficient': power_balance >= 0
+        }
+
+
+    def predict_hourly_series(self, location, hourly_wind_speeds, hourly_people_counts=None, temp_info=None,
+                              index_columns=None, temperature_columns=None, hours=1, streetlight_hours=None):
+        """
+        시간별 발전량을 열 기반 결과(HourlyPowerSeries)로 계산 (길이 제한 없음, 반올림 없음)
+        
+        Args:
+            location (str): 위치명
+            hourly_wind_speeds (array-like): 시간별 풍속 배열 (m/s)
+            hourly_people_counts (array-like, optional): 시간별 인원 수 배열 (None/NaN = 위치별 평균값)
+            temp_info (dict, optional): 전체 구간 공통 기온 정보
+            index_columns (dict, optional): 인덱스 열 (예: {'day': ..., 'hour': ...}). 기본값은 0-23 반복 시간
+            temperature_columns (tuple, optional): 시간별 (현재, 최저, 최고) 기온 배열 (temp_info 대신 사용)
+            hours (float): 한 행의 시간 길이 (시간 단위, 10분 단위 결과는 1/6)
+            streetlight_hours (array-like, optional): 행별 가로등 점등 시간 (기본값: min(hours, 12))
+            
+        Returns:
+            HourlyPowerSeries: 시간별 발전량 열 기반 결과
+        """
+        wind_speeds = np.asarray(hourly_wind_speeds, dtype=float).ravel()
+        num_hours = len(wind_speeds)
+        
+        if temperature_columns is not None:
+            temperature_columns = tuple(np.broadcast_to(np.asarray(t, dtype=float), (num_hours,)) for t in temperature_columns)
+            temps = temperature_columns
+        else:
+            temps = self._temp_info_values(temp_info)
+        
+        result = self.calculate_total_power_batch(location, wind_speeds, hourly_people_counts, hours, *temps, streetlight_hours=streetlight_hours)
+        
+        # 인원 수 (명시되지 않은 시간은 위치별 평균값)
+        avg_hourly_people = self.piezo_tile_settings[location]['avg_hourly_people']
+        if hourly_people_counts is None:
+            people_counts = np.full(num_hours, float(avg_hourly_people))
+        else:
+            people_counts = np.asarray(hourly_people_counts, dtype=float).ravel()
+            people_counts = np.where(np.isnan(people_counts), avg_hourly_people, people_counts)
+        
+        total_power = result['total_power_wh']
+        streetlight_consumption = np.broadcast_to(result['streetlight_consumption_wh'], (num_hours,))
+        sufficiency = np.where(
+            streetlight_consumption > 0,
+            total_power / np.maximum(0.1, streetlight_consumption) * 100,
+            np.inf
+        )
+        
+        if index_columns is None:
+            index_columns = {'hour': np.arange(num_hours) % 24}
+        columns = {name: np.asarray(values).ravel() for name, values in index_columns.items()}
+        columns.update({
+            'wind_speed': wind_speeds,
+            'adjusted_wind_speed': result['adjusted_wind_speed'],
+            'people_count': people_counts,
+            'wind_power_wh': result['wind_power_wh'],
+            'piezo_power_wh': np.broadcast_to(result['piezo_power_wh'], (num_hours,)),
+            'total_power_wh': total_power,
+            'streetlight_consumption_wh': streetlight_consumption,
+            'power_balance_wh': result['power_balance_wh'],
+            'is_sufficient': result['is_sufficient'],
+            'sufficiency_percentage': sufficiency
+        })
+        if temperature_columns is not None:
+            columns['current_temp'], columns['min_temp'], columns['max_temp'] = temperature_columns
+        
+        metadata = {
+            'hours': hours,
+            'wind_factor': self.wind_turbine_settings[location]['wind_factor'],
+            'temperature_info': temp_info or {}
+        }
+        return HourlyPowerSeries(location, columns, metadata)
+
+    def predict_power_batch(self, locations, wind_speeds, people_counts=None, temperatures=None, min_temps=None, max_temps=None):
+        """
+        여러 건의 시간당 발전량 예측을 한 번의 배치 계산으로 수행 (행마다 /predict와 같은 계산)
+
+        기온 영향 계수는 /predict와 같이 최저/최고 기온이 모두 있는 행에만 적용하며,
+        이때 현재 기온이 없으면 기본값 20.0°C를 사용합니다.
+
+        Args:
+            locations (array-like): 행별 위치명 배열
+            wind_speeds (array-like): 행별 풍속 배열 (m/s)
+            people_counts (array-like, optional): 행별 인원 수 배열 (NaN = 위치별 평균값)
+            temperatures (array-like, optional): 행별 현재 기온 배열 (NaN = 20.0)
+            min_temps (array-like, optional): 행별 최저 기온 배열 (NaN = 정보 없음)
+            max_temps (array-like, optional): 행별 최고 기온 배열 (NaN = 정보 없음)
+
+        Returns:
+            HourlyPowerSeries: 행별 발전량 열 기반 결과 (location 열 포함, 반올림 없음)
+        """
+        locations = np.asarray(locations)
+        wind_speeds = np.asarray(wind_speeds, dtype=float).ravel()
+        num_rows = len(wind_speeds)
+        site_idx = self._site_indices(locations).ravel()
+        params = self.site_registry.arrays
+
+        def column(values, default=np.nan):
+            if values is None:
+                return np.full(num_rows, default)
+            values = np.asarray(values, dtype=float).ravel()
+            return np.where(np.isnan(values), default, values)
+
+        min_temps = column(min_temps)
+        max_temps = column(max_temps)
+        has_temp_info = ~np.isnan(min_temps) & ~np.isnan(max_temps)
+        current_temps = np.where(has_temp_info, column(temperatures, 20.0), np.nan)
+
+        people = column(people_counts)
+        result = self.calculate_total_power_batch(site_idx, wind_speeds, people, 1, current_temps, min_temps, max_temps)
+
+        streetlight_consumption = result['streetlight_consumption_wh']
+        sufficiency = np.where(
+            streetlight_consumption > 0,
+            result['total_power_wh'] / np.maximum(0.1, streetlight_consumption) * 100,
+            np.inf
+        )
+
+        columns = {
+            'location': np.asarray(self.site_registry.names, dtype=object)[site_idx],
+            'wind_speed': wind_speeds,
+            'adjusted_wind_speed': result['adjusted_wind_speed'],
+            'people_count': np.where(np.isnan(people), params['avg_hourly_people'][site_idx], people),
+            'wind_power_wh': result['wind_power_wh'],
+            'piezo_power_wh': result['piezo_power_wh'],
+            'total_power_wh': result['total_power_wh'],
+            'streetlight_consumption_wh': streetlight_consumption,
+            'power_balance_wh': result['power_balance_wh'],
+            'is_sufficient': result['is_sufficient'],
+            'sufficiency_percentage': sufficiency,
+            'current_temp': current_temps,
+            'min_temp': np.where(has_temp_info, min_temps, np.nan),
+            'max_temp': np.where(has_temp_info, max_temps, np.nan)
+        }
+        return HourlyPowerSeries(None, columns, {'hours': 1})
+
+    def interpolate_wind_speeds(self, hourly_wind_speeds, step_minutes=10, next_wind_speed=None):
+        """
+        시간별 풍속 → 시간 내 단위 풍속 (정시 값을 기준점으로 다음 정시까지 선형 보간)
+
+        Args:
+            hourly_wind_speeds (array-like): 시간별 풍속 배열 (..., 시간 수), 각 값은 해당 정시의 풍속
+            step_minutes (int): 시간 간격 (분, 60의 약수)
+            next_wind_speed (float | array-like, optional): 마지막 시간 이후 정시의 풍속 (기본값: 마지막 값 유지)
+
+        Returns:
+            np.ndarray: 단위 시간별 풍속 배열 (..., 시간 수 x 60 / step_minutes)
+        """
+        if step_minutes not in SUBHOURLY_STEPS:
+            raise ValueError(f"지원되지 않는 시간 간격: {step_minutes}분. 지원되는 간격: {list(SUBHOURLY_STEPS)}")
+        steps_per_hour = 60 // step_minutes
+
+        anchors = np.asarray(hourly_wind_speeds, dtype=float)
+        last = anchors[..., -1:] if next_wind_speed is None else np.broadcast_to(
+            np.asarray(next_wind_speed, dtype=float)[..., np.newaxis], anchors[..., -1:].shape
+        )
+        next_anchors = np.concatenate((anchors[..., 1:], last), axis=-1)
+
+        fraction = np.arange(steps_per_hour) / steps_per_hour
+        fine = anchors[..., np.newaxis] + (next_anchors - anchors)[..., np.newaxis] * fraction
+        return fine.reshape(anchors.shape[:-1] + (anchors.shape[-1] * steps_per_hour,))
+
+    def predict_subhourly_series(self, location, hourly_wind_speeds, step_minutes=10, hourly_people_counts=None,
+                                 temp_info=None, temperature_columns=None, next_wind_speed=None):
+        """
+        시간 내 단위(10분, 1분 등) 발전량 열 기반 결과
+
+        풍속은 정시 값 사이를 선형 보간한 뒤 단위 시간마다 출력 곡선(3제곱, 정격 제한)을 계산하므로
+        시간별 계산보다 풍속 변화 구간의 발전량이 정확합니다. 인원 수와 기온은 해당 시간의 값을 사용합니다.
 
-    def predict_daily_power(self, location, hourly_wind_speeds, hourly_people_counts=None, temp_info=None):
+        Args:
+            location (str): 위치명
+            hourly_wind_speeds (array-like): 시간별 풍속 배열 (m/s, 정시 값)
+            step_minutes (int): 시간 간격 (분, 60의 약수)
+            hourly_people_counts (array-like, optional): 시간당 인원 수 배열 (None/NaN = 위치별 평균값)
+            temp_info (dict, optional): 전체 구간 공통 기온 정보
+            temperature_columns (tuple, optional): 시간별 (현재, 최저, 최고) 기온 배열
+            next_wind_speed (float, optional): 마지막 시간 이후 정시의 풍속 (기본값: 마지막 값 유지)
+
+        Returns:
+            HourlyPowerSeries: 단위 시간별 발전량 (인덱스 열: hour, minute, metadata hours = step_minutes / 60)
+        """
+        wind_speeds = self.interpolate_wind_speeds(np.ravel(hourly_wind_speeds), step_minutes, next_wind_speed)
+        steps_per_hour = 60 // step_minutes
+        num_steps = len(wind_speeds)
+
+        if hourly_people_counts is not None:
+            hourly_people_counts = np.repeat(np.asarray(hourly_people_counts, dtype=float).ravel(), steps_per_hour)
+        if temperature_columns is not None:
+            temperature_columns = tuple(
+                np.repeat(np.broadcast_to(np.asarray(t, dtype=float), (num_steps // steps_per_hour,)), steps_per_hour)
+                for t in temperature_columns
+            )
+
+        step = np.arange(num_steps)
+        series = self.predict_hourly_series(
+            location, wind_speeds, hourly_people_counts, temp_info,
+            index_columns={'hour': step // steps_per_hour % 24, 'minute': step % steps_per_hour * step_minutes},
+            temperature_columns=temperature_columns,
+            hours=step_minutes / 60
+        )
+        series.metadata['step_minutes'] = step_minutes
+        return series
+
+    def predict_daily_power(self, location, hourly_wind_speeds, hourly_people_counts=None, temp_info=None, columnar=False):
         """
         일일 발전량 예측
         
@@ -281,6 +794,7 @@ class PowerCalculator:
             hourly_wind_speeds (list): 시간별 풍속 목록 (24개 요소)
             hourly_people_counts (list, optional): 시간별 인원 수 목록 (24개 요소)
             temp_info (dict, optional): 일별 기온 정보
+            columnar (bool): True이면 hourly_results 대신 열 기반 hourly_series(HourlyPowerSeries) 반환
             
         Returns:
             dict: 일일 발전량 정보
@@ -291,12 +805,25 @@ class PowerCalculator:
         if hourly_people_counts is not None and len(hourly_people_counts) != 24:
             raise ValueError("시간별 인원 수는 24개 요소를 가진 목록이어야 합니다.")
         
+        if columnar:
+            series = self.predict_hourly_series(location, hourly_wind_speeds, hourly_people_counts, temp_info)
+            
+            # 합계는 시간별 반올림 값의 누적합 (hourly_results 방식과 동일)
+            daily_wind_power = sequential_sum(round_like_python(series['wind_power_wh'], 2))
+            daily_piezo_power = sequential_sum(round_like_python(series['piezo_power_wh'], 2))
+            
+            result = self._horizon_result('daily', location, daily_wind_power, daily_piezo_power, 1, include_component_kwh=False)
+            result['hourly_series'] = series
+            result['temperature_info'] = temp_info or {}
+            return result
+        
         daily_wind_power = 0
         daily_piezo_power = 0
         hourly_results = []
         
         for hour in range(24):
-            wind_speed = hourly_wind_speeds[hour]
+            # numpy 실수형이 섞이면 round() 규칙이 달라지므로 파이썬 float로 통일
+            wind_speed = float(hourly_wind_speeds[hour])
             
             people_count = None
             if hourly_people_counts is not None:
@@ -338,7 +865,7 @@ class PowerCalculator:
             'temperature_info': temp_info or {}
         }
     
-    def predict_weekly_power(self, location, daily_wind_speeds=None, daily_people_counts=None, temp_info=None):
+    def predict_weekly_power(self, location, daily_wind_speeds=None, daily_people_counts=None, temp_info=None, detail='hour', columnar=False):
         """
         주간 발전량 예측
         
@@ -347,6 +874,10 @@ class PowerCalculator:
             daily_wind_speeds (list, optional): 일별 풍속 목록 (7개 요소)
             daily_people_counts (list, optional): 일별 인원 수 목록 (7개 요소)
             temp_info (dict, optional): 일별 기온 정보
+            detail (str): 결과 상세 수준 (summary, month, week, day, hour)
+                - day: daily_results 포함 (hourly_results 제외)
+                - hour: daily_results 및 hourly_results 모두 포함
+            columnar (bool): True이면 detail=hour에서 일별 hourly_results 대신 주 전체 hourly_series(HourlyPowerSeries) 반환
             
         Returns:
             dict: 주간 발전량 정보
@@ -361,6 +892,17 @@ class PowerCalculator:
         if daily_people_counts is not None and len(daily_people_counts) != 7:
             raise ValueError("일별 인원 수는 7개 요소를 가진 목록이어야 합니다.")
         
+        # 시간별 결과가 필요 없으면 배열 엔진으로 요청 수준까지만 계산
+        if not self._detail_includes(detail, 'hour'):
+            return self._predict_weekly_power_arrays(location, daily_wind_speeds, temp_info, detail)
+        
+        if columnar:
+            result = self._predict_weekly_power_arrays(location, daily_wind_speeds, temp_info, 'day')
+            result['hourly_series'] = self._horizon_series(
+                location, self._weekly_wind_grid(daily_wind_speeds), ('day', 'hour'), temp_info
+            )
+            return result
+        
         weekly_wind_power = 0
         weekly_piezo_power = 0
         daily_results = []
@@ -372,40 +914,9 @@ class PowerCalculator:
             if daily_people_counts is not None:
                 people_count = daily_people_counts[day]
             
-            # 일별 발전량 계산
-            # 각 일마다 시간별 풍속에 약간의 변동 추가
-            hourly_wind_speeds = []
-            for hour in range(24):
-                # 시간에 따른 풍속 변동 모델 (0-6시: -20%, 6-12시: 기준, 12-18시: +20%, 18-24시: 기준)
-                if 0 <= hour < 6:
-                    hourly_wind_speeds.append(wind_speed * 0.8)
-                elif 6 <= hour < 12:
-                    hourly_wind_speeds.append(wind_speed)
-                elif 12 <= hour < 18:
-                    hourly_wind_speeds.append(wind_speed * 1.2)
-                else:
-                    hourly_wind_speeds.append(wind_speed)
-            
-            # 일별 인원 수 기본값 생성
-            avg_hourly_people = self.piezo_tile_settings[location]['avg_hourly_people']
-            hourly_people_counts = []
-            
-            for hour in range(24):
-                # 시간에 따른 인원 수 변동 모델
-                if 0 <= hour < 6:  # 심야
-                    hourly_people_counts.append(int(avg_hourly_people * 0.1))
-                elif 6 <= hour < 9:  # 출근 시간
-                    hourly_people_counts.append(int(avg_hourly_people * 1.5))
-                elif 9 <= hour < 12:  # 오전
-                    hourly_people_counts.append(int(avg_hourly_people * 1.2))
-                elif 12 <= hour < 14:  # 점심
-                    hourly_people_counts.append(int(avg_hourly_people * 1.8))
-                elif 14 <= hour < 18:  # 오후
-                    hourly_people_counts.append(int(avg_hourly_people * 1.2))
-                elif 18 <= hour < 21:  # 저녁
-                    hourly_people_counts.append(int(avg_hourly_people * 0.8))
-                else:  # 야간
-                    hourly_people_counts.append(int(avg_hourly_people * 0.3))
+            # 일별 발전량 계산 (시간대별 풍속/인원 수 변동 프로파일)
+            hourly_wind_speeds = self.diurnal_profiles.wind_speeds(wind_speed)
+            hourly_people_counts = self.diurnal_profiles.people_counts(location, 'weekly').tolist()
             
             # 일별 발전량 계산
             daily_result = self.predict_daily_power(location, hourly_wind_speeds, hourly_people_counts, temp_info)
@@ -447,7 +958,7 @@ class PowerCalculator:
         }
 
 
-    def predict_monthly_power(self, location, weekly_wind_speeds=None, weekly_people_counts=None, temp_info=None):
+    def predict_monthly_power(self, location, weekly_wind_speeds=None, weekly_people_counts=None, temp_info=None, detail='hour', columnar=False):
         """
         월간 발전량 예측 (4주간 데이터)
         
@@ -456,6 +967,8 @@ class PowerCalculator:
             weekly_wind_speeds (list, optional): 주별 평균 풍속 목록 (4개 요소)
             weekly_people_counts (list, optional): 주별 평균 인원 수 목록 (4개 요소)
             temp_info (dict, optional): 월간 기온 정보
+            detail (str): 결과 상세 수준 (summary, month, week, day, hour)
+            columnar (bool): True이면 detail=hour에서 일별 hourly_results 대신 월 전체 hourly_series(HourlyPowerSeries) 반환
             
         Returns:
             dict: 월간 발전량 정보
@@ -475,6 +988,17 @@ class PowerCalculator:
         if weekly_people_counts is not None and len(weekly_people_counts) != num_weeks:
             raise ValueError(f"주별 인원 수는 {num_weeks}개 요소를 가진 목록이어야 합니다.")
         
+        # 시간별 결과가 필요 없으면 배열 엔진으로 요청 수준까지만 계산
+        if not self._detail_includes(detail, 'hour'):
+            return self._predict_monthly_power_arrays(location, weekly_wind_speeds, temp_info, detail)
+        
+        if columnar:
+            result = self._predict_monthly_power_arrays(location, weekly_wind_speeds, temp_info, 'day')
+            result['hourly_series'] = self._horizon_series(
+                location, self._monthly_wind_grid(weekly_wind_speeds), ('week', 'day', 'hour'), temp_info
+            )
+            return result
+        
         monthly_wind_power = 0
         monthly_piezo_power = 0
         weekly_results = []
@@ -540,7 +1064,7 @@ class PowerCalculator:
         }
 
 
-    def predict_annual_power(self, location, monthly_wind_speeds=None, monthly_people_counts=None):
+    def predict_annual_power(self, location, monthly_wind_speeds=None, monthly_people_counts=None, detail='hour', columnar=False):
         """
         연간 발전량 예측
         
@@ -548,6 +1072,8 @@ class PowerCalculator:
             location (str): 위치명
             monthly_wind_speeds (list, optional): 월별 평균 풍속 목록 (12개 요소)
             monthly_people_counts (list, optional): 월별 평균 인원 수 목록 (12개 요소)
+            detail (str): 결과 상세 수준 (summary, month, week, day, hour)
+            columnar (bool): True이면 detail=hour에서 일별 hourly_results 대신 연 전체 hourly_series(HourlyPowerSeries) 반환
             
         Returns:
             dict: 연간 발전량 정보
@@ -555,17 +1081,9 @@ class PowerCalculator:
         num_months = 12
         
         if not monthly_wind_speeds:
-            # 계절에 따른 월별 풍속 변동 (봄: 3-5월, 여름: 6-8월, 가을: 9-11월, 겨울: 12-2월)
-            seasonal_factors = [
-                1.2, 1.3,  # 1-2월: 겨울 (강한 풍속)
-                1.1, 1.0, 0.9,  # 3-5월: 봄 (중간 풍속)
-                0.7, 0.6, 0.7,  # 6-8월: 여름 (약한 풍속)
-                0.9, 1.0, 1.1,  # 9-11월: 가을 (중간 풍속)
-                1.2  # 12월: 겨울 (강한 풍속)
-            ]
-            
+            # 계절에 따른 월별 풍속 변동
             base_wind_speed = 3.5
-            monthly_wind_speeds = [base_wind_speed * factor for factor in seasonal_factors]
+            monthly_wind_speeds = [base_wind_speed * factor for factor in self.monthly_wind_factors]
         
         if len(monthly_wind_speeds) != num_months:
             raise ValueError(f"월별 풍속은 {num_months}개 요소를 가진 목록이어야 합니다.")
@@ -573,6 +1091,13 @@ class PowerCalculator:
         if monthly_people_counts is not None and len(monthly_people_counts) != num_months:
             raise ValueError(f"월별 인원 수는 {num_months}개 요소를 가진 목록이어야 합니다.")
         
+        # 시간별 결과가 필요 없으면 배열 엔진으로 요청 수준까지만 계산
+        if not self._detail_includes(detail, 'hour'):
+            return self._predict_annual_power_arrays(location, monthly_wind_speeds, detail)
+        
+        if columnar:
+            return self._predict_annual_power_arrays(location, monthly_wind_speeds, 'day', columnar=True)
+        
         annual_wind_power = 0
         annual_piezo_power = 0
         monthly_results = []
@@ -659,3 +1184,906 @@ class PowerCalculator:
             'sufficiency_percentage': round((total_power / max(0.1, streetlight_consumption)) * 100, 1) if streetlight_consumption > 0 else float('inf'),
             'monthly_results': monthly_results
         }
+
+    def _temp_info_values(self, temp_info):
+        """
+        기온 정보 dict → (현재, 최저, 최고) 값 (calculate_wind_power와 같은 조건, 없는 값은 NaN)
+        """
+        if not temp_info or 'current' not in temp_info:
+            return np.nan, np.nan, np.nan
+
+        if 'min' in temp_info and 'max' in temp_info:
+            return temp_info['current'], temp_info['min'], temp_info['max']
+
+        return temp_info['current'], np.nan, np.nan
+
+    def _weekly_hourly_people(self, location):
+        """
+        predict_weekly_power의 시간별 기본 인원 수 (24개 요소 배열)
+        """
+        return self.diurnal_profiles.people_counts(location, 'weekly').astype(float)
+
+    def _horizon_rollup(self, location, hourly_wind_speeds, current_temps=np.nan, min_temps=np.nan, max_temps=np.nan):
+        """
+        시간별 풍속 격자 (..., 7, 24)를 일 → 주 → 월 → 연 단위로 합산
+
+        중첩 루프(predict_daily/weekly/monthly/annual_power)와 같이 각 단위의 반올림된 값을
+        상위 단위에서 순서대로 누적하므로 합계가 기존 결과와 일치합니다.
+
+        Args:
+            location (str): 위치명
+            hourly_wind_speeds (np.ndarray): 시간별 풍속 격자 (마지막 두 축: 7일 x 24시간)
+            current_temps, min_temps, max_temps (array-like): 격자에 브로드캐스트되는 기온 정보
+
+        Returns:
+            list: 일 단위부터 최상위 단위까지 (풍력 누적합, 지압 누적합) 배열 목록
+        """
+        wind_power = self.calculate_wind_power_batch(location, hourly_wind_speeds, 1, current_temps, min_temps, max_temps)
+        piezo_power = self.calculate_piezo_power_batch(location, self._weekly_hourly_people(location), 1)
+
+        # 시간별 결과는 calculate_total_power와 같이 소수점 2자리로 반올림
+        wind_wh = round_like_python(wind_power, 2)
+        piezo_wh = round_like_python(np.broadcast_to(piezo_power, wind_wh.shape), 2)
+
+        levels = []
+        while wind_wh.ndim > 0:
+            wind_acc = sequential_sum(wind_wh)
+            piezo_acc = sequential_sum(piezo_wh)
+            levels.append((wind_acc, piezo_acc))
+            wind_wh = round_like_python(wind_acc, 2)
+            piezo_wh = round_like_python(piezo_acc, 2)
+
+        return levels
+
+    def _horizon_result(self, prefix, location, wind_power, piezo_power, days, include_component_kwh=True, streetlight_count=None,
+                        streetlight_hours=None):
+        """
+        단위 기간 발전량 결과 dict 생성 (기존 predict_*_power 결과와 같은 키 구성)
+
+        Args:
+            prefix (str): 결과 키 접두사 (daily, weekly, monthly, annual)
+            location (str): 위치명
+            wind_power (float): 풍력 발전량 누적합 (Wh)
+            piezo_power (float): 지압 발전량 누적합 (Wh)
+            days (int): 가로등 소비 전력 계산 일수
+            include_component_kwh (bool): 풍력/지압 kWh 항목 포함 여부
+            streetlight_count (int, optional): 가로등 개수 (기본값: 위치별 설정값)
+            streetlight_hours (float, optional): 기간 전체 가로등 점등 시간 (기본값: 12시간 x 일수)
+
+        Returns:
+            dict: 기간 발전량 정보
+        """
+        wind_power = float(wind_power)
+        piezo_power = float(piezo_power)
+        total_power = wind_power + piezo_power
+
+        # 가로등 소비 전력 (12시간만 작동 x 일수, 또는 일출/일몰 기준 점등 시간)
+        if streetlight_count is None:
+            streetlight_count = self.streetlight_count.get(location, 0)
+        if streetlight_hours is None:
+            streetlight_consumption = self.led_streetlight_power * streetlight_count * self.led_streetlight_hours * days
+        else:
+            streetlight_consumption = self.led_streetlight_power * streetlight_count * float(streetlight_hours)
+
+        # 발전량과 소비량 차이
+        power_balance = total_power - streetlight_consumption
+
+        result = {
+            'location': location,
+            f'{prefix}_wind_power_wh': round(wind_power, 2),
+            f'{prefix}_piezo_power_wh': round(piezo_power, 2),
+            f'{prefix}_total_power_wh': round(total_power, 2)
+        }
+        if include_component_kwh:
+            result[f'{prefix}_wind_power_kwh'] = round(wind_power / 1000, 3)
+            result[f'{prefix}_piezo_power_kwh'] = round(piezo_power / 1000, 3)
+        result.update({
+            f'{prefix}_total_power_kwh': round(total_power / 1000, 3),
+            'streetlight_consumption_wh': round(streetlight_consumption, 2),
+            'streetlight_consumption_kwh': round(streetlight_consumption / 1000, 3),
+            'power_balance_wh': round(power_balance, 2),
+            'power_balance_kwh': round(power_balance / 1000, 3),
+            'is_sufficient': bool(power_balance >= 0),
+            'sufficiency_percentage': round((total_power / max(0.1, streetlight_consumption)) * 100, 1) if streetlight_consumption > 0 else float('inf')
+        })
+        return result
+
+    def _horizon_series(self, location, wind_grid, index_names, temp_info=None, temperature_columns=None):
+        """
+        시간별 풍속 격자 → 격자 축 인덱스 열을 포함한 HourlyPowerSeries (predict_weekly_power 기본 인원 수 사용)
+
+        Args:
+            location (str): 위치명
+            wind_grid (np.ndarray): 시간별 풍속 격자 (예: 4주 x 7일 x 24시간)
+            index_names (tuple): 격자 축별 인덱스 열 이름 (예: ('week', 'day', 'hour'))
+            temp_info (dict, optional): 공통 기온 정보
+            temperature_columns (list, optional): 격자와 같은 모양의 (현재, 최저, 최고) 기온 배열
+
+        Returns:
+            HourlyPowerSeries: 시간별 발전량 열 기반 결과
+        """
+        index_grid = np.indices(wind_grid.shape)
+        index_columns = {name: index_grid[axis].ravel() for axis, name in enumerate(index_names)}
+        people_counts = np.broadcast_to(self._weekly_hourly_people(location), wind_grid.shape)
+        if temperature_columns is not None:
+            temperature_columns = tuple(np.ravel(t) for t in temperature_columns)
+
+        return self.predict_hourly_series(
+            location, wind_grid.ravel(), people_counts.ravel(), temp_info,
+            index_columns=index_columns, temperature_columns=temperature_columns
+        )
+
+    def _weekly_wind_grid(self, daily_wind_speeds):
+        """일별 풍속 (..., 7) → 시간별 풍속 (..., 7, 24)"""
+        return np.asarray(daily_wind_speeds, dtype=float)[..., np.newaxis] * self.hourly_wind_factors
+
+    def _monthly_wind_grid(self, weekly_wind_speeds):
+        """주별 풍속 (..., 4) → 시간별 풍속 (..., 4, 7, 24) (predict_monthly_power의 일별 변동 적용)"""
+        daily_variation = 1 + 0.05 * (np.arange(7) - 3)
+        daily_wind_speeds = np.asarray(weekly_wind_speeds, dtype=float)[..., np.newaxis] * daily_variation
+        return self._weekly_wind_grid(daily_wind_speeds)
+
+    def _annual_temp_infos(self):
+        """predict_annual_power의 월별(계절별) 기온 정보 목록 (12개 요소)"""
+        temp_infos = []
+        for month in range(12):
+            if month in [11, 0, 1]:  # 겨울 (12-2월)
+                temp_infos.append({'min': -5, 'max': 5, 'current': 0})
+            elif month in [5, 6, 7]:  # 여름 (6-8월)
+                temp_infos.append({'min': 20, 'max': 30, 'current': 25})
+            else:  # 봄/가을
+                temp_infos.append({'min': 10, 'max': 20, 'current': 15})
+        return temp_infos
+
+    def _detail_includes(self, detail, level):
+        """
+        상세 수준(detail)이 해당 단위의 하위 결과 목록을 포함하는지 여부
+
+        Args:
+            detail (str): 요청 상세 수준 (summary, month, week, day, hour)
+            level (str): 확인할 단위 (month, week, day, hour)
+
+        Returns:
+            bool: 포함 여부
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"지원되지 않는 상세 수준: {detail}. 지원되는 수준: {list(DETAIL_LEVELS)}")
+        return DETAIL_LEVELS.index(detail) >= DETAIL_LEVELS.index(level)
+
+    def _weekly_level_result(self, location, levels, index, temp_info, detail):
+        """
+        합산 결과(levels)에서 주간 결과 dict 생성 (detail이 day 이상이면 daily_results 포함)
+        """
+        wind_power, piezo_power = levels[1][0][index], levels[1][1][index]
+        result = self._horizon_result('weekly', location, wind_power, piezo_power, 7)
+
+        if self._detail_includes(detail, 'day'):
+            daily_results = []
+            for day in range(7):
+                daily_result = self._horizon_result(
+                    'daily', location, levels[0][0][index + (day,)], levels[0][1][index + (day,)], 1,
+                    include_component_kwh=False
+                )
+                daily_result['temperature_info'] = temp_info or {}
+                daily_result['day'] = day
+                daily_result['day_name'] = ['월', '화', '수', '목', '금', '토', '일'][day]
+                daily_results.append(daily_result)
+            result['daily_results'] = daily_results
+
+        result['temperature_info'] = temp_info or {}
+        return result
+
+    def _monthly_level_result(self, location, levels, index, temp_info, weekly_wind_speeds, detail):
+        """
+        합산 결과(levels)에서 월간 결과 dict 생성 (detail이 week 이상이면 weekly_results 포함)
+        """
+        wind_power, piezo_power = levels[2][0][index], levels[2][1][index]
+        result = self._horizon_result('monthly', location, wind_power, piezo_power, 30)
+
+        if self._detail_includes(detail, 'week'):
+            weekly_results = []
+            for week in range(len(weekly_wind_speeds)):
+                weekly_result = self._weekly_level_result(location, levels, index + (week,), temp_info, detail)
+                weekly_result['week'] = week + 1
+                weekly_results.append(weekly_result)
+            result['weekly_results'] = weekly_results
+
+        result['temperature_info'] = temp_info or {}
+        result['avg_wind_speed'] = sum(weekly_wind_speeds) / len(weekly_wind_speeds)
+        return result
+
+    def _predict_weekly_power_arrays(self, location, daily_wind_speeds, temp_info, detail):
+        """배열 엔진 기반 주간 발전량 예측 (detail 수준까지만 하위 결과 생성)"""
+        levels = self._horizon_rollup(location, self._weekly_wind_grid(daily_wind_speeds), *self._temp_info_values(temp_info))
+        return self._weekly_level_result(location, levels, (), temp_info, detail)
+
+    def _predict_monthly_power_arrays(self, location, weekly_wind_speeds, temp_info, detail):
+        """배열 엔진 기반 월간 발전량 예측 (detail 수준까지만 하위 결과 생성)"""
+        levels = self._horizon_rollup(location, self._monthly_wind_grid(weekly_wind_speeds), *self._temp_info_values(temp_info))
+        return self._monthly_level_result(location, levels, (), temp_info, list(weekly_wind_speeds), detail)
+
+    def _predict_annual_power_arrays(self, location, monthly_wind_speeds, detail, columnar=False):
+        """
+        배열 엔진 기반 연간 발전량 예측 (12개월 x 4주 x 7일 x 24시간을 한 번에 계산)
+        columnar=True이면 연 전체 hourly_series(월별 기온 열 포함)를 함께 반환
+        """
+        # 월별 주간 풍속 변동 (1 + 0.05 * (주 - 1.5))
+        weekly_variation = 1 + 0.05 * (np.arange(4) - 1.5)
+        weekly_wind_speeds = np.asarray(monthly_wind_speeds, dtype=float)[:, np.newaxis] * weekly_variation
+
+        # 월별 기온 정보를 (12, 1, 1, 1)로 브로드캐스트
+        temp_infos = self._annual_temp_infos()
+        temp_columns = np.array([self._temp_info_values(temp_info) for temp_info in temp_infos], dtype=float)
+        wind_grid = self._monthly_wind_grid(weekly_wind_speeds)
+        grid_temps = [temp_columns[:, i, np.newaxis, np.newaxis, np.newaxis] for i in range(3)]
+        levels = self._horizon_rollup(location, wind_grid, *grid_temps)
+
+        wind_power, piezo_power = levels[3]
+        result = self._horizon_result('annual', location, wind_power, piezo_power, 365)
+
+        if self._detail_includes(detail, 'month'):
+            month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+            monthly_results = []
+            for month in range(12):
+                monthly_result = self._monthly_level_result(
+                    location, levels, (month,), temp_infos[month], weekly_wind_speeds[month].tolist(), detail
+                )
+                monthly_result['month'] = month_names[month]
+                monthly_results.append(monthly_result)
+            result['monthly_results'] = monthly_results
+
+        if columnar:
+            result['hourly_series'] = self._horizon_series(
+                location, wind_grid, ('month', 'week', 'day', 'hour'),
+                temperature_columns=[np.broadcast_to(t, wind_grid.shape) for t in grid_temps]
+            )
+
+        return result
+
+    def predict_weekly_power_summary(self, location, daily_wind_speeds=None, temp_info=None):
+        """
+        주간 발전량 요약 예측 (시간별 결과 없이 배열 연산으로 합계만 계산)
+
+        predict_weekly_power와 같은 합계/잉여량을 반환하며 daily_results는 포함하지 않습니다.
+
+        Args:
+            location (str): 위치명
+            daily_wind_speeds (list, optional): 일별 풍속 목록 (7개 요소)
+            temp_info (dict, optional): 일별 기온 정보
+
+        Returns:
+            dict: 주간 발전량 정보
+        """
+        return self.predict_weekly_power(location, daily_wind_speeds, None, temp_info, detail='summary')
+
+    def predict_monthly_power_summary(self, location, weekly_wind_speeds=None, temp_info=None):
+        """
+        월간 발전량 요약 예측 (4주, 시간별 결과 없이 배열 연산으로 합계만 계산)
+
+        Args:
+            location (str): 위치명
+            weekly_wind_speeds (list, optional): 주별 평균 풍속 목록 (4개 요소)
+            temp_info (dict, optional): 월간 기온 정보
+
+        Returns:
+            dict: 월간 발전량 정보
+        """
+        return self.predict_monthly_power(location, weekly_wind_speeds, None, temp_info, detail='summary')
+
+    def predict_annual_power_summary(self, location, monthly_wind_speeds=None):
+        """
+        연간 발전량 요약 예측 (12개월 x 4주 x 7일 x 24시간을 배열 연산으로 한 번에 계산)
+
+        Args:
+            location (str): 위치명
+            monthly_wind_speeds (list, optional): 월별 평균 풍속 목록 (12개 요소)
+
+        Returns:
+            dict: 연간 발전량 정보
+        """
+        return self.predict_annual_power(location, monthly_wind_speeds, None, detail='summary')
+
+    def predict_fleet_power(self, hourly_wind_speeds, hourly_people_counts=None, temp_info=None, locations=None, include_hourly=False):
+        """
+        전체 사이트 발전량 예측 (사이트 x 시간 행렬을 한 번의 브로드캐스트 연산으로 계산)
+
+        사이트별 합계는 predict_daily_power와 같이 시간별 반올림 값의 누적합이며,
+        캠퍼스 합계는 사이트별 합계의 합입니다.
+
+        Args:
+            hourly_wind_speeds (array-like): 시간별 기상청 풍속 (시간 수,) - 전체 사이트 공통 - 또는 (사이트 수, 시간 수)
+            hourly_people_counts (array-like, optional): 시간별 인원 수 (사이트 수, 시간 수) 또는 (시간 수,)
+                (None이면 사이트별 시간대 인원 수 변동 모델 적용, NaN = 위치별 평균값)
+            temp_info (dict, optional): 전체 사이트 공통 기온 정보
+            locations (list, optional): 계산할 위치명 또는 사이트 등록부 인덱스 목록 (기본값: 등록부 전체 사이트)
+            include_hourly (bool): 캠퍼스 시간별 합계(hourly_series) 포함 여부
+
+        Returns:
+            dict: 캠퍼스 합계(campus)와 사이트별 결과(sites)
+        """
+        if locations is None:
+            site_idx = np.arange(len(self.site_registry))
+        else:
+            # 중복 사이트 제거 (입력 순서 유지)
+            site_idx = np.array(list(dict.fromkeys(self._site_indices(list(locations)).ravel().tolist())), dtype=np.intp)
+        if not site_idx.size:
+            raise ValueError("계산할 위치가 없습니다.")
+
+        locations = [self.site_registry.names[i] for i in site_idx.tolist()]
+        num_sites = len(locations)
+        params = self.site_registry.arrays
+
+        wind_speeds = np.asarray(hourly_wind_speeds, dtype=float)
+        if wind_speeds.ndim not in (1, 2) or (wind_speeds.ndim == 2 and wind_speeds.shape[0] != num_sites):
+            raise ValueError(f"시간별 풍속은 (시간 수,) 또는 ({num_sites}, 시간 수) 배열이어야 합니다.")
+        num_hours = wind_speeds.shape[-1]
+        if num_hours == 0:
+            raise ValueError("시간별 풍속이 비어 있습니다.")
+
+        if hourly_people_counts is None:
+            # 사이트별 시간대 인원 수 변동 모델 (predict_weekly_power 기준)
+            hour_of_day = np.arange(num_hours) % 24
+            people_counts = self.diurnal_profiles.people_tables['weekly'][site_idx][:, hour_of_day].astype(float)
+        else:
+            people_counts = np.asarray(hourly_people_counts, dtype=float)
+            if people_counts.shape[-1] != num_hours:
+                raise ValueError("시간별 인원 수와 풍속의 시간 수가 같아야 합니다.")
+
+        # (사이트, 1) x (시간,) 브로드캐스트
+        grid_shape = (num_sites, num_hours)
+        site_grid = site_idx[:, np.newaxis]
+        wind_power = self.calculate_wind_power_batch(site_grid, wind_speeds, 1, *self._temp_info_values(temp_info))
+        piezo_power = self.calculate_piezo_power_batch(site_grid, people_counts, 1)
+        wind_power = np.broadcast_to(wind_power, grid_shape)
+        piezo_power = np.broadcast_to(piezo_power, grid_shape)
+
+        # 사이트별 합계 (시간별 소수점 2자리 반올림 후 누적합)
+        site_wind_power = sequential_sum(round_like_python(wind_power, 2))
+        site_piezo_power = sequential_sum(round_like_python(piezo_power, 2))
+
+        days = num_hours / 24
+        sites = [
+            self._horizon_result('period', location, site_wind_power[i], site_piezo_power[i], days)
+            for i, location in enumerate(locations)
+        ]
+
+        campus_streetlight_count = params['streetlight_count'][site_idx].sum()
+        if campus_streetlight_count.is_integer():
+            campus_streetlight_count = int(campus_streetlight_count)
+        campus = self._horizon_result(
+            'period', 'campus', sequential_sum(site_wind_power), sequential_sum(site_piezo_power), days,
+            streetlight_count=campus_streetlight_count
+        )
+        campus['site_count'] = num_sites
+
+        result = {
+            'locations': locations,
+            'hours': num_hours,
+            'campus': campus,
+            'sites': sites,
+            'temperature_info': temp_info or {}
+        }
+
+        if include_hourly:
+            campus_wind = wind_power.sum(axis=0)
+            campus_piezo = piezo_power.sum(axis=0)
+            result['hourly_series'] = HourlyPowerSeries('campus', {
+                'hour': np.arange(num_hours) % 24,
+                'wind_power_wh': campus_wind,
+                'piezo_power_wh': campus_piezo,
+                'total_power_wh': campus_wind + campus_piezo
+            }, {'hours': 1, 'locations': locations})
+
+        return result
+
+    def sample_wind_speeds(self, mean_wind_speed, num_samples, num_days, distribution='weibull', shape=2.0, rng=None):
+        """
+        일별 풍속 표본 생성 (평균 풍속이 mean_wind_speed가 되도록 분포 척도 설정)
+
+        Args:
+            mean_wind_speed (float): 평균 풍속 (m/s)
+            num_samples (int): 표본(시나리오) 수
+            num_days (int): 일수
+            distribution (str): 풍속 분포 (weibull, lognormal)
+            shape (float): 분포 형상 계수 (weibull: k, lognormal: 로그 표준편차)
+            rng (np.random.Generator, optional): 난수 생성기
+
+        Returns:
+            tuple: (일별 풍속 배열 (표본 수, 일수), 분포 정보 dict)
+        """
+        if distribution not in WIND_DISTRIBUTIONS:
+            raise ValueError(f"지원되지 않는 풍속 분포: {distribution}. 지원되는 분포: {list(WIND_DISTRIBUTIONS)}")
+        if shape <= 0:
+            raise ValueError("분포 형상 계수는 0보다 커야 합니다.")
+
+        rng = rng if rng is not None else np.random.default_rng()
+        size = (num_samples, num_days)
+
+        if distribution == 'weibull':
+            # 평균 = scale * Γ(1 + 1/k)
+            scale = mean_wind_speed / math.gamma(1 + 1 / shape)
+            samples = scale * rng.weibull(shape, size)
+            info = {'name': distribution, 'mean_wind_speed': mean_wind_speed, 'shape': shape, 'scale': scale}
+        else:
+            # 평균 = exp(mu + sigma^2 / 2)
+            mu = math.log(mean_wind_speed) - shape ** 2 / 2 if mean_wind_speed > 0 else -np.inf
+            samples = rng.lognormal(mu, shape, size)
+            info = {'name': distribution, 'mean_wind_speed': mean_wind_speed, 'shape': shape, 'mu': mu}
+
+        return samples, info
+
+    def predict_power_uncertainty(self, location, avg_wind_speed=3.5, days=365, num_samples=1000,
+                                  distribution='weibull', shape=2.0, temp_info=None, seed=None,
+                                  quantiles=(0.1, 0.5, 0.9)):
+        """
+        몬테카를로 발전량 불확실성 분석 (P10/P50/P90 및 가로등 수요 충족 확률)
+
+        일별 풍속 시나리오를 분포에서 추출하고 시간대별 풍속 변동을 적용한 뒤
+        (표본 수 x 시간) 배열을 배치 커널로 계산합니다. 메모리 사용량을 제한하기 위해 표본을 나누어 계산합니다.
+        P10은 10번째 백분위수(표본의 10%가 이 값 이하)를 의미합니다.
+
+        Args:
+            location (str): 위치명
+            avg_wind_speed (float): 평균 풍속 (m/s)
+            days (int): 예측 일수
+            num_samples (int): 표본(시나리오) 수
+            distribution (str): 일별 풍속 분포 (weibull, lognormal)
+            shape (float): 분포 형상 계수 (weibull: k, lognormal: 로그 표준편차)
+            temp_info (dict, optional): 기간 공통 기온 정보
+            seed (int, optional): 난수 시드 (재현용)
+            quantiles (tuple): 계산할 분위수
+
+        Returns:
+            dict: 분위수별 발전량/잉여량과 수요 충족 확률
+        """
+        if days < 1 or num_samples < 1:
+            raise ValueError("일수와 표본 수는 1 이상이어야 합니다.")
+
+        site_idx = self._site_indices(location)
+        rng = np.random.default_rng(seed)
+        num_hours = days * 24
+
+        # 시간별 인원 수는 predict_weekly_power와 같은 시간대 변동 모델 (표본 간 동일)
+        hourly_people = np.tile(self._weekly_hourly_people(location), days)
+        piezo_power = float(np.sum(self.calculate_piezo_power_batch(site_idx, hourly_people, 1)))
+        temps = self._temp_info_values(temp_info)
+
+        # 표본을 나누어 계산 (한 번에 약 100만 시간 x 표본 요소)
+        chunk_size = max(1, (1 << 20) // num_hours)
+        wind_power = np.empty(num_samples)
+        distribution_info = None
+        for start in range(0, num_samples, chunk_size):
+            stop = min(start + chunk_size, num_samples)
+            daily_wind_speeds, distribution_info = self.sample_wind_speeds(
+                avg_wind_speed, stop - start, days, distribution, shape, rng
+            )
+            hourly_wind_speeds = self._weekly_wind_grid(daily_wind_speeds).reshape(stop - start, num_hours)
+            wind_power[start:stop] = self.calculate_wind_power_batch(site_idx, hourly_wind_speeds, 1, *temps).sum(axis=1)
+
+        total_power = wind_power + piezo_power
+
+        # 가로등 소비 전력 (12시간만 작동 x 일수)
+        streetlight_count = self.streetlight_count.get(location, 0)
+        streetlight_consumption = self.led_streetlight_power * streetlight_count * self.led_streetlight_hours * days
+        power_balance = total_power - streetlight_consumption
+
+        def band(values_wh):
+            band_kwh = {f'p{round(q * 100)}': round(float(v) / 1000, 3) for q, v in zip(quantiles, np.quantile(values_wh, quantiles))}
+            band_kwh['mean'] = round(float(np.mean(values_wh)) / 1000, 3)
+            band_kwh['std'] = round(float(np.std(values_wh)) / 1000, 3)
+            return band_kwh
+
+        return {
+            'location': location,
+            'days': days,
+            'hours': num_hours,
+            'num_samples': num_samples,
+            'distribution': distribution_info,
+            'wind_power_kwh': band(wind_power),
+            'piezo_power_kwh': round(piezo_power / 1000, 3),
+            'total_power_kwh': band(total_power),
+            'streetlight_consumption_kwh': round(streetlight_consumption / 1000, 3),
+            'power_balance_kwh': band(power_balance),
+            'demand_met_probability': round(float(np.mean(power_balance >= 0)), 4),
+            'temperature_info': temp_info or {}
+        }
+
+    def calendar_hours(self, year):
+        """
+        실제 달력 기준 연간 시간 배열 (윤년 8,784시간)
+
+        Args:
+            year (int): 연도
+
+        Returns:
+            dict: 시간별 인덱스 배열 (month 0-11, day_of_month 1-31, day_of_year 0-365,
+                  week 0-53 (월요일 시작), weekday 0=월, hour 0-23), 시간별 가로등 점등 비율(night_fraction) 및 월/주/일 길이
+        """
+        if year not in self._calendar_cache:
+            start = np.datetime64(f'{year:04d}-01-01T00', 'h')
+            stop = np.datetime64(f'{year + 1:04d}-01-01T00', 'h')
+            timestamps = np.arange(start, stop, np.timedelta64(1, 'h'))
+
+            dates = timestamps.astype('datetime64[D]')
+            months = timestamps.astype('datetime64[M]')
+            day_of_year = (dates - start.astype('datetime64[D]')).astype(int)
+            weekday = (dates.astype(int) + 3) % 7  # 1970-01-01은 목요일
+            first_weekday = int(weekday[0])
+            week = (day_of_year + first_weekday) // 7
+
+            calendar = {
+                'year': year,
+                'timestamps': timestamps,
+                'month': months.astype(int) % 12,
+                'day_of_month': (dates - months.astype('datetime64[D]')).astype(int) + 1,
+                'day_of_year': day_of_year,
+                'weekday': weekday,
+                'week': week,
+                'hour': timestamps.astype(int) % 24
+            }
+            calendar['night_fraction'] = self.solar_schedule.night_fractions(timestamps)
+            calendar['num_days'] = len(timestamps) // 24
+            calendar['days_in_month'] = np.bincount(calendar['month'], minlength=12) // 24
+            calendar['days_in_week'] = np.bincount(week) // 24
+            calendar['week_start_dates'] = [
+                str(start.astype('datetime64[D]') + np.timedelta64(max(0, 7 * w - first_weekday), 'D'))
+                for w in range(len(calendar['days_in_week']))
+            ]
+            self._calendar_cache[year] = calendar
+
+        return self._calendar_cache[year]
+
+    def predict_calendar_year_power(self, location, year, avg_wind_speed=3.5, monthly_wind_speeds=None, detail='month'):
+        """
+        실제 달력 기준 연간 발전량 예측 (해당 연도의 모든 시간을 배열로 한 번에 계산)
+
+        월별 계절 풍속, 시간대별 풍속/인원 수 변동, 계절별 기온을 시간 배열에 적용하고
+        월/주/일 단위는 그룹 합산(bincount)으로 계산합니다. 가로등 소비 전력은 일몰 ~ 일출 점등 시간 기준입니다.
+
+        Args:
+            location (str): 위치명
+            year (int): 연도
+            avg_wind_speed (float): 연평균 기준 풍속 (m/s, 월별 계절 계수 적용)
+            monthly_wind_speeds (list, optional): 월별 평균 풍속 목록 (12개 요소, 지정 시 avg_wind_speed 대신 사용)
+            detail (str): 결과 상세 수준 (summary, month, week, day, hour)
+                - week: monthly_results와 달력 주 단위 weekly_results
+                - day: daily_results 추가
+                - hour: 시간별 열 기반 결과(hourly_series) 추가
+
+        Returns:
+            dict: 연간 발전량 정보 (predict_annual_power와 같은 키 구성 + year, days, hours, streetlight_hours)
+        """
+        if monthly_wind_speeds is None:
+            monthly_wind_speeds = [avg_wind_speed * factor for factor in self.monthly_wind_factors]
+        if len(monthly_wind_speeds) != 12:
+            raise ValueError("월별 풍속은 12개 요소를 가진 목록이어야 합니다.")
+        self._detail_includes(detail, 'hour')
+
+        calendar = self.calendar_hours(year)
+        month = calendar['month']
+        hour = calendar['hour']
+        temp_infos = self._annual_temp_infos()
+
+        night_fraction = calendar['night_fraction']
+
+        series = self._seasonal_hourly_series(
+            location, month, hour, monthly_wind_speeds,
+            index_columns={'month': month + 1, 'day': calendar['day_of_month'], 'hour': hour},
+            streetlight_hours=night_fraction
+        )
+        series.metadata.update({'year': year, 'start': str(calendar['timestamps'][0])})
+        wind_power = series['wind_power_wh']
+        piezo_power = series['piezo_power_wh']
+
+        result = self._horizon_result(
+            'annual', location, wind_power.sum(), piezo_power.sum(), calendar['num_days'], streetlight_hours=night_fraction.sum()
+        )
+        result.update({
+            'year': year, 'days': calendar['num_days'], 'hours': len(series),
+            'streetlight_hours': round(float(night_fraction.sum()), 2)
+        })
+
+        if self._detail_includes(detail, 'month'):
+            month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+            monthly_wind = np.bincount(month, wind_power, minlength=12)
+            monthly_piezo = np.bincount(month, piezo_power, minlength=12)
+            monthly_night = np.bincount(month, night_fraction, minlength=12)
+            monthly_results = []
+            for m in range(12):
+                monthly_result = self._horizon_result(
+                    'monthly', location, monthly_wind[m], monthly_piezo[m], int(calendar['days_in_month'][m]),
+                    streetlight_hours=monthly_night[m]
+                )
+                monthly_result['temperature_info'] = temp_infos[m]
+                monthly_result['avg_wind_speed'] = float(monthly_wind_speeds[m])
+                monthly_result['month'] = month_names[m]
+                monthly_result['days'] = int(calendar['days_in_month'][m])
+                monthly_results.append(monthly_result)
+            result['monthly_results'] = monthly_results
+
+        if self._detail_includes(detail, 'week'):
+            week = calendar['week']
+            weekly_wind = np.bincount(week, wind_power)
+            weekly_piezo = np.bincount(week, piezo_power)
+            weekly_night = np.bincount(week, night_fraction)
+            weekly_results = []
+            for w in range(len(weekly_wind)):
+                weekly_result = self._horizon_result(
+                    'weekly', location, weekly_wind[w], weekly_piezo[w], int(calendar['days_in_week'][w]),
+                    streetlight_hours=weekly_night[w]
+                )
+                weekly_result['week'] = w + 1
+                weekly_result['start_date'] = calendar['week_start_dates'][w]
+                weekly_result['days'] = int(calendar['days_in_week'][w])
+                weekly_results.append(weekly_result)
+            result['weekly_results'] = weekly_results
+
+        if self._detail_includes(detail, 'day'):
+            day = calendar['day_of_year']
+            daily_wind = np.bincount(day, wind_power)
+            daily_piezo = np.bincount(day, piezo_power)
+            daily_night = np.bincount(day, night_fraction)
+            dates = calendar['timestamps'][::24].astype('datetime64[D]').astype(str).tolist()
+            weekday = calendar['weekday'][::24].tolist()
+            daily_results = []
+            for d in range(calendar['num_days']):
+                daily_result = self._horizon_result(
+                    'daily', location, daily_wind[d], daily_piezo[d], 1, include_component_kwh=False,
+                    streetlight_hours=daily_night[d]
+                )
+                daily_result['date'] = dates[d]
+                daily_result['day_name'] = ['월', '화', '수', '목', '금', '토', '일'][weekday[d]]
+                daily_results.append(daily_result)
+            result['daily_results'] = daily_results
+
+        if self._detail_includes(detail, 'hour'):
+            result['hourly_series'] = series
+
+        return result
+
+    def _seasonal_hourly_series(self, location, month, hour, monthly_wind_speeds, index_columns, streetlight_hours=None):
+        """
+        월별 계절 풍속 x 시간대별 변동, 월별(계절별) 기온, 시간대별 인원 수를 적용한 시간별 발전량
+
+        Args:
+            location (str): 위치명
+            month (np.ndarray): 시간별 월 인덱스 (0-11)
+            hour (np.ndarray): 시간별 시각 (0-23)
+            monthly_wind_speeds (list): 월별 평균 풍속 목록 (12개 요소)
+            index_columns (dict): 결과 인덱스 열
+            streetlight_hours (np.ndarray, optional): 시간별 가로등 점등 시간 (일출/일몰 기준 점등 비율)
+
+        Returns:
+            HourlyPowerSeries: 시간별 발전량 열 기반 결과
+        """
+        temp_table = np.array([self._temp_info_values(temp_info) for temp_info in self._annual_temp_infos()], dtype=float)
+        hourly_wind_speeds = np.asarray(monthly_wind_speeds, dtype=float)[month] * self.hourly_wind_factors[hour]
+        hourly_people = self._weekly_hourly_people(location)[hour]
+
+        return self.predict_hourly_series(
+            location, hourly_wind_speeds, hourly_people,
+            index_columns=index_columns,
+            temperature_columns=tuple(temp_table[month, i] for i in range(3)),
+            streetlight_hours=streetlight_hours
+        )
+
+    def iter_hourly_blocks(self, location, start_date, end_date, block='month', avg_wind_speed=3.5, monthly_wind_speeds=None):
+        """
+        [start_date, end_date) 기간의 시간별 발전량을 블록 단위로 생성 (기간 길이와 무관하게 블록 하나 분량의 메모리만 사용)
+
+        각 블록은 predict_calendar_year_power와 같은 모델(월별 계절 풍속, 시간대별 변동, 계절별 기온, 일출/일몰 점등)로
+        계산한 HourlyPowerSeries이며, 인덱스 열은 year, month(1-12), day(1-31), hour(0-23)입니다.
+        인자 검사는 호출 시점에 바로 수행합니다 (생성기 소비 전).
+
+        Args:
+            location (str): 위치명
+            start_date (str): 시작일 (YYYY-MM-DD, 포함)
+            end_date (str): 종료일 (YYYY-MM-DD, 제외)
+            block (str): 블록 단위 (day, week (월요일 시작), month, year - 기간 경계에서 잘림)
+            avg_wind_speed (float): 연평균 기준 풍속 (m/s, 월별 계절 계수 적용)
+            monthly_wind_speeds (list, optional): 월별 평균 풍속 목록 (12개 요소, 지정 시 avg_wind_speed 대신 사용)
+
+        Returns:
+            generator: 블록별 HourlyPowerSeries (metadata에 block_start, block_end 포함)
+        """
+        if location not in self.wind_turbine_settings:
+            raise ValueError(f"지원되지 않는 위치: {location}")
+        if block not in STREAM_BLOCKS:
+            raise ValueError(f"지원되지 않는 블록 단위: {block}. 지원되는 단위: {list(STREAM_BLOCKS)}")
+        if monthly_wind_speeds is None:
+            monthly_wind_speeds = [avg_wind_speed * factor for factor in self.monthly_wind_factors]
+        if len(monthly_wind_speeds) != 12:
+            raise ValueError("월별 풍속은 12개 요소를 가진 목록이어야 합니다.")
+
+        start = np.datetime64(start_date, 'D')
+        end = np.datetime64(end_date, 'D')
+        if start >= end:
+            raise ValueError(f"종료일은 시작일 이후여야 합니다: {start_date} ~ {end_date}")
+
+        return self._hourly_blocks(location, start, end, block, list(monthly_wind_speeds))
+
+    def _hourly_blocks(self, location, start, end, block, monthly_wind_speeds):
+        """iter_hourly_blocks의 생성기 본체"""
+        block_start = start
+        while block_start < end:
+            if block == 'day':
+                block_end = block_start + np.timedelta64(1, 'D')
+            elif block == 'week':
+                weekday = (block_start.astype(int) + 3) % 7  # 1970-01-01은 목요일
+                block_end = block_start + np.timedelta64(7 - weekday, 'D')
+            elif block == 'month':
+                block_end = (block_start.astype('datetime64[M]') + 1).astype('datetime64[D]')
+            else:
+                block_end = (block_start.astype('datetime64[Y]') + 1).astype('datetime64[D]')
+            block_end = min(block_end, end)
+
+            timestamps = np.arange(block_start.astype('datetime64[h]'), block_end.astype('datetime64[h]'), np.timedelta64(1, 'h'))
+            dates = timestamps.astype('datetime64[D]')
+            months = timestamps.astype('datetime64[M]')
+            month = months.astype(int) % 12
+            hour = timestamps.astype(int) % 24
+
+            series = self._seasonal_hourly_series(
+                location, month, hour, monthly_wind_speeds,
+                index_columns={
+                    'year': timestamps.astype('datetime64[Y]').astype(int) + 1970,
+                    'month': month + 1,
+                    'day': (dates - months.astype('datetime64[D]')).astype(int) + 1,
+                    'hour': hour
+                },
+                streetlight_hours=self.solar_schedule.night_fractions(timestamps)
+            )
+            series.metadata.update({'block_start': str(block_start), 'block_end': str(block_end)})
+            yield series
+
+            block_start = block_end
+
+    def _wind_curve_parameters(self, site_idx, temp_factor=1.0, range_factor=1.0):
+        """
+        기상청 풍속 v 기준 출력 곡선 매개변수 (출력 = min(c * v^3, 정격 출력), v < 시동 풍속이면 0)
+
+        Returns:
+            tuple: (3제곱 계수 c, 시동 풍속, 정격 도달 풍속, 정격 출력) - 모두 기상청 풍속 기준
+        """
+        params = self.site_registry.arrays
+        wind_factor = params['wind_factor'][site_idx]
+        air_density = 1.225
+        coefficient = 0.5 * air_density * params['area'][site_idx] * wind_factor ** 3 * params['efficiency'][site_idx] * temp_factor * range_factor
+        rated_power = params['rated_power'][site_idx]
+        cut_in_speed = params['start_wind_speed'][site_idx] / wind_factor
+        rated_speed = np.cbrt(rated_power / coefficient)
+        return coefficient, cut_in_speed, rated_speed, rated_power
+
+    def expected_wind_power_batch(self, locations, mean_wind_speeds=None, shape=2.0, histogram=None,
+                                  current_temps=None, min_temps=None, max_temps=None):
+        """
+        풍속 분포에 대한 시간당 기대 풍력 발전량 (출력 곡선을 분포로 적분, 시간별 표본 생성 없음)
+
+        Weibull 분포는 시동 풍속 ~ 정격 도달 풍속 구간의 3제곱 출력을 16점 Gauss-Legendre로 적분하고
+        정격 구간은 생존 함수(1 - CDF)로 계산합니다. 히스토그램은 구간별 균등 밀도로 4점 적분합니다.
+
+        Args:
+            locations (str | array-like): 위치명 또는 사이트 인덱스 배열
+            mean_wind_speeds (array-like, optional): Weibull 평균 풍속 (m/s, histogram이 없을 때 사용)
+            shape (float): Weibull 형상 계수 k
+            histogram (tuple, optional): 기상청 풍속 히스토그램 (구간 경계 (B+1,), 빈도 (..., B))
+            current_temps, min_temps, max_temps (array-like, optional): 기온 정보 (NaN = 정보 없음)
+
+        Returns:
+            np.ndarray: 시간당 기대 발전량 (Wh, 설치 개수/AC-DC 효율 반영)
+        """
+        site_idx = self._site_indices(locations)
+        temp_factor, range_factor = self.temperature_factors_batch(current_temps, min_temps, max_temps)
+        coefficient, cut_in_speed, rated_speed, rated_power = (
+            np.asarray(value)[..., np.newaxis] for value in self._wind_curve_parameters(site_idx, temp_factor, range_factor)
+        )
+
+        if histogram is not None:
+            edges, counts = histogram
+            edges = np.asarray(edges, dtype=float)
+            counts = np.asarray(counts, dtype=float)
+            probabilities = counts / np.sum(counts, axis=-1, keepdims=True)
+
+            # 구간별 구적점 (B, 4) - 구간 내 균등 밀도
+            centers = (edges[1:] + edges[:-1]) / 2
+            half_widths = (edges[1:] - edges[:-1]) / 2
+            speeds = centers[:, np.newaxis] + half_widths[:, np.newaxis] * self.histogram_nodes
+            speeds = speeds.reshape(-1)
+            power = np.where(speeds < cut_in_speed, 0.0, np.minimum(coefficient * speeds ** 3, rated_power))
+            power = power.reshape(power.shape[:-1] + (len(centers), len(self.histogram_nodes)))
+            expected_power = np.sum(probabilities * (power @ (self.histogram_weights / 2)), axis=-1)
+        else:
+            if mean_wind_speeds is None:
+                raise ValueError("평균 풍속 또는 히스토그램이 필요합니다.")
+            if shape <= 0:
+                raise ValueError("분포 형상 계수는 0보다 커야 합니다.")
+            scale = np.asarray(mean_wind_speeds, dtype=float)[..., np.newaxis] / math.gamma(1 + 1 / shape)
+            scale = np.maximum(scale, 1e-9)
+
+            # 시동 풍속 ~ 정격 도달 풍속 구간 3제곱 출력 적분 (정격 도달 풍속이 더 낮으면 구간 폭 0)
+            lower = cut_in_speed
+            upper = np.maximum(rated_speed, cut_in_speed)
+            speeds = (upper - lower) / 2 * self.quadrature_nodes + (upper + lower) / 2
+            ratio = speeds / scale
+            density = shape / scale * ratio ** (shape - 1) * np.exp(-ratio ** shape)
+            cubic_part = (upper - lower)[..., 0] / 2 * np.sum(self.quadrature_weights * coefficient * speeds ** 3 * density, axis=-1)
+
+            # 정격 구간: 정격 출력 x P(v >= 정격 도달 풍속)
+            rated_part = rated_power[..., 0] * np.exp(-(upper[..., 0] / scale[..., 0]) ** shape)
+            expected_power = cubic_part + rated_part
+
+        return expected_power * self.site_registry.arrays['count'][site_idx] * self.ac_dc_efficiency
+
+    def predict_expected_energy(self, location, avg_wind_speed=3.5, shape=2.0, year=None, monthly_histograms=None):
+        """
+        분포 적분 기반 연간/월간 기대 발전량 (월별 계절 풍속, 시간대별 풍속 변동, 계절별 기온 반영)
+
+        Args:
+            location (str): 위치명
+            avg_wind_speed (float): 연평균 기준 풍속 (m/s, 월별 계절 계수 적용 후 Weibull 평균으로 사용)
+            shape (float): Weibull 형상 계수 k
+            year (int, optional): 연도 (지정 시 실제 월별 일수, 기본값 평년 365일)
+            monthly_histograms (list, optional): 월별 일평균 풍속 히스토그램 12개 [(구간 경계, 빈도), ...]
+                (지정 시 Weibull 대신 경험 분포 사용)
+
+        Returns:
+            dict: 연간 기대 발전량 정보 (predict_annual_power와 같은 키 구성 + monthly_results)
+        """
+        if year is not None:
+            month_starts = np.arange(np.datetime64(f'{year:04d}-01'), np.datetime64(f'{year + 1:04d}-02'), np.timedelta64(1, 'M'))
+            days_in_month = np.diff(month_starts.astype('datetime64[D]')).astype(int)
+        else:
+            days_in_month = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+        # 월별 기온 (12, 1) x 시간대별 풍속 변동 계수 (고유값별 시간 비율)
+        temp_infos = self._annual_temp_infos()
+        temp_table = np.array([self._temp_info_values(temp_info) for temp_info in temp_infos], dtype=float)
+        diurnal_factors, diurnal_hours = np.unique(self.hourly_wind_factors, return_counts=True)
+        temps = [temp_table[:, i, np.newaxis] for i in range(3)]
+
+        if monthly_histograms is not None:
+            if len(monthly_histograms) != 12:
+                raise ValueError("월별 히스토그램은 12개 요소를 가진 목록이어야 합니다.")
+            hourly_wind = np.empty((12, len(diurnal_factors)))
+            for month, (edges, counts) in enumerate(monthly_histograms):
+                # 시간대별 변동 계수만큼 풍속 구간 경계를 조정
+                for j, factor in enumerate(diurnal_factors):
+                    hourly_wind[month, j] = self.expected_wind_power_batch(
+                        location, histogram=(np.asarray(edges, dtype=float) * factor, counts),
+                        current_temps=temps[0][month], min_temps=temps[1][month], max_temps=temps[2][month]
+                    )[0]
+            monthly_wind_speeds = [
+                float(np.average((np.asarray(edges[1:]) + np.asarray(edges[:-1])) / 2, weights=counts))
+                for edges, counts in monthly_histograms
+            ]
+            distribution = {'name': 'histogram'}
+        else:
+            monthly_wind_speeds = [avg_wind_speed * factor for factor in self.monthly_wind_factors]
+            mean_speeds = np.asarray(monthly_wind_speeds)[:, np.newaxis] * diurnal_factors
+            hourly_wind = self.expected_wind_power_batch(location, mean_speeds, shape, None, *temps)
+            distribution = {'name': 'weibull', 'mean_wind_speed': avg_wind_speed, 'shape': shape}
+
+        # 하루 기대 풍력 = 시간대별 기대값 x 해당 시간 수, 지압은 시간대별 인원 수 변동 모델
+        daily_wind = hourly_wind @ diurnal_hours
+        daily_piezo = float(np.sum(self.calculate_piezo_power_batch(location, self._weekly_hourly_people(location), 1)))
+        monthly_wind = daily_wind * days_in_month
+        monthly_piezo = daily_piezo * days_in_month
+        num_days = int(days_in_month.sum())
+
+        result = self._horizon_result('annual', location, monthly_wind.sum(), monthly_piezo.sum(), num_days)
+        result.update({'days': num_days, 'distribution': distribution})
+        if year is not None:
+            result['year'] = year
+
+        month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+        monthly_results = []
+        for month in range(12):
+            monthly_result = self._horizon_result('monthly', location, monthly_wind[month], monthly_piezo[month], int(days_in_month[month]))
+            monthly_result['temperature_info'] = temp_infos[month]
+            monthly_result['avg_wind_speed'] = monthly_wind_speeds[month]
+            monthly_result['month'] = month_names[month]
+            monthly_result['days'] = int(days_in_month[month])
+            monthly_results.append(monthly_result)
+        result['monthly_results'] = monthly_results
+
+        return result
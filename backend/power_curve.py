@@ -0,0 +1,114 @@
+"""
+풍력 출력 곡선 조회표 모듈
+- 사이트별 (보정 풍속 x 기온 구간 x 일교차 구간) 출력표를 한 번 계산
+- 조회는 격자 인덱스 + 선형 보간 후 정격 출력 제한 (시동 풍속 미만은 보간 없이 0)
+- 정격 출력 제한은 보간 후 적용하므로 정격 도달 지점의 꺾임에서 보간 오차가 커지지 않음
+- 격자 중간점에서 정확한 계산과 비교한 최대 오차를 함께 기록
+"""
+import numpy as np
+
+
+class PowerCurveTable:
+    """
+    사이트별 풍력 출력 조회표
+
+    Attributes:
+        speed_step (float): 보정 풍속 격자 간격 (m/s)
+        speeds (np.ndarray): 보정 풍속 격자 (N,)
+        table (np.ndarray): 터빈 1대 정격 제한 전 출력 (W) - (사이트 수, 기온 구간 + 1, 일교차 구간 + 1, N)
+            (기온/일교차 구간의 마지막 인덱스는 '정보 없음' = 계수 1.0)
+        max_abs_error (np.ndarray): 사이트별 최대 절대 오차 (W)
+        max_rel_error (np.ndarray): 사이트별 정격 출력 대비 최대 오차 비율
+    """
+
+    def __init__(self, site_arrays, temperature_factors, temp_range_factors, air_density=1.225, speed_step=0.05):
+        """
+        Args:
+            site_arrays (dict): 사이트 등록부 배열 (area, efficiency, rated_power, start_wind_speed)
+            temperature_factors (array-like): 기온 구간별 영향 계수
+            temp_range_factors (array-like): 일교차 구간별 영향 계수
+            air_density (float): 공기 밀도 (kg/m^3)
+            speed_step (float): 보정 풍속 격자 간격 (m/s)
+        """
+        self.speed_step = speed_step
+        self.start_wind_speed = np.asarray(site_arrays['start_wind_speed'], dtype=float)
+
+        # 구간 계수 + '정보 없음'(1.0)
+        temp_factor = np.append(np.asarray(temperature_factors, dtype=float), 1.0)
+        range_factor = np.append(np.asarray(temp_range_factors, dtype=float), 1.0)
+
+        # 3제곱 계수 (사이트, 기온, 일교차, 1): 0.5 * ρ * A * η * 기온 계수 * 일교차 계수
+        self._base = 0.5 * air_density * np.asarray(site_arrays['area'], dtype=float)
+        self._efficiency = np.asarray(site_arrays['efficiency'], dtype=float)
+        self._temp_factor = temp_factor
+        self._range_factor = range_factor
+        self.rated_power = np.asarray(site_arrays['rated_power'], dtype=float)
+
+        # 모든 사이트/계수 조합이 정격에 도달하는 풍속까지 격자 생성 (그 이상은 정격 출력)
+        coefficient = self._coefficient()
+        rated_speed = np.cbrt(self.rated_power[:, np.newaxis, np.newaxis] / coefficient[..., 0])
+        max_speed = max(30.0, float(np.max(rated_speed)) + 2 * speed_step) if rated_speed.size else 30.0
+        self.speeds = np.arange(0.0, max_speed + speed_step, speed_step)
+        self.table = coefficient * (self.speeds * self.speeds * self.speeds)
+
+        # 격자 중간점(선형 보간 오차가 가장 큰 위치)에서 오차 측정
+        midpoints = self.speeds[:-1] + speed_step / 2
+        rated_power = self.rated_power[:, np.newaxis, np.newaxis, np.newaxis]
+        interpolated = np.minimum((self.table[..., :-1] + self.table[..., 1:]) / 2, rated_power)
+        exact = np.minimum(coefficient * (midpoints * midpoints * midpoints), rated_power)
+        errors = np.abs(interpolated - exact).reshape(len(self.rated_power), -1)
+        self.max_abs_error = errors.max(axis=1) if errors.size else np.zeros(len(self.rated_power))
+        self.max_rel_error = self.max_abs_error / np.maximum(self.rated_power, 1e-9)
+
+    def _coefficient(self):
+        """3제곱 계수 (사이트, 기온 구간, 일교차 구간, 1)"""
+        return (
+            self._base[:, np.newaxis, np.newaxis, np.newaxis]
+            * self._efficiency[:, np.newaxis, np.newaxis, np.newaxis]
+            * self._temp_factor[np.newaxis, :, np.newaxis, np.newaxis]
+            * self._range_factor[np.newaxis, np.newaxis, :, np.newaxis]
+        )
+
+    def lookup(self, site_idx, adjusted_wind_speeds, temp_bins, range_bins):
+        """
+        출력 조회 (선형 보간, 시동 풍속 미만은 0)
+
+        Args:
+            site_idx (array-like): 사이트 인덱스
+            adjusted_wind_speeds (array-like): 보정 풍속 (m/s)
+            temp_bins (array-like): 기온 구간 인덱스 (마지막 = 정보 없음)
+            range_bins (array-like): 일교차 구간 인덱스 (마지막 = 정보 없음)
+
+        Returns:
+            np.ndarray: 터빈 1대 출력 (W)
+        """
+        speeds = np.asarray(adjusted_wind_speeds, dtype=float)
+        position = np.clip(speeds / self.speed_step, 0, len(self.speeds) - 1)
+        lower = np.minimum(position.astype(np.int64), len(self.speeds) - 2)
+        fraction = position - lower
+
+        lower_power = self.table[site_idx, temp_bins, range_bins, lower]
+        upper_power = self.table[site_idx, temp_bins, range_bins, lower + 1]
+        power = np.minimum(lower_power + (upper_power - lower_power) * fraction, self.rated_power[site_idx])
+
+        # 격자 범위를 넘는 풍속은 정격 출력 (격자 끝은 모든 조합의 정격 도달 풍속 이상)
+        power = np.where(speeds >= self.speeds[-1], self.rated_power[site_idx], power)
+        return np.where(speeds < self.start_wind_speed[site_idx], 0.0, power)
+
+    def error_report(self, site_names):
+        """
+        사이트별 최대 보간 오차
+
+        Args:
+            site_names (list): 사이트 이름 목록 (인덱스 순서)
+
+        Returns:
+            dict: 위치명 → {'max_abs_error_w', 'max_rel_error'}
+        """
+        return {
+            name: {
+                'max_abs_error_w': float(self.max_abs_error[i]),
+                'max_rel_error': float(self.max_rel_error[i])
+            }
+            for i, name in enumerate(site_names)
+        }
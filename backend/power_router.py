@@ -4,7 +4,9 @@
 - 머신러닝 모델을 통한 실시간 발전량 예측
 - 위치별 풍속 특성 고려 (건물 사이 통로 효과 등)
 """
-from fastapi import APIRouter, HTTPException, Query, Path, Depends, Form
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, Form, Request
+from fastapi.responses import StreamingResponse, Response, JSONResponse
+from fastapi.encoders import jsonable_encoder
 from typing import List, Optional, Dict, Any
 import numpy as np
 import pandas as pd
@@ -13,8 +15,19 @@ import traceback
 import pickle
 import os
 import json
+import functools
 from pydantic import BaseModel
-from power_calculation import PowerCalculator
+from power_calculation import PowerCalculator, DETAIL_LEVELS, WIND_DISTRIBUTIONS, STREAM_BLOCKS
+from power_series import RESULT_FORMATS, jsonable_power_result
+from power_backcast import PowerBackcaster, BACKCAST_RESOLUTIONS
+from energy_accumulator import RealtimeEnergyAccumulator, KOREA_TIMEZONE
+from design_sweep import DesignSweeper
+from inference_batcher import InferenceBatcher
+from model_warmup import ModelWarmup
+from compute_pool import compute_pools
+from tree_compiler import compile_tree_model, verify_compiled_model
+from ml_surrogate import GridSurrogate, SURROGATE_AXES
+from materialized_views import MaterializedViews
 from time_series_analysis import TimeSeriesAnalyzer
 import joblib
 from sklearn.pipeline import Pipeline
@@ -28,6 +41,15 @@ router = APIRouter(prefix="/api/power", tags=["power"])
 # 전력 계산기 인스턴스
 power_calculator = PowerCalculator()
 
+# 과거 발전량 역산기 (첫 조회 시 관측 데이터 로드 및 계산 후 캐시)
+power_backcaster = PowerBackcaster(power_calculator)
+
+# 설계 변수 스윕 계산기 (위치/연도별 연간 출력 계수 캐시)
+design_sweeper = DesignSweeper(power_calculator)
+
+# 실시간 발전량 누적기 (실시간 예측 결과를 위치별로 오늘/이번 주/이번 달 누적)
+energy_accumulator = RealtimeEnergyAccumulator()
+
 # 시계열 분석기 인스턴스
 try:
     time_series_analyzer = TimeSeriesAnalyzer(model_dir=os.getenv("MODEL_DIR", "models"))
@@ -42,18 +64,80 @@ except Exception as e:
 # 지원하는 위치 목록
 SUPPORTED_LOCATIONS = ["5호관_60주년_사이", "인경호_앞", "하이데거숲"]
 
-# 모델 캐시
-_power_prediction_model = None
+# 배치 예측 최대 행 수
+MAX_BATCH_ROWS = int(os.getenv("MAX_BATCH_ROWS", "200000"))
+
+# 배치 예측 입력 열 (PowerPredictionRequest 필드, hour/humidity는 계산식에 사용되지 않음)
+BATCH_COLUMNS = ('location', 'wind_speed', 'temperature', 'min_temperature', 'max_temperature', 'people_count')
+
+# 학습된 트리 모델을 평면 배열로 컴파일하여 사용할지 여부 (sklearn과 비트 단위 일치 검증 통과 시)
+USE_COMPILED_TREES = os.getenv("COMPILED_TREE_MODELS", "1") == "1"
+
+# ML 모델 대신 격자 대리 모델(다중 선형 보간) 사용 여부 - 준비 작업에서 격자 계산 및 오차 측정
+USE_ML_SURROGATE = os.getenv("ML_SURROGATE", "0") == "1"
+
+# 모델 준비 작업 (앱 시작 시 작업 스레드에서 로드/학습, 준비 전에는 ML 경로가 기본 계산식으로 대체)
+model_warmup = ModelWarmup()
 
 def get_power_prediction_model():
     """
-    전력 예측 모델 로드 (필요시 학습)
+    준비된 전력 예측 모델 조회 (대기하지 않음)
+
+    Returns:
+        dict: 모델 정보 또는 None (준비 중이거나 준비 실패)
+    """
+    return model_warmup.get("power_prediction")
+
+def model_readiness():
+    """
+    모델별 준비 상태 (전력 예측 모델 + 시계열 모델)
+
+    Returns:
+        dict: ready 여부와 모델별 상태
+    """
+    models = model_warmup.status()
+    models["time_series"] = {"state": "ready" if time_series_models_loaded else "unavailable"}
+    return {"ready": model_warmup.is_ready(), "models": models}
+
+def response_cache_version():
+    """
+    응답 캐시 버전 (사이트 설정 변경 시 바뀜, 날짜 기본값이 오늘인 ESS 스케줄을 위해 날짜 포함)
+
+    캐시 대상 엔드포인트는 ML 모델을 사용하지 않으므로 모델 버전은 포함하지 않음
+
+    Returns:
+        str: 설정 버전.날짜(YYYYMMDD)
+    """
+    today = datetime.now(KOREA_TIMEZONE).strftime("%Y%m%d")
+    return f"{power_calculator.settings_version}.{today}"
+
+def materialized_version():
+    """
+    구체화 뷰 버전 (사이트 설정 변경 시 바뀜, 연간 뷰가 올해 기준이므로 연도 포함)
+
+    연간/월간 예측은 ML 모델을 사용하지 않으므로 모델 버전은 포함하지 않음
+
+    Returns:
+        str: 설정 버전.연도
+    """
+    return f"{power_calculator.settings_version}.{datetime.now(KOREA_TIMEZONE).year}"
+
+# 대시보드 조회 구체화 뷰 (위치별 연간/월간 응답을 앱 시작 시 및 설정 변경 시 작업 스레드에서 미리 계산)
+materialized_views = MaterializedViews(materialized_version)
+
+# 구체화하는 대시보드 조회 조건 (frontend PowerDashboard 연간/월간 요청)
+# 연간: ?detail=month&year=올해 / 월간: ?avg_wind_speed=3.5&min_temp=5&max_temp=25&detail=week
+MATERIALIZED_WIND_SPEED = 3.5
+MATERIALIZED_MIN_TEMP = 5.0
+MATERIALIZED_MAX_TEMP = 25.0
+MATERIALIZED_ANNUAL_DETAIL = "month"
+MATERIALIZED_MONTHLY_DETAIL = "week"
+MATERIALIZED_FORMAT = "records"
+
+def _load_power_prediction_model():
+    """
+    전력 예측 모델 로드 (모델 파일이 없으면 학습 후 저장) - 모델 준비 작업 스레드에서 한 번 실행
     """
-    global _power_prediction_model
-    
-    if _power_prediction_model is not None:
-        return _power_prediction_model
-    
     # 모델 파일 경로
     model_path = os.path.join(os.getenv("MODEL_DIR", "models"), "power_prediction_model.pkl")
     
@@ -61,9 +145,9 @@ def get_power_prediction_model():
         # 모델 파일이 있으면 로드
         if os.path.exists(model_path):
             with open(model_path, 'rb') as f:
-                _power_prediction_model = pickle.load(f)
+                power_prediction_model = pickle.load(f)
                 print("기존 모델 로드 성공")
-                return _power_prediction_model
+                return power_prediction_model
     except Exception as e:
         print(f"모델 로드 오류: {e}")
     
@@ -152,7 +236,7 @@ def get_power_prediction_model():
         piezo_model.fit(X_sample, y_sample_piezo)
     
     # 모델 저장
-    _power_prediction_model = {
+    power_prediction_model = {
         "wind_model": wind_model,
         "piezo_model": piezo_model,
         "location_encodings": location_encodings,
@@ -164,12 +248,73 @@ def get_power_prediction_model():
         # 모델 파일 저장
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
         with open(model_path, 'wb') as f:
-            pickle.dump(_power_prediction_model, f)
+            pickle.dump(power_prediction_model, f)
         print(f"새 모델 저장 완료: {model_path}")
     except Exception as e:
         print(f"모델 저장 오류: {e}")
     
-    return _power_prediction_model
+    return power_prediction_model
+
+def _prepare_power_prediction_model():
+    """
+    전력 예측 모델 로드 후 트리 모델 컴파일 (검증을 통과한 모델만 compiled_models에 추가)
+
+    Returns:
+        dict: 모델 정보 (compiled_models: 모델 이름 → CompiledTreeModel)
+    """
+    model = dict(_load_power_prediction_model())
+    model["compiled_models"] = {}
+    if not USE_COMPILED_TREES:
+        return model
+    
+    for name in ("wind_model", "piezo_model"):
+        try:
+            compiled = compile_tree_model(model[name])
+            verification = verify_compiled_model(compiled, model[name])
+            if verification["identical"]:
+                model["compiled_models"][name] = compiled
+                print(f"트리 모델 컴파일 완료: {name} ({compiled.n_trees}개 트리, {compiled.n_nodes}개 노드)")
+            else:
+                print(f"트리 모델 컴파일 검증 실패 (sklearn 사용): {name} {verification}")
+        except Exception as e:
+            print(f"트리 모델 컴파일 불가 (sklearn 사용): {name} - {e}")
+    return model
+
+model_warmup.register("power_prediction", _prepare_power_prediction_model)
+
+def _build_ml_surrogate():
+    """
+    전력 예측 모델의 위치별 격자 대리 모델 생성 및 오차 측정 (전력 예측 모델 준비 후 실행)
+
+    Returns:
+        GridSurrogate: 격자 대리 모델
+    """
+    model = model_warmup.get("power_prediction")
+    if model is None:
+        raise ValueError("전력 예측 모델이 준비되지 않아 대리 모델을 만들 수 없습니다.")
+    
+    location_encodings = model.get("location_encodings") or {
+        "5호관_60주년_사이": [1, 0, 0],
+        "인경호_앞": [0, 1, 0],
+        "하이데거숲": [0, 0, 1]
+    }
+    avg_people = {
+        location: power_calculator.piezo_tile_settings[location]['avg_hourly_people']
+        for location in location_encodings if location in power_calculator.piezo_tile_settings
+    }
+    # 컴파일된 트리 모델의 분기 임계값으로 축 격자 구성 (임계값 사이에서는 모델 값이 일정)
+    breakpoints = {}
+    for compiled in model.get("compiled_models", {}).values():
+        for feature, name in enumerate(SURROGATE_AXES):
+            breakpoints[name] = np.concatenate([breakpoints.get(name, []), compiled.split_thresholds(feature)])
+    
+    surrogate = GridSurrogate(_predict_ml_rows, location_encodings, avg_people, breakpoints=breakpoints).build()
+    errors = surrogate.measure_error()
+    print(f"ML 대리 모델 준비 완료 - 최대 오차: {errors['overall']}")
+    return surrogate
+
+if USE_ML_SURROGATE:
+    model_warmup.register("power_surrogate", _build_ml_surrogate)
 
 # CSV 파일 기반 모델 학습 함수 수정 - app.py의 train_model_task
 
@@ -509,6 +654,17 @@ class PowerPredictionRequest(BaseModel):
     hour: Optional[int] = None  # 현재 시간으로 설정
     people_count: Optional[int] = None  # 위치별 기본값 사용
 
+class DesignSweepRequest(BaseModel):
+    location: str
+    count: Optional[List[float]] = None  # 지정하지 않으면 현재 설정값
+    area: Optional[List[float]] = None
+    efficiency: Optional[List[float]] = None
+    tiles_count: Optional[List[float]] = None
+    year: Optional[int] = None  # 지정하지 않으면 올해 (한국 시간 기준)
+    avg_wind_speed: float = 3.5
+    cost_weights: Optional[Dict[str, float]] = None
+    max_pareto_configs: Optional[int] = None  # 파레토 집합 반환 개수 제한 (비용 오름차순)
+
 class PowerPredictionResponse(BaseModel):
     location: str
     wind_power_wh: float
@@ -539,12 +695,23 @@ async def get_power_info():
         "supported_locations": SUPPORTED_LOCATIONS,
         "endpoints": [
             {"path": "/api/power/predict", "method": "POST", "description": "시간당 발전량 예측"},
+            {"path": "/api/power/predict/batch", "method": "POST", "description": "시간당 발전량 배치 예측 (열 배열/행 목록 입력, 열 배열 결과)"},
             {"path": "/api/power/ml-predict", "method": "POST", "description": "머신러닝 기반 발전량 예측"},
             {"path": "/api/power/realtime/{location}", "method": "GET", "description": "기상청 API 기반 실시간 발전량 예측"},
+            {"path": "/api/power/realtime/{location}/energy", "method": "GET", "description": "실시간 누적 발전량 (오늘/이번 주/이번 달)"},
             {"path": "/api/power/daily/{location}", "method": "GET", "description": "일일 발전량 예측"},
             {"path": "/api/power/weekly/{location}", "method": "GET", "description": "주간 발전량 예측"},
             {"path": "/api/power/monthly/{location}", "method": "GET", "description": "월간 발전량 예측"},
-            {"path": "/api/power/annual/{location}", "method": "GET", "description": "연간 발전량 예측"}
+            {"path": "/api/power/annual/{location}", "method": "GET", "description": "연간 발전량 예측"},
+            {"path": "/api/power/fleet", "method": "GET", "description": "전체 위치 발전량 예측 (캠퍼스 합계 + 위치별 결과)"},
+            {"path": "/api/power/uncertainty/{location}", "method": "GET", "description": "몬테카를로 발전량 불확실성 분석 (P10/P50/P90)"},
+            {"path": "/api/power/backcast", "method": "GET", "description": "관측 기상 데이터 기반 과거 발전량 조회"},
+            {"path": "/api/power/expected/{location}", "method": "GET", "description": "풍속 분포 적분 기반 기대 발전량"},
+            {"path": "/api/power/stream/{location}", "method": "GET", "description": "장기간 시간별 발전량 스트리밍 (NDJSON, 블록 단위)"},
+            {"path": "/api/power/design-sweep", "method": "POST", "description": "설계 변수 격자 스윕 (파레토 집합, 수요 충족 최소 구성)"},
+            {"path": "/api/power/power-curve", "method": "GET", "description": "풍력 출력 곡선 조회표 상태 및 보간 오차"},
+            {"path": "/api/power/ml-surrogate", "method": "GET", "description": "ML 격자 대리 모델 상태 및 측정 오차"},
+            {"path": "/api/power/materialized", "method": "GET", "description": "대시보드 연간/월간 응답 구체화 뷰 상태 (계산 시간, 경과 시간)"}
         ]
     }
 
@@ -602,9 +769,114 @@ async def predict_power(request: PowerPredictionRequest):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"전력 예측 중 오류 발생: {str(e)}")
 
-def predict_power_with_ml(location, wind_speed, temperature, humidity, hour, people_count):
+@router.post("/predict/batch")
+async def predict_power_batch(request: Request):
+    """
+    시간당 전력 발전량 배치 예측
+
+    여러 건의 /predict 요청을 열 배열 또는 행 목록으로 받아 한 번의 배치 계산으로 예측하고,
+    결과는 열 배열(columnar)로 반환합니다. 생략한 값(null)은 /predict의 기본값을 따릅니다.
+
+    요청 본문 (둘 중 하나):
+        {"columns": {"location": [...], "wind_speed": [...], "min_temperature": [...], ...}}
+        {"rows": [PowerPredictionRequest 형식 dict, ...]}
+
+    행 수만큼의 pydantic 검증/응답 모델 변환을 피하기 위해 본문은 직접 파싱하고 응답은 바로 직렬화합니다.
+    """
+    try:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="요청 본문이 올바른 JSON이 아닙니다.")
+
+        rows = body.get('rows') if isinstance(body, dict) else None
+        input_columns = body.get('columns') if isinstance(body, dict) else None
+        if (rows is None) == (input_columns is None):
+            raise HTTPException(status_code=400, detail="columns 또는 rows 중 하나만 지정해야 합니다.")
+
+        if rows is not None:
+            if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                raise HTTPException(status_code=400, detail="rows는 dict 목록이어야 합니다.")
+            columns = {name: [row.get(name) for row in rows] for name in BATCH_COLUMNS}
+        else:
+            if not isinstance(input_columns, dict) or not all(isinstance(input_columns[name], list) for name in input_columns):
+                raise HTTPException(status_code=400, detail="columns는 열 이름 → 값 목록 dict여야 합니다.")
+            columns = {name: input_columns[name] for name in BATCH_COLUMNS if name in input_columns}
+
+        for name in ('location', 'wind_speed'):
+            if name not in columns or any(value is None for value in columns[name]):
+                raise HTTPException(status_code=400, detail=f"모든 행에 {name} 값이 필요합니다.")
+
+        lengths = {name: len(values) for name, values in columns.items()}
+        if len(set(lengths.values())) > 1:
+            raise HTTPException(status_code=400, detail=f"모든 열의 길이가 같아야 합니다: {lengths}")
+        num_rows = lengths['location']
+        if num_rows > MAX_BATCH_ROWS:
+            raise HTTPException(status_code=400, detail=f"행 수가 너무 많습니다: {num_rows} (최대 {MAX_BATCH_ROWS})")
+
+        try:
+            # None → NaN (위치별 기본값/정보 없음)
+            arrays = {name: np.array(columns[name], dtype=float) for name in BATCH_COLUMNS[1:] if name in columns}
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=f"숫자가 아닌 값이 있습니다: {str(e)}")
+
+        try:
+            series = await compute_pools.run(
+                'predict_batch', power_calculator.predict_power_batch,
+                np.array(columns['location'], dtype=object),
+                arrays['wind_speed'],
+                arrays.get('people_count'),
+                arrays.get('temperature'),
+                arrays.get('min_temperature'),
+                arrays.get('max_temperature')
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        result = series.to_dict()
+        del result['location']
+        result['prediction_time'] = datetime.now().isoformat()
+        return Response(content=json.dumps(result, ensure_ascii=False), media_type="application/json")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"배치 전력 예측 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"배치 전력 예측 중 오류 발생: {str(e)}")
+
+def _predict_ml_rows(features):
+    """
+    머신러닝 모델 배치 예측 (마이크로 배처에서 호출)
+
+    Args:
+        features (np.ndarray): 특성 행렬 (행 수, 8)
+
+    Returns:
+        tuple: (풍력 발전량 배열, 지압 발전량 배열) (Wh)
     """
-    머신러닝 모델을 사용한 전력 발전량 예측
+    model = get_power_prediction_model()
+    if model is None:
+        raise ValueError("전력 예측 모델이 준비되지 않았습니다.")
+    wind_model = model.get("wind_model")
+    piezo_model = model.get("piezo_model")
+    
+    if not wind_model or not piezo_model:
+        raise ValueError("모델이 올바르게 로드되지 않았습니다.")
+    
+    # 컴파일된 트리 모델이 있으면 평면 배열 순회로 예측 (sklearn과 같은 값)
+    compiled_models = model.get("compiled_models", {})
+    wind_model = compiled_models.get("wind_model", wind_model)
+    piezo_model = compiled_models.get("piezo_model", piezo_model)
+    
+    return wind_model.predict(features), piezo_model.predict(features)
+
+# 머신러닝 추론 마이크로 배처 (동시 요청을 ML_BATCH_WINDOW_MS 동안 또는 ML_BATCH_MAX_ROWS 행까지 모아 ml 계산 풀에서 한 번에 예측)
+ml_batcher = InferenceBatcher(_predict_ml_rows, executor_run=lambda fn, *args: compute_pools.run('ml_predict', fn, *args))
+
+async def predict_power_with_ml(location, wind_speed, temperature, humidity, hour, people_count):
+    """
+    머신러닝 모델을 사용한 전력 발전량 예측 (동시 요청은 마이크로 배치로 함께 예측)
     
     Args:
         location (str): 위치
@@ -618,8 +890,16 @@ def predict_power_with_ml(location, wind_speed, temperature, humidity, hour, peo
         tuple: (풍력 발전량, 지압 발전량) (Wh)
     """
     try:
-        # 모델 로드
+        # 준비된 모델 조회 (준비 중이면 기본 계산식으로 대체)
         model = get_power_prediction_model()
+        if model is None:
+            print("전력 예측 모델 준비 중 - 기본 계산식으로 대체")
+            return None, None
+        
+        # 격자 대리 모델이 준비되었으면 보간으로 바로 계산 (측정 오차: /api/power/ml-surrogate)
+        surrogate = model_warmup.get("power_surrogate") if USE_ML_SURROGATE else None
+        if surrogate is not None and location in surrogate.tables:
+            return surrogate.predict(location, wind_speed, temperature, humidity, hour, people_count)
         
         # 위치 인코딩
         location_encoding = model.get("location_encodings", {}).get(location)
@@ -643,17 +923,8 @@ def predict_power_with_ml(location, wind_speed, temperature, humidity, hour, peo
         ]
         features.extend(location_encoding)
         
-        # 모델 예측
-        # 수정: model['features'] 대신 모델 구조 확인
-        wind_model = model.get("wind_model")
-        piezo_model = model.get("piezo_model")
-        
-        if not wind_model or not piezo_model:
-            raise ValueError("모델이 올바르게 로드되지 않았습니다.")
-        
-        # 예측 수행
-        wind_power = wind_model.predict([features])[0]
-        piezo_power = piezo_model.predict([features])[0]
+        # 예측 수행 (배치에 추가 후 결과 대기)
+        wind_power, piezo_power = await ml_batcher.predict(features)
         
         return float(wind_power), float(piezo_power)
     
@@ -663,10 +934,81 @@ def predict_power_with_ml(location, wind_speed, temperature, humidity, hour, peo
         
         # 에러 발생 시 기본 계산 방식으로 계산 - 기본값 반환
         return None, None
+
+def monthly_power_result(location, avg_wind_speed, min_temp, max_temp, detail, format):
+    """
+    월간 발전량 예측 결과 (JSON 변환 가능 형태, 월간 엔드포인트와 구체화 뷰에서 공용)
+
+    Returns:
+        dict: 월간 예측 결과
+    """
+    # 주별 풍속 생성 (평균 풍속에서 약간의 변동 추가)
+    weekly_wind_speeds = [
+        avg_wind_speed * (1 + 0.05 * (i - 1.5)) for i in range(4)  # 4주
+    ]
+    
+    # 온도 정보 설정
+    temp_info = {
+        'min': min_temp,
+        'max': max_temp,
+        'current': (min_temp + max_temp) / 2  # 평균 기온
+    }
+    
+    result = power_calculator.predict_monthly_power(
+        location, weekly_wind_speeds, None, temp_info, detail=detail, columnar=(format == 'columnar')
+    )
+    return jsonable_power_result(result)
+
+def annual_power_result(location, avg_wind_speed, detail, format):
+    """
+    연간 발전량 예측 결과 (월 4주 기준, JSON 변환 가능 형태)
+
+    Returns:
+        dict: 연간 예측 결과
+    """
+    monthly_wind_speeds = [avg_wind_speed * factor for factor in power_calculator.monthly_wind_factors]
+    result = power_calculator.predict_annual_power(location, monthly_wind_speeds, detail=detail, columnar=(format == 'columnar'))
+    return jsonable_power_result(result)
+
+def calendar_year_power_result(location, year, avg_wind_speed, detail, format):
+    """
+    실제 달력 기준 연간 발전량 예측 결과 (JSON 변환 가능 형태, 연간 엔드포인트와 구체화 뷰에서 공용)
+
+    Returns:
+        dict: 연간 예측 결과
+    """
+    result = power_calculator.predict_calendar_year_power(location, year, avg_wind_speed, detail=detail)
+    if format == 'records' and 'hourly_series' in result:
+        result['hourly_results'] = result.pop('hourly_series').to_records()
+    return jsonable_power_result(result)
+
+def _materialized_body(result_fn, *args):
+    """예측 결과 → 엔드포인트 응답과 같은 JSON 본문 (bytes)"""
+    return JSONResponse(content=jsonable_encoder(result_fn(*args))).body
+
+def _current_year_body(location):
+    """올해(한국 시간 기준) 연간 대시보드 응답 본문"""
+    year = datetime.now(KOREA_TIMEZONE).year
+    return _materialized_body(calendar_year_power_result, location, year,
+                              MATERIALIZED_WIND_SPEED, MATERIALIZED_ANNUAL_DETAIL, MATERIALIZED_FORMAT)
+
+def _register_materialized_views():
+    """위치별 연간/월간 대시보드 조회 뷰 등록"""
+    for location in SUPPORTED_LOCATIONS:
+        materialized_views.register(f"annual/{location}", functools.partial(_current_year_body, location))
+        materialized_views.register(
+            f"monthly/{location}",
+            functools.partial(_materialized_body, monthly_power_result, location, MATERIALIZED_WIND_SPEED,
+                              MATERIALIZED_MIN_TEMP, MATERIALIZED_MAX_TEMP, MATERIALIZED_MONTHLY_DETAIL, MATERIALIZED_FORMAT)
+        )
+
+_register_materialized_views()
+
 @router.get("/daily/{location}")
 async def predict_daily_power(
     location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
-    avg_wind_speed: float = Query(3.5, description="평균 풍속 (m/s)")
+    avg_wind_speed: float = Query(3.5, description="평균 풍속 (m/s)"),
+    format: str = Query("records", description="시간별 결과 형식 (records, columnar)")
 ):
     """
     일일 전력 발전량 예측
@@ -676,42 +1018,22 @@ async def predict_daily_power(
         if location not in SUPPORTED_LOCATIONS:
             raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
         
-        # 시간별 풍속 생성 (간단한 모델)
-        hourly_wind_speeds = []
-        for hour in range(24):
-            # 시간에 따른 풍속 변동 모델 (0-6시: -20%, 6-12시: 기준, 12-18시: +20%, 18-24시: 기준)
-            if 0 <= hour < 6:
-                hourly_wind_speeds.append(avg_wind_speed * 0.8)
-            elif 6 <= hour < 12:
-                hourly_wind_speeds.append(avg_wind_speed)
-            elif 12 <= hour < 18:
-                hourly_wind_speeds.append(avg_wind_speed * 1.2)
-            else:
-                hourly_wind_speeds.append(avg_wind_speed)
-        
-        # 시간별 인원 수 생성 (간단한 모델)
-        avg_hourly_people = power_calculator.piezo_tile_settings[location]['avg_hourly_people']
-        hourly_people_counts = []
-        
-        for hour in range(24):
-            # 시간에 따른 인원 수 변동 모델
-            if 0 <= hour < 6:  # 심야
-                hourly_people_counts.append(int(avg_hourly_people * 0.1))
-            elif 6 <= hour < 9:  # 아침침
-                hourly_people_counts.append(int(avg_hourly_people * 1.2))
-            elif 9 <= hour < 12:  # 오전
-                hourly_people_counts.append(int(avg_hourly_people * 1.5))
-            elif 12 <= hour < 14:  # 점심
-                hourly_people_counts.append(int(avg_hourly_people * 1.8))
-            elif 14 <= hour < 18:  # 오후
-                hourly_people_counts.append(int(avg_hourly_people * 1.2))
-            elif 18 <= hour < 21:  # 저녁
-                hourly_people_counts.append(int(avg_hourly_people * 0.8))
-            else:  # 야간
-                hourly_people_counts.append(int(avg_hourly_people * 0.3))
-        
-        # 일일 발전량 예측
-        result = power_calculator.predict_daily_power(location, hourly_wind_speeds, hourly_people_counts)
+        # 결과 형식 유효성 검사
+        if format not in RESULT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 결과 형식: {format}. 지원되는 형식: {list(RESULT_FORMATS)}")
+        
+        # 시간별 풍속 및 인원 수 (시간대별 변동 프로파일)
+        hourly_wind_speeds = power_calculator.diurnal_profiles.wind_speeds(avg_wind_speed)
+        hourly_people_counts = power_calculator.diurnal_profiles.people_counts(location, 'daily').tolist()
+        
+        # 일일 발전량 예측 (계산 풀에서 실행)
+        result = await compute_pools.run(
+            'daily', power_calculator.predict_daily_power,
+            location, hourly_wind_speeds, hourly_people_counts, columnar=(format == 'columnar')
+        )
+        
+        if format == 'columnar':
+            return jsonable_power_result(result)
         
         # 시간별 결과 보강
         for i, hourly_result in enumerate(result['hourly_results']):
@@ -730,7 +1052,9 @@ async def predict_daily_power(
 @router.get("/weekly/{location}")
 async def predict_weekly_power(
     location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
-    avg_wind_speed: float = Query(3.5, description="평균 풍속 (m/s)")
+    avg_wind_speed: float = Query(3.5, description="평균 풍속 (m/s)"),
+    detail: str = Query("hour", description="결과 상세 수준 (summary, month, week, day, hour)"),
+    format: str = Query("records", description="시간별 결과 형식 (records, columnar)")
 ):
     """
     주간 전력 발전량 예측
@@ -740,6 +1064,14 @@ async def predict_weekly_power(
         if location not in SUPPORTED_LOCATIONS:
             raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
         
+        # 상세 수준 유효성 검사
+        if detail not in DETAIL_LEVELS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 상세 수준: {detail}. 지원되는 수준: {list(DETAIL_LEVELS)}")
+        
+        # 결과 형식 유효성 검사
+        if format not in RESULT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 결과 형식: {format}. 지원되는 형식: {list(RESULT_FORMATS)}")
+        
         # 일별 풍속 생성 (간단한 변동)
         daily_wind_speeds = []
         for day in range(7):
@@ -747,10 +1079,13 @@ async def predict_weekly_power(
             variation = 0.1 * np.sin(day * np.pi / 3.5)
             daily_wind_speeds.append(avg_wind_speed * (1 + variation))
         
-        # 주간 발전량 예측
-        result = power_calculator.predict_weekly_power(location, daily_wind_speeds)
+        # 주간 발전량 예측 (계산 풀에서 실행)
+        result = await compute_pools.run(
+            'weekly', power_calculator.predict_weekly_power,
+            location, daily_wind_speeds, detail=detail, columnar=(format == 'columnar')
+        )
         
-        return result
+        return jsonable_power_result(result)
     
     except HTTPException:
         raise
@@ -765,7 +1100,9 @@ async def predict_monthly_power(
     location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
     avg_wind_speed: float = Query(3.5, description="평균 풍속 (m/s)"),
     min_temp: float = Query(5.0, description="최저 기온 (°C)"),
-    max_temp: float = Query(25.0, description="최고 기온 (°C)")
+    max_temp: float = Query(25.0, description="최고 기온 (°C)"),
+    detail: str = Query("hour", description="결과 상세 수준 (summary, month, week, day, hour)"),
+    format: str = Query("records", description="시간별 결과 형식 (records, columnar)")
 ):
     """
     월간 전력 발전량 예측
@@ -775,22 +1112,23 @@ async def predict_monthly_power(
         if location not in SUPPORTED_LOCATIONS:
             raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
         
-        # 주별 풍속 생성 (평균 풍속에서 약간의 변동 추가)
-        weekly_wind_speeds = [
-            avg_wind_speed * (1 + 0.05 * (i - 1.5)) for i in range(4)  # 4주
-        ]
+        # 상세 수준 유효성 검사
+        if detail not in DETAIL_LEVELS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 상세 수준: {detail}. 지원되는 수준: {list(DETAIL_LEVELS)}")
         
-        # 온도 정보 설정
-        temp_info = {
-            'min': min_temp,
-            'max': max_temp,
-            'current': (min_temp + max_temp) / 2  # 평균 기온
-        }
+        # 결과 형식 유효성 검사
+        if format not in RESULT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 결과 형식: {format}. 지원되는 형식: {list(RESULT_FORMATS)}")
         
-        # 월간 발전량 예측
-        result = power_calculator.predict_monthly_power(location, weekly_wind_speeds, None, temp_info)
+        # 대시보드 조회 조건이면 미리 계산된 응답 반환
+        if (avg_wind_speed, min_temp, max_temp, detail, format) == \
+                (MATERIALIZED_WIND_SPEED, MATERIALIZED_MIN_TEMP, MATERIALIZED_MAX_TEMP, MATERIALIZED_MONTHLY_DETAIL, MATERIALIZED_FORMAT):
+            body = materialized_views.get(f"monthly/{location}")
+            if body is not None:
+                return Response(content=body, media_type="application/json")
         
-        return result
+        # 월간 발전량 예측 (계산 풀에서 실행)
+        return await compute_pools.run('monthly', monthly_power_result, location, avg_wind_speed, min_temp, max_temp, detail, format)
     
     except HTTPException:
         raise
@@ -802,7 +1140,11 @@ async def predict_monthly_power(
 # 추가된 연간 발전량 예측 엔드포인트
 @router.get("/annual/{location}")
 async def predict_annual_power(
-    location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)")
+    location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
+    avg_wind_speed: float = Query(3.5, description="연평균 기준 풍속 (m/s, 월별 계절 계수 적용)"),
+    year: Optional[int] = Query(None, ge=1900, le=2200, description="연도 (지정 시 실제 달력 기준 8,760시간 계산)"),
+    detail: str = Query("hour", description="결과 상세 수준 (summary, month, week, day, hour)"),
+    format: str = Query("records", description="시간별 결과 형식 (records, columnar)")
 ):
     """
     연간 전력 발전량 예측
@@ -812,10 +1154,27 @@ async def predict_annual_power(
         if location not in SUPPORTED_LOCATIONS:
             raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
         
-        # 연간 발전량 예측
-        result = power_calculator.predict_annual_power(location)
+        # 상세 수준 유효성 검사
+        if detail not in DETAIL_LEVELS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 상세 수준: {detail}. 지원되는 수준: {list(DETAIL_LEVELS)}")
         
-        return result
+        # 결과 형식 유효성 검사
+        if format not in RESULT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 결과 형식: {format}. 지원되는 형식: {list(RESULT_FORMATS)}")
+        
+        if year is not None:
+            # 대시보드 조회 조건(올해)이면 미리 계산된 응답 반환
+            if (year, avg_wind_speed, detail, format) == \
+                    (datetime.now(KOREA_TIMEZONE).year, MATERIALIZED_WIND_SPEED, MATERIALIZED_ANNUAL_DETAIL, MATERIALIZED_FORMAT):
+                body = materialized_views.get(f"annual/{location}")
+                if body is not None:
+                    return Response(content=body, media_type="application/json")
+            
+            # 실제 달력 기준 연간 발전량 예측 (시간별 dict 변환까지 계산 풀에서 실행)
+            return await compute_pools.run('annual', calendar_year_power_result, location, year, avg_wind_speed, detail, format)
+        
+        # 연간 발전량 예측 (월 4주 기준, 계산 풀에서 실행)
+        return await compute_pools.run('annual', annual_power_result, location, avg_wind_speed, detail, format)
     
     except HTTPException:
         raise
@@ -824,6 +1183,345 @@ async def predict_annual_power(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"연간 전력 예측 중 오류 발생: {str(e)}")
 
+@router.get("/fleet")
+async def predict_fleet_power(
+    avg_wind_speed: float = Query(3.5, description="평균 풍속 (m/s)"),
+    days: int = Query(1, ge=1, le=366, description="예측 일수"),
+    min_temp: Optional[float] = Query(None, description="최저 기온 (°C)"),
+    max_temp: Optional[float] = Query(None, description="최고 기온 (°C)"),
+    locations: Optional[str] = Query(None, description="쉼표로 구분한 위치 목록 (기본값: 전체 위치)"),
+    include_hourly: bool = Query(False, description="캠퍼스 시간별 합계 포함 여부")
+):
+    """
+    전체 위치 전력 발전량 예측 (캠퍼스 합계 + 위치별 결과를 한 번에 계산)
+    """
+    try:
+        # 위치 유효성 검사
+        if locations:
+            # 중복 위치 제거 (입력 순서 유지, 중복 시 캠퍼스 합계가 두 번 더해지지 않도록)
+            location_list = list(dict.fromkeys(location.strip() for location in locations.split(',') if location.strip()))
+            for location in location_list:
+                if location not in SUPPORTED_LOCATIONS:
+                    raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
+        else:
+            location_list = SUPPORTED_LOCATIONS
+        
+        # 시간별 풍속 생성 (시간대별 변동 모델을 일수만큼 반복)
+        hourly_wind_speeds = np.tile(power_calculator.diurnal_profiles.wind_speeds(avg_wind_speed), days)
+        
+        # 온도 정보 설정
+        temp_info = None
+        if min_temp is not None and max_temp is not None:
+            temp_info = {
+                'min': min_temp,
+                'max': max_temp,
+                'current': (min_temp + max_temp) / 2  # 평균 기온
+            }
+        
+        # 전체 위치 발전량 예측 (계산 풀에서 실행)
+        result = await compute_pools.run(
+            'fleet', power_calculator.predict_fleet_power,
+            hourly_wind_speeds, None, temp_info, locations=location_list, include_hourly=include_hourly
+        )
+        result['days'] = days
+        
+        return jsonable_power_result(result)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"전체 위치 전력 예측 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"전체 위치 전력 예측 중 오류 발생: {str(e)}")
+
+@router.get("/uncertainty/{location}")
+async def predict_power_uncertainty(
+    location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
+    avg_wind_speed: float = Query(3.5, gt=0, description="평균 풍속 (m/s)"),
+    days: int = Query(365, ge=1, le=366, description="예측 일수"),
+    samples: int = Query(1000, ge=10, le=10000, description="몬테카를로 표본 수"),
+    distribution: str = Query("weibull", description="일별 풍속 분포 (weibull, lognormal)"),
+    shape: float = Query(2.0, gt=0, description="분포 형상 계수 (weibull: k, lognormal: 로그 표준편차)"),
+    min_temp: Optional[float] = Query(None, description="최저 기온 (°C)"),
+    max_temp: Optional[float] = Query(None, description="최고 기온 (°C)"),
+    seed: Optional[int] = Query(None, description="난수 시드 (재현용)")
+):
+    """
+    몬테카를로 발전량 불확실성 분석 (P10/P50/P90 및 가로등 수요 충족 확률)
+    """
+    try:
+        # 위치 유효성 검사
+        if location not in SUPPORTED_LOCATIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
+        
+        # 분포 유효성 검사
+        if distribution not in WIND_DISTRIBUTIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 풍속 분포: {distribution}. 지원되는 분포: {list(WIND_DISTRIBUTIONS)}")
+        
+        # 온도 정보 설정
+        temp_info = None
+        if min_temp is not None and max_temp is not None:
+            temp_info = {
+                'min': min_temp,
+                'max': max_temp,
+                'current': (min_temp + max_temp) / 2  # 평균 기온
+            }
+        
+        return await compute_pools.run(
+            'uncertainty', power_calculator.predict_power_uncertainty,
+            location, avg_wind_speed, days, samples, distribution, shape, temp_info, seed
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"발전량 불확실성 분석 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"발전량 불확실성 분석 중 오류 발생: {str(e)}")
+
+@router.get("/backcast")
+async def get_power_backcast(
+    start_date: Optional[str] = Query(None, description="시작일 (YYYY-MM-DD, 기본값: 관측 시작일)"),
+    end_date: Optional[str] = Query(None, description="종료일 (YYYY-MM-DD, 기본값: 관측 종료일)"),
+    location: Optional[str] = Query(None, description="위치 (기본값: 전체 위치)"),
+    resolution: str = Query("day", description="집계 단위 (day, week, month, year)")
+):
+    """
+    관측 기상 데이터(풍속/기온 CSV) 기반 과거 발전량 조회
+    """
+    try:
+        # 위치 유효성 검사
+        if location is not None and location not in SUPPORTED_LOCATIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
+        
+        # 집계 단위 유효성 검사
+        if resolution not in BACKCAST_RESOLUTIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 집계 단위: {resolution}. 지원되는 단위: {list(BACKCAST_RESOLUTIONS)}")
+        
+        # 날짜 형식 검사
+        for date_str in (start_date, end_date):
+            if date_str is not None:
+                try:
+                    datetime.strptime(date_str, "%Y-%m-%d")
+                except ValueError:
+                    raise HTTPException(status_code=400, detail=f"잘못된 날짜 형식: {date_str}. YYYY-MM-DD 형식이어야 합니다.")
+        
+        try:
+            result = await compute_pools.run(
+                'backcast', power_backcaster.query,
+                start_date, end_date, [location] if location else SUPPORTED_LOCATIONS, resolution
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        result['available_range'] = power_backcaster.date_range()
+        return result
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"과거 발전량 조회 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"과거 발전량 조회 중 오류 발생: {str(e)}")
+
+@router.get("/expected/{location}")
+async def predict_expected_energy(
+    location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
+    avg_wind_speed: float = Query(3.5, gt=0, description="연평균 기준 풍속 (m/s, 월별 계절 계수 적용)"),
+    shape: float = Query(2.0, gt=0, description="Weibull 형상 계수 k"),
+    year: Optional[int] = Query(None, ge=1900, le=2200, description="연도 (지정 시 실제 월별 일수)"),
+    source: str = Query("weibull", description="풍속 분포 (weibull: 매개변수 분포, archive: 관측 데이터 월별 히스토그램)")
+):
+    """
+    풍속 분포 적분 기반 연간/월간 기대 발전량
+    """
+    try:
+        # 위치 유효성 검사
+        if location not in SUPPORTED_LOCATIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
+        
+        if source not in ('weibull', 'archive'):
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 풍속 분포: {source}. 지원되는 분포: ['weibull', 'archive']")
+        
+        def expected_energy():
+            monthly_histograms = power_backcaster.monthly_wind_histograms() if source == 'archive' else None
+            return power_calculator.predict_expected_energy(location, avg_wind_speed, shape, year, monthly_histograms)
+        
+        return await compute_pools.run('expected', expected_energy)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"기대 발전량 계산 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"기대 발전량 계산 중 오류 발생: {str(e)}")
+
+@router.get("/stream/{location}")
+async def stream_hourly_power(
+    location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
+    start_date: str = Query(..., description="시작일 (YYYY-MM-DD, 포함)"),
+    end_date: str = Query(..., description="종료일 (YYYY-MM-DD, 제외)"),
+    block: str = Query("month", description="블록 단위 (day, week, month, year)"),
+    avg_wind_speed: float = Query(3.5, gt=0, description="연평균 기준 풍속 (m/s, 월별 계절 계수 적용)"),
+    format: str = Query("columnar", description="블록 형식 (columnar: 열 배열, records: 시간별 dict 목록)")
+):
+    """
+    장기간 시간별 발전량 스트리밍 (NDJSON - 블록당 한 줄, 계산되는 대로 전송)
+    """
+    try:
+        # 위치 유효성 검사
+        if location not in SUPPORTED_LOCATIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
+        
+        # 블록 단위 유효성 검사
+        if block not in STREAM_BLOCKS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 블록 단위: {block}. 지원되는 단위: {list(STREAM_BLOCKS)}")
+        
+        if format not in RESULT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 결과 형식: {format}. 지원되는 형식: {list(RESULT_FORMATS)}")
+        
+        # 인자 검사는 스트리밍 시작 전에 수행 (응답 시작 후에는 상태 코드를 바꿀 수 없음)
+        try:
+            blocks = power_calculator.iter_hourly_blocks(location, start_date, end_date, block, avg_wind_speed)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        def generate_lines():
+            for series in blocks:
+                if format == 'records':
+                    line = {
+                        'location': location,
+                        'block_start': series.metadata['block_start'],
+                        'block_end': series.metadata['block_end'],
+                        'hourly_results': series.to_records()
+                    }
+                else:
+                    line = series.to_dict()
+                yield json.dumps(jsonable_power_result(line), ensure_ascii=False) + "\n"
+        
+        return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"시간별 발전량 스트리밍 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"시간별 발전량 스트리밍 중 오류 발생: {str(e)}")
+
+@router.post("/design-sweep")
+async def sweep_design_parameters(request: DesignSweepRequest):
+    """
+    설계 변수(count, area, efficiency, tiles_count) 격자 스윕 - 파레토 집합 및 수요 충족 최소 구성
+    """
+    try:
+        # 위치 유효성 검사
+        if request.location not in SUPPORTED_LOCATIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {request.location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
+        
+        grids = {
+            name: values for name, values in (
+                ('count', request.count), ('area', request.area),
+                ('efficiency', request.efficiency), ('tiles_count', request.tiles_count)
+            ) if values is not None
+        }
+        
+        try:
+            result = await compute_pools.run(
+                'design_sweep', design_sweeper.sweep,
+                request.location, grids, request.year, request.avg_wind_speed, request.cost_weights
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        result['pareto_count'] = len(result['pareto_configs'])
+        if request.max_pareto_configs is not None:
+            result['pareto_configs'] = result['pareto_configs'][:max(0, request.max_pareto_configs)]
+        
+        return result
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"설계 변수 스윕 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"설계 변수 스윕 중 오류 발생: {str(e)}")
+
+@router.get("/power-curve")
+async def get_power_curve_table():
+    """
+    풍력 출력 곡선 조회표 상태 (사용 여부, 격자, 사이트별 최대 보간 오차)
+    """
+    try:
+        table = power_calculator.power_curve_table()
+        
+        return {
+            "enabled": power_calculator.use_power_curve_table,
+            "settings_version": power_calculator.settings_version,
+            "speed_step": table.speed_step,
+            "max_speed": float(table.speeds[-1]),
+            "grid_shape": list(table.table.shape),
+            "max_error": table.error_report(power_calculator.site_registry.names)
+        }
+    
+    except Exception as e:
+        print(f"출력 곡선 조회표 조회 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"출력 곡선 조회표 조회 중 오류 발생: {str(e)}")
+
+@router.get("/ml-surrogate")
+async def get_ml_surrogate_info():
+    """
+    ML 격자 대리 모델 상태 (사용 여부, 격자 범위, 실제 모델 대비 측정 최대/평균 오차)
+    """
+    try:
+        if not USE_ML_SURROGATE:
+            return {"enabled": False}
+        
+        surrogate = model_warmup.get("power_surrogate")
+        info = {"enabled": True, "state": model_warmup.status()["power_surrogate"]["state"]}
+        if surrogate is not None:
+            info.update(surrogate.summary())
+        return info
+    
+    except Exception as e:
+        print(f"ML 대리 모델 조회 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"ML 대리 모델 조회 중 오류 발생: {str(e)}")
+
+@router.get("/materialized")
+async def get_materialized_views():
+    """
+    구체화 뷰 상태 (뷰별 계산 시간, 계산 시각, 경과 시간, 최신 여부)
+    """
+    try:
+        return materialized_views.status()
+    
+    except Exception as e:
+        print(f"구체화 뷰 조회 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"구체화 뷰 조회 중 오류 발생: {str(e)}")
+
+@router.get("/realtime/{location}/energy")
+async def get_realtime_energy(
+    location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
+):
+    """
+    실시간 누적 발전량 조회 (오늘/이번 주/이번 달, 한국 시간 자정 기준 초기화 - 재계산 없음)
+    """
+    try:
+        # 위치 유효성 검사
+        if location not in SUPPORTED_LOCATIONS:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 위치: {location}. 지원되는 위치: {SUPPORTED_LOCATIONS}")
+        
+        return energy_accumulator.state(location)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"실시간 누적 발전량 조회 오류: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"실시간 누적 발전량 조회 중 오류 발생: {str(e)}")
+
 @router.get("/realtime/{location}")
 async def predict_realtime_power(
     location: str = Path(..., description="위치 (5호관_60주년_사이, 인경호_앞, 하이데거숲)"),
@@ -850,30 +1548,17 @@ async def predict_realtime_power(
             # 현재 습도
             humidity = weather_data.get('weather', {}).get('humidity', 60.0)
             
-            # 현재 시간
-            current_hour = datetime.now().hour
+            # 현재 시간 (한국 시간 기준 - 인원 수 변동 프로파일, ML 시간 특성, 실시간 누적에 같은 시각 사용)
+            now = datetime.now(KOREA_TIMEZONE)
+            current_hour = now.hour
             
-            # 시간에 따른 인원 수 조정
-            avg_hourly_people = power_calculator.piezo_tile_settings[location]['avg_hourly_people']
-            if 0 <= current_hour < 6:  # 심야
-                people_count = int(avg_hourly_people * 0.1)
-            elif 6 <= current_hour < 9:  # 출근 시간
-                people_count = int(avg_hourly_people * 1.2)
-            elif 9 <= current_hour < 12:  # 오전
-                people_count = int(avg_hourly_people * 1.5)
-            elif 12 <= current_hour < 14:  # 점심
-                people_count = int(avg_hourly_people * 1.8)
-            elif 14 <= current_hour < 18:  # 오후
-                people_count = int(avg_hourly_people * 1.2)
-            elif 18 <= current_hour < 21:  # 저녁
-                people_count = int(avg_hourly_people * 0.8)
-            else:  # 야간
-                people_count = int(avg_hourly_people * 0.3)
+            # 시간에 따른 인원 수 (시간대별 변동 프로파일)
+            people_count = power_calculator.diurnal_profiles.people_count(location, current_hour, 'daily')
             
             # 머신러닝 기반 예측 시도
             try:
                 # 여기에서 predict_power_with_ml 함수를 수정된 인자로 호출
-                ml_wind_power, ml_piezo_power = predict_power_with_ml(
+                ml_wind_power, ml_piezo_power = await predict_power_with_ml(
                     location=location, 
                     wind_speed=wind_speed, 
                     temperature=temperature, 
@@ -904,10 +1589,13 @@ async def predict_realtime_power(
                 print(f"머신러닝 예측 오류 (기본 방식으로 대체): {e}")
                 result = power_calculator.calculate_total_power(location, wind_speed, people_count, 1)
             
+            # 실시간 누적 (1시간 발전량 Wh = 평균 출력 W)
+            energy_accumulator.ingest(location, now, result['wind_power_wh'], result['piezo_power_wh'])
+            
             # 날씨 정보 추가
             result['weather'] = weather_data.get('weather', {})
             result['current_hour'] = current_hour
-            result['prediction_time'] = datetime.now().isoformat()
+            result['prediction_time'] = now.isoformat()
             
             return result
             
@@ -916,26 +1604,13 @@ async def predict_realtime_power(
             print(f"기상청 API 호출 오류: {e}")
             traceback.print_exc()
             
-            # 기본 풍속 및 시간 설정
+            # 기본 풍속 및 시간 설정 (한국 시간 기준)
             wind_speed = 3.0
-            current_hour = datetime.now().hour
+            now = datetime.now(KOREA_TIMEZONE)
+            current_hour = now.hour
             
-            # 시간에 따른 인원 수 조정
-            avg_hourly_people = power_calculator.piezo_tile_settings[location]['avg_hourly_people']
-            if 0 <= current_hour < 6:  # 심야
-                people_count = int(avg_hourly_people * 0.1)
-            elif 6 <= current_hour < 9:  # 출근 시간
-                people_count = int(avg_hourly_people * 1.5)
-            elif 9 <= current_hour < 12:  # 오전
-                people_count = int(avg_hourly_people * 1.2)
-            elif 12 <= current_hour < 14:  # 점심
-                people_count = int(avg_hourly_people * 1.8)
-            elif 14 <= current_hour < 18:  # 오후
-                people_count = int(avg_hourly_people * 1.2)
-            elif 18 <= current_hour < 21:  # 저녁
-                people_count = int(avg_hourly_people * 0.8)
-            else:  # 야간
-                people_count = int(avg_hourly_people * 0.3)
+            # 시간에 따른 인원 수 (시간대별 변동 프로파일)
+            people_count = power_calculator.diurnal_profiles.people_count(location, current_hour, 'daily')
             
             # 발전량 계산
             result = power_calculator.calculate_total_power(location, wind_speed, people_count, 1)
@@ -947,7 +1622,7 @@ async def predict_realtime_power(
                 'windSpeed': wind_speed
             }
             result['current_hour'] = current_hour
-            result['prediction_time'] = datetime.now().isoformat()
+            result['prediction_time'] = now.isoformat()
             result['api_error'] = str(e)
             
             return result
@@ -0,0 +1,239 @@
+"""
+시간별 발전량 열(column) 기반 결과 모듈
+- 항목별 NumPy 배열 하나와 위치/메타데이터 한 벌로 시간별 결과를 표현
+- 반올림은 직렬화 시점에만 적용
+- 기존 시간별 dict 목록(hourly_results)은 to_records()로 변환 가능
+"""
+import math
+import numpy as np
+
+# 시간별 결과 형식 (records: 시간별 dict 목록, columnar: 열 배열)
+RESULT_FORMATS = ('records', 'columnar')
+
+
+def round_like_python(values, ndigits=2):
+    """
+    NumPy 배열을 파이썬 내장 round()와 같은 규칙으로 반올림
+
+    np.round는 x * 10^n 곱셈 오차 때문에 .5 경계에서 round()와 결과가 달라질 수 있으므로,
+    곱셈 오차를 정확히 계산(Dekker 분할)하여 경계값만 보정합니다.
+
+    Args:
+        values (array-like): 반올림할 값
+        ndigits (int): 소수점 자릿수
+
+    Returns:
+        np.ndarray: 반올림된 값
+    """
+    values = np.asarray(values, dtype=float)
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+
+    # 곱셈 오차 (정확한 곱 - scaled)
+    splitter = 134217729.0  # 2^27 + 1
+    c = splitter * values
+    values_hi = c - (c - values)
+    values_lo = values - values_hi
+    c = splitter * scale
+    scale_hi = c - (c - scale)
+    scale_lo = scale - scale_hi
+    error = ((values_hi * scale_hi - scaled) + values_hi * scale_lo + values_lo * scale_hi) + values_lo * scale_lo
+
+    # rint는 .5에서 짝수 쪽으로 반올림하므로 정확한 값이 경계를 벗어난 경우만 보정
+    rounded = np.rint(scaled)
+    fraction = scaled - rounded
+    rounded = rounded + ((fraction == 0.5) & (error > 0)) - ((fraction == -0.5) & (error < 0))
+
+    return rounded / scale
+
+
+# 직렬화 시 열별 소수점 자릿수 (None = 반올림하지 않음)
+COLUMN_DECIMALS = {
+    'wind_speed': None,
+    'adjusted_wind_speed': 2,
+    'people_count': None,
+    'wind_power_wh': 2,
+    'piezo_power_wh': 2,
+    'total_power_wh': 2,
+    'streetlight_consumption_wh': 2,
+    'power_balance_wh': 2,
+    'sufficiency_percentage': 1,
+    'current_temp': None,
+    'min_temp': None,
+    'max_temp': None
+}
+
+
+class HourlyPowerSeries:
+    """
+    시간별 발전량 열 기반 결과
+
+    Attributes:
+        location (str): 위치명
+        columns (dict): 항목명 → NumPy 배열 (모든 배열 길이 동일)
+        metadata (dict): 시리즈 전체에 공통인 정보 (wind_factor, hours, temperature_info 등)
+    """
+
+    def __init__(self, location, columns, metadata=None):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"모든 열의 길이가 같아야 합니다: {lengths}")
+
+        self.location = location
+        self.columns = columns
+        self.metadata = metadata or {}
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def total(self, name):
+        """
+        열 합계 (반올림 없음)
+
+        Args:
+            name (str): 열 이름
+
+        Returns:
+            float: 합계
+        """
+        return float(np.sum(self.columns[name]))
+
+    def slice(self, start, stop):
+        """
+        [start, stop) 구간의 시리즈 반환 (배열은 복사하지 않음)
+
+        Args:
+            start (int): 시작 인덱스
+            stop (int): 종료 인덱스
+
+        Returns:
+            HourlyPowerSeries: 부분 시리즈
+        """
+        columns = {name: values[start:stop] for name, values in self.columns.items()}
+        return HourlyPowerSeries(self.location, columns, dict(self.metadata))
+
+    def to_dict(self):
+        """
+        JSON 직렬화용 열 배열 dict (이 시점에 열별 자릿수로 반올림)
+
+        Returns:
+            dict: {'location', 'format', 'length', 'metadata', 'columns'}
+        """
+        columns = {}
+        for name, values in self.columns.items():
+            decimals = COLUMN_DECIMALS.get(name)
+            if values.dtype == bool:
+                columns[name] = values.tolist()
+            elif decimals is None:
+                columns[name] = _nan_to_none(values)
+            else:
+                columns[name] = _nan_to_none(round_like_python(values, decimals))
+
+        return {
+            'location': self.location,
+            'format': 'columnar',
+            'length': len(self),
+            'metadata': self.metadata,
+            'columns': columns
+        }
+
+    def to_records(self):
+        """
+        기존 hourly_results와 같은 시간별 dict 목록으로 변환
+        (calculate_total_power 결과 + 'hour' 키, 반올림 규칙 동일)
+
+        Returns:
+            list: 시간별 결과 dict 목록
+        """
+        hours = self.metadata.get('hours', 1)
+        wind_factor = self.metadata.get('wind_factor')
+        column_lists = {name: values.tolist() for name, values in self.columns.items()}
+
+        records = []
+        for i in range(len(self)):
+            row = {name: values[i] for name, values in column_lists.items()}
+
+            total_power = row['total_power_wh']
+            streetlight_consumption = row['streetlight_consumption_wh']
+            people_count = row['people_count']
+            if float(people_count).is_integer():
+                people_count = int(people_count)
+            if float(streetlight_consumption).is_integer():
+                streetlight_consumption = int(streetlight_consumption)
+
+            records.append({
+                'location': self.location,
+                'hours': hours,
+                'wind_speed': row['wind_speed'],
+                'wind_factor': wind_factor,
+                'adjusted_wind_speed': round(row['adjusted_wind_speed'], 2),
+                'people_count': people_count,
+                'wind_power_wh': round(row['wind_power_wh'], 2),
+                'piezo_power_wh': round(row['piezo_power_wh'], 2),
+                'total_power_wh': round(total_power, 2),
+                'streetlight_consumption_wh': round(streetlight_consumption, 2),
+                'power_balance_wh': round(row['power_balance_wh'], 2),
+                'is_sufficient': bool(row['power_balance_wh'] >= 0),
+                'sufficiency_percentage': round((total_power / max(0.1, streetlight_consumption)) * 100, 1) if streetlight_consumption > 0 else float('inf'),
+                'temperature_info': _temperature_record(row, self.metadata.get('temperature_info')),
+                'hour': row['hour'] if 'hour' in row else i
+            })
+
+        return records
+
+
+def _nan_to_none(values):
+    """NaN/무한대를 None으로 바꾼 리스트 (JSON은 NaN/Infinity를 지원하지 않음)"""
+    values = np.asarray(values)
+    if values.dtype.kind == 'f' and not np.isfinite(values).all():
+        return [v if np.isfinite(v) else None for v in values.tolist()]
+    return values.tolist()
+
+
+def _temperature_record(row, temp_info=None):
+    """시리즈 공통 기온 정보 또는 행의 기온 열 → calculate_total_power의 temperature_info 형식"""
+    if temp_info:
+        temp_effect = {
+            'current_temp': temp_info.get('current'),
+            'min_temp': temp_info.get('min'),
+            'max_temp': temp_info.get('max')
+        }
+        if 'min' in temp_info and 'max' in temp_info:
+            temp_effect['temp_range'] = temp_info['max'] - temp_info['min']
+        return temp_effect
+
+    if 'current_temp' not in row:
+        return {}
+
+    values = {key: (None if row[key] != row[key] else row[key]) for key in ('current_temp', 'min_temp', 'max_temp')}
+    if all(value is None for value in values.values()):
+        return {}
+
+    if values['min_temp'] is not None and values['max_temp'] is not None:
+        values['temp_range'] = values['max_temp'] - values['min_temp']
+    return values
+
+
+def jsonable_power_result(result):
+    """
+    결과 dict/list 안의 HourlyPowerSeries를 열 배열 dict로 변환 (API 응답 직렬화용)
+    NaN/무한대 값(예: 가로등 소비량이 0인 시간의 충족률)은 None으로 변환
+
+    Args:
+        result: 예측 결과 (dict, list 또는 HourlyPowerSeries)
+
+    Returns:
+        JSON 직렬화 가능한 결과
+    """
+    if isinstance(result, HourlyPowerSeries):
+        return result.to_dict()
+    if isinstance(result, dict):
+        return {key: jsonable_power_result(value) for key, value in result.items()}
+    if isinstance(result, list):
+        return [jsonable_power_result(value) for value in result]
+    if isinstance(result, float) and not math.isfinite(result):
+        return None
+    return result
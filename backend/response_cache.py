@@ -0,0 +1,202 @@
+"""
+HTTP 조건부 캐시 모듈 - 결정적 GET 엔드포인트 응답 캐시 미들웨어
+- 경로, 정렬된 쿼리 파라미터, 설정 버전(+ 날짜)으로 ETag 생성 (같은 입력과 버전이면 같은 응답)
+- If-None-Match가 ETag와 일치하면 계산 없이 본문 없는 304 응답
+- 직렬화된 응답 본문을 프로세스 내 LRU에 보관 (본문 바이트 합계 기준 크기 제한, 초과 시 오래 사용하지 않은 항목부터 제거)
+- Cache-Control(max-age)을 함께 보내 nginx/브라우저도 캐시
+- 버전이 바뀌면(사이트 설정 변경, 날짜 변경) 이전 버전 항목을 모두 비움
+"""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qsl
+
+# 응답 캐시 사용 여부
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "1") == "1"
+
+# LRU 최대 본문 바이트 합계
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Cache-Control max-age (초)
+RESPONSE_CACHE_MAX_AGE = int(os.getenv("RESPONSE_CACHE_MAX_AGE", "60"))
+
+# 캐시 대상 경로 (접두사 일치, GET 요청만)
+CACHEABLE_PATHS = (
+    '/api/power/daily/',
+    '/api/power/weekly/',
+    '/api/power/monthly/',
+    '/api/power/annual/',
+    '/api/ess/daily-schedule/',
+    '/api/weather/wind-factors'
+)
+
+# 캐시 항목에 보관하는 응답 헤더
+STORED_HEADERS = (b'content-type',)
+
+
+def _etag_matches(header_value, etag, exists):
+    """
+    If-None-Match 헤더 값(쉼표 구분, 약한 ETag 포함)이 ETag와 일치하는지 여부
+
+    '*'는 캐시된 200 응답이 있을 때만 일치로 봄 (없는 리소스/오류 응답에 304를 보내지 않도록)
+    """
+    if header_value.strip() == '*':
+        return exists
+    for candidate in header_value.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    크기 제한 LRU 응답 캐시
+
+    Attributes:
+        max_bytes (int): 본문 바이트 합계 상한
+        stats (dict): hits, misses, not_modified, stores, evictions 횟수
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = RESPONSE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._version = None
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'not_modified': 0, 'stores': 0, 'evictions': 0}
+
+    def set_version(self, version):
+        """버전 변경 시 전체 항목 제거"""
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._entries.clear()
+                self._bytes = 0
+
+    def get(self, etag):
+        """
+        캐시 항목 조회 (조회 시 최근 사용으로 이동)
+
+        Returns:
+            tuple: (본문 바이트, 헤더 목록) 또는 None
+        """
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is not None:
+                self._entries.move_to_end(etag)
+            return entry
+
+    def put(self, etag, body, headers):
+        """캐시 항목 저장 (상한을 넘으면 오래 사용하지 않은 항목부터 제거, 상한보다 큰 본문은 저장하지 않음)"""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(etag, None)
+            if previous is not None:
+                self._bytes -= len(previous[0])
+            self._entries[etag] = (body, headers)
+            self._bytes += len(body)
+            self.stats['stores'] += 1
+            while self._bytes > self.max_bytes:
+                _, (evicted_body, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted_body)
+                self.stats['evictions'] += 1
+
+    def status(self):
+        """
+        캐시 상태
+
+        Returns:
+            dict: enabled, entries, bytes, max_bytes, max_age, 통계
+        """
+        with self._lock:
+            return {
+                'enabled': RESPONSE_CACHE_ENABLED,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'max_age': RESPONSE_CACHE_MAX_AGE,
+                **self.stats
+            }
+
+
+# 앱 전체 공용 응답 캐시
+response_cache = ResponseCache()
+
+
+class ResponseCacheMiddleware:
+    """
+    조건부 캐시 ASGI 미들웨어 (대상 경로의 GET 요청만 처리, 나머지는 그대로 전달)
+
+    Args:
+        app: ASGI 앱
+        version_fn (callable): 현재 버전 문자열 반환 함수
+        cache (ResponseCache, optional): 응답 캐시 (기본값: 공용 캐시)
+        paths (tuple, optional): 대상 경로 접두사 (기본값: CACHEABLE_PATHS)
+        max_age (int, optional): Cache-Control max-age (초)
+    """
+
+    def __init__(self, app, version_fn, cache=None, paths=None, max_age=None):
+        self.app = app
+        self.version_fn = version_fn
+        self.cache = response_cache if cache is None else cache
+        self.paths = CACHEABLE_PATHS if paths is None else tuple(paths)
+        self.max_age = RESPONSE_CACHE_MAX_AGE if max_age is None else max_age
+
+    def _etag(self, scope, version):
+        """(경로, 정렬된 쿼리 파라미터, 버전) → ETag"""
+        query = sorted(parse_qsl(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True))
+        key = repr((scope['path'], query, version)).encode('utf-8')
+        return '"' + hashlib.sha1(key).hexdigest() + '"'
+
+    async def __call__(self, scope, receive, send):
+        if not RESPONSE_CACHE_ENABLED or scope['type'] != 'http' or scope['method'] != 'GET' \
+                or not scope['path'].startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        version = self.version_fn()
+        self.cache.set_version(version)
+        etag = self._etag(scope, version)
+        cache_headers = [(b'etag', etag.encode('latin-1')), (b'cache-control', f"public, max-age={self.max_age}".encode('latin-1'))]
+
+        # 클라이언트가 같은 ETag를 가지고 있으면 본문 없이 304
+        entry = self.cache.get(etag)
+        if_none_match = dict(scope['headers']).get(b'if-none-match')
+        if if_none_match is not None and _etag_matches(if_none_match.decode('latin-1'), etag, entry is not None):
+            self.cache.stats['not_modified'] += 1
+            await send({'type': 'http.response.start', 'status': 304, 'headers': cache_headers})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        if entry is not None:
+            self.cache.stats['hits'] += 1
+            body, headers = entry
+            await send({
+                'type': 'http.response.start', 'status': 200,
+                'headers': headers + [(b'content-length', str(len(body)).encode('latin-1'))] + cache_headers
+            })
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        # 계산 후 200 응답만 본문을 모아 저장 (오류 응답은 캐시/ETag 없이 그대로 전달)
+        self.cache.stats['misses'] += 1
+        response = {'status': None, 'headers': [], 'chunks': []}
+
+        async def send_and_store(message):
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+                if message['status'] == 200:
+                    response['headers'] = [(name, value) for name, value in message.get('headers', []) if name.lower() in STORED_HEADERS]
+                    message = {**message, 'headers': list(message.get('headers', [])) + cache_headers}
+            elif message['type'] == 'http.response.body' and response['status'] == 200:
+                response['chunks'].append(message.get('body', b''))
+                if not message.get('more_body', False):
+                    self.cache.put(etag, b''.join(response['chunks']), response['headers'])
+            await send(message)
+
+        await self.app(scope, receive, send_and_store)
@@ -0,0 +1,210 @@
+"""
+사이트 등록부 모듈 - 풍력 발전기/지압 타일/가로등 설정을 병렬 배열로 관리
+- 데이터 파일(CSV)에서 사이트 설정 로드 (DATA_DIR/sites.csv)
+- 사이트는 정수 인덱스로 참조 (배치 계산 시 배열 한 번 조회)
+- 기존 위치명 기반 설정 dict는 to_settings()로 생성
+"""
+import os
+import numpy as np
+import pandas as pd
+
+# 배열로 관리하는 수치 설정 항목 (CSV 열 이름과 동일)
+WIND_FIELDS = ['rated_power', 'start_wind_speed', 'area', 'efficiency', 'count', 'wind_factor']
+PIEZO_FIELDS = ['power_per_step', 'tiles_count', 'avg_hourly_people', 'step_per_person']
+NUMERIC_FIELDS = WIND_FIELDS + PIEZO_FIELDS + ['streetlight_count']
+
+# 소수로 표현되는 항목 (나머지 항목은 정수 값이면 설정 dict 변환 시 int로 변환)
+FLOAT_FIELDS = {'start_wind_speed', 'area', 'efficiency', 'wind_factor'}
+
+
+def default_registry_path():
+    """기본 사이트 등록부 파일 경로 (SITE_REGISTRY_PATH 또는 DATA_DIR/sites.csv)"""
+    return os.getenv("SITE_REGISTRY_PATH", os.path.join(os.getenv("DATA_DIR", "data"), "sites.csv"))
+
+
+class SiteRegistry:
+    """
+    사이트 설정 병렬 배열
+
+    Attributes:
+        names (list): 사이트 이름 목록 (인덱스 순서)
+        arrays (dict): 설정 항목 → float 배열 (길이 = 사이트 수)
+        wind_models (list): 풍력 발전기 모델명 목록
+        piezo_models (list): 지압 타일 모델명 목록
+    """
+
+    def __init__(self, names, arrays, wind_models=None, piezo_models=None):
+        missing = [field for field in NUMERIC_FIELDS if field not in arrays]
+        if missing:
+            raise ValueError(f"사이트 설정 항목이 누락되었습니다: {missing}")
+        if len(set(names)) != len(names):
+            raise ValueError("사이트 이름이 중복되었습니다.")
+
+        self.names = list(names)
+        self.arrays = {field: np.asarray(arrays[field], dtype=float) for field in NUMERIC_FIELDS}
+        for field, values in self.arrays.items():
+            if values.shape != (len(self.names),):
+                raise ValueError(f"{field} 배열 길이가 사이트 수와 다릅니다.")
+
+        self.wind_models = list(wind_models) if wind_models is not None else [''] * len(self.names)
+        self.piezo_models = list(piezo_models) if piezo_models is not None else [''] * len(self.names)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self.version = 0  # 설정 변경 시 증가 (조회표/캐시 무효화용)
+
+    @classmethod
+    def from_csv(cls, file_path):
+        """
+        CSV 파일에서 사이트 등록부 로드
+
+        Args:
+            file_path (str): CSV 파일 경로 (name + NUMERIC_FIELDS 열, 선택: wind_model, piezo_model)
+
+        Returns:
+            SiteRegistry: 사이트 등록부
+        """
+        df = pd.read_csv(file_path, encoding='utf-8')
+        missing = [column for column in ['name'] + NUMERIC_FIELDS if column not in df.columns]
+        if missing:
+            raise ValueError(f"사이트 등록부 파일에 필요한 열이 없습니다: {missing}")
+
+        return cls(
+            df['name'].astype(str).tolist(),
+            {field: df[field].to_numpy(dtype=float) for field in NUMERIC_FIELDS},
+            df['wind_model'].fillna('').astype(str).tolist() if 'wind_model' in df.columns else None,
+            df['piezo_model'].fillna('').astype(str).tolist() if 'piezo_model' in df.columns else None
+        )
+
+    @classmethod
+    def from_settings(cls, wind_turbine_settings, piezo_tile_settings, streetlight_count):
+        """
+        위치명 기반 설정 dict에서 사이트 등록부 생성 (풍력/지압 설정이 모두 있는 위치만)
+
+        Args:
+            wind_turbine_settings (dict): 위치별 풍력 발전기 설정
+            piezo_tile_settings (dict): 위치별 지압 타일 설정
+            streetlight_count (dict): 위치별 가로등 개수
+
+        Returns:
+            SiteRegistry: 사이트 등록부
+        """
+        names = [name for name in wind_turbine_settings if name in piezo_tile_settings]
+        arrays = {field: [wind_turbine_settings[name][field] for name in names] for field in WIND_FIELDS}
+        arrays.update({field: [piezo_tile_settings[name][field] for name in names] for field in PIEZO_FIELDS})
+        arrays['streetlight_count'] = [streetlight_count.get(name, 0) for name in names]
+
+        return cls(
+            names, arrays,
+            [wind_turbine_settings[name].get('model', '') for name in names],
+            [piezo_tile_settings[name].get('model', '') for name in names]
+        )
+
+    @classmethod
+    def load(cls, file_path=None, fallback=None):
+        """
+        사이트 등록부 파일 로드 (파일이 없거나 읽을 수 없으면 fallback 사용)
+
+        Args:
+            file_path (str, optional): CSV 파일 경로 (기본값: default_registry_path())
+            fallback (callable, optional): 파일을 쓸 수 없을 때 등록부를 생성하는 함수
+
+        Returns:
+            SiteRegistry: 사이트 등록부
+        """
+        file_path = file_path or default_registry_path()
+        try:
+            if os.path.exists(file_path):
+                registry = cls.from_csv(file_path)
+                print(f"사이트 등록부 로드 완료: {file_path} ({len(registry)}개 사이트)")
+                return registry
+            print(f"사이트 등록부 파일 없음: {file_path} - 기본 설정 사용")
+        except Exception as e:
+            if fallback is None:
+                raise
+            print(f"사이트 등록부 로드 오류: {e} - 기본 설정 사용")
+
+        if fallback is None:
+            raise FileNotFoundError(f"사이트 등록부 파일을 찾을 수 없습니다: {file_path}")
+        return fallback()
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def index_of(self, name):
+        """
+        사이트 이름 → 정수 인덱스
+
+        Args:
+            name (str): 사이트 이름
+
+        Returns:
+            int: 사이트 인덱스
+        """
+        if name not in self._index:
+            raise ValueError(f"지원되지 않는 위치: {name}")
+        return self._index[name]
+
+    def indices(self, locations):
+        """
+        위치명(또는 정수 인덱스) 배열 → 정수 인덱스 배열
+
+        Args:
+            locations (str | int | array-like): 위치명 또는 사이트 인덱스
+
+        Returns:
+            np.ndarray: 사이트 인덱스 배열 (입력과 같은 모양)
+        """
+        locations = np.asarray(locations)
+
+        if np.issubdtype(locations.dtype, np.integer):
+            if locations.size and (locations.min() < 0 or locations.max() >= len(self.names)):
+                raise ValueError(f"지원되지 않는 위치 인덱스: 0 ~ {len(self.names) - 1} 범위여야 합니다.")
+            return locations
+
+        # 고유한 위치명만 조회 후 역인덱스로 확장
+        unique_locations, inverse = np.unique(locations, return_inverse=True)
+        unique_indices = np.array([self.index_of(name) for name in unique_locations.tolist()], dtype=np.int64)
+        return unique_indices[inverse].reshape(locations.shape)
+
+    def update(self, name, **fields):
+        """
+        사이트 설정 변경 (변경 후 version 증가)
+
+        Args:
+            name (str): 사이트 이름
+            **fields: 변경할 수치 설정 항목 (예: rated_power=1500, count=3)
+        """
+        index = self.index_of(name)
+        unknown = [field for field in fields if field not in NUMERIC_FIELDS]
+        if unknown:
+            raise ValueError(f"지원되지 않는 사이트 설정 항목: {unknown}")
+
+        for field, value in fields.items():
+            self.arrays[field][index] = float(value)
+        self.version += 1
+
+    def to_settings(self):
+        """
+        위치명 기반 설정 dict 생성 (PowerCalculator의 기존 설정 형식)
+
+        Returns:
+            tuple: (wind_turbine_settings, piezo_tile_settings, streetlight_count)
+        """
+        values = {field: self.arrays[field].tolist() for field in NUMERIC_FIELDS}
+        for field in NUMERIC_FIELDS:
+            if field not in FLOAT_FIELDS:
+                values[field] = [int(v) if v.is_integer() else v for v in values[field]]
+
+        wind_turbine_settings = {}
+        piezo_tile_settings = {}
+        streetlight_count = {}
+        for i, name in enumerate(self.names):
+            wind_turbine_settings[name] = {'model': self.wind_models[i]}
+            wind_turbine_settings[name].update({field: values[field][i] for field in WIND_FIELDS})
+            piezo_tile_settings[name] = {'model': self.piezo_models[i]}
+            piezo_tile_settings[name].update({field: values[field][i] for field in PIEZO_FIELDS})
+            streetlight_count[name] = values['streetlight_count'][i]
+
+        return wind_turbine_settings, piezo_tile_settings, streetlight_count
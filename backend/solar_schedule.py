@@ -0,0 +1,162 @@
+"""
+일출/일몰 기반 가로등 점등 스케줄 모듈
+- 캠퍼스 좌표(인천)의 연도별 일출/일몰 시각표를 한 번 계산하여 메모리에 보관 (NOAA 태양 위치 근사식)
+- 가로등 점등 시간(일몰 ~ 다음날 일출)과 시간대별 점등 비율을 배열 조회로 계산
+- 전력 수지(달력 기준 연간 예측, 과거 발전량 역산)와 ESS 방전 시간대에서 사용
+"""
+import os
+import numpy as np
+from datetime import datetime, timedelta, timezone
+
+# 캠퍼스 좌표 (인천광역시 미추홀구 용현동)
+CAMPUS_LATITUDE = float(os.getenv("CAMPUS_LATITUDE", "37.45"))
+CAMPUS_LONGITUDE = float(os.getenv("CAMPUS_LONGITUDE", "126.65"))
+
+# 한국 표준시 (UTC+9)
+KOREA_UTC_OFFSET_HOURS = 9
+
+# 일출/일몰 기준 태양 고도 천정각 (대기 굴절 + 태양 반지름 보정)
+SUNRISE_ZENITH_DEGREES = 90.833
+
+
+class SolarSchedule:
+    """
+    연도별 일출/일몰 시각표
+
+    Attributes:
+        latitude (float): 위도 (도)
+        longitude (float): 경도 (도)
+        utc_offset_hours (float): 현지 시각의 UTC 차이 (시간)
+    """
+
+    def __init__(self, latitude=CAMPUS_LATITUDE, longitude=CAMPUS_LONGITUDE, utc_offset_hours=KOREA_UTC_OFFSET_HOURS):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.utc_offset_hours = utc_offset_hours
+        self._tables = {}
+
+    def _sun_times(self, day_of_year, days_in_year):
+        """
+        일출/일몰 현지 시각 계산 (NOAA 근사식, 정오 기준)
+
+        Args:
+            day_of_year (np.ndarray): 연중 일자 (0부터 시작)
+            days_in_year (int): 연간 일수 (365 또는 366)
+
+        Returns:
+            tuple: (일출 시각, 일몰 시각) 배열 (현지 시각, 소수 시간)
+        """
+        gamma = 2 * np.pi / days_in_year * day_of_year
+        equation_of_time = 229.18 * (
+            0.000075 + 0.001868 * np.cos(gamma) - 0.032077 * np.sin(gamma)
+            - 0.014615 * np.cos(2 * gamma) - 0.040849 * np.sin(2 * gamma)
+        )
+        declination = (
+            0.006918 - 0.399912 * np.cos(gamma) + 0.070257 * np.sin(gamma)
+            - 0.006758 * np.cos(2 * gamma) + 0.000907 * np.sin(2 * gamma)
+            - 0.002697 * np.cos(3 * gamma) + 0.00148 * np.sin(3 * gamma)
+        )
+
+        latitude = np.radians(self.latitude)
+        cos_hour_angle = (
+            np.cos(np.radians(SUNRISE_ZENITH_DEGREES)) / (np.cos(latitude) * np.cos(declination))
+            - np.tan(latitude) * np.tan(declination)
+        )
+        hour_angle = np.degrees(np.arccos(np.clip(cos_hour_angle, -1.0, 1.0)))
+
+        # UTC 분 → 현지 시간
+        sunrise = (720 - 4 * (self.longitude + hour_angle) - equation_of_time) / 60 + self.utc_offset_hours
+        sunset = (720 - 4 * (self.longitude - hour_angle) - equation_of_time) / 60 + self.utc_offset_hours
+        return sunrise, sunset
+
+    def table(self, year):
+        """
+        연도별 일출/일몰 시각표 (처음 조회 시 계산 후 캐시)
+
+        Args:
+            year (int): 연도
+
+        Returns:
+            dict: dates, sunrise_hours, sunset_hours (현지 소수 시간), night_hours (해당 날짜의 점등 시간 합)
+        """
+        if year not in self._tables:
+            start = np.datetime64(f'{year:04d}-01-01', 'D')
+            stop = np.datetime64(f'{year + 1:04d}-01-01', 'D')
+            dates = np.arange(start, stop)
+            sunrise, sunset = self._sun_times(np.arange(len(dates), dtype=float), len(dates))
+
+            self._tables[year] = {
+                'dates': dates,
+                'sunrise_hours': sunrise,
+                'sunset_hours': sunset,
+                # 같은 날짜 안의 점등 시간 (0시 ~ 일출 + 일몰 ~ 24시)
+                'night_hours': sunrise + (24 - sunset)
+            }
+
+        return self._tables[year]
+
+    def _lookup(self, dates, key):
+        """날짜 배열(datetime64[D]) → 시각표 값 배열 (연도별 표 조회)"""
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        years = dates.astype('datetime64[Y]').astype(int) + 1970
+        values = np.empty(dates.shape)
+        for year in np.unique(years).tolist():
+            mask = years == year
+            day_of_year = (dates[mask] - np.datetime64(f'{year:04d}-01-01', 'D')).astype(int)
+            values[mask] = self.table(year)[key][day_of_year]
+        return values
+
+    def sunrise_hours(self, dates):
+        """날짜 배열 → 일출 시각 (현지 소수 시간)"""
+        return self._lookup(dates, 'sunrise_hours')
+
+    def sunset_hours(self, dates):
+        """날짜 배열 → 일몰 시각 (현지 소수 시간)"""
+        return self._lookup(dates, 'sunset_hours')
+
+    def night_hours(self, dates):
+        """날짜 배열 → 해당 날짜의 가로등 점등 시간 합 (시간)"""
+        return self._lookup(dates, 'night_hours')
+
+    def night_fractions(self, timestamps):
+        """
+        시간 배열 → 각 시간 [h, h+1) 중 점등 시간 비율 (0 ~ 1)
+
+        Args:
+            timestamps (array-like): 정시 시각 배열 (datetime64[h])
+
+        Returns:
+            np.ndarray: 점등 비율 (시간별 가로등 소비 전력 = 정격 x 개수 x 비율)
+        """
+        timestamps = np.asarray(timestamps, dtype='datetime64[h]')
+        dates = timestamps.astype('datetime64[D]')
+        hour = (timestamps - dates).astype(int).astype(float)
+
+        before_sunrise = np.clip(self.sunrise_hours(dates) - hour, 0.0, 1.0)
+        after_sunset = np.clip(hour + 1 - self.sunset_hours(dates), 0.0, 1.0)
+        return before_sunrise + after_sunset
+
+    def is_night(self, moment=None):
+        """
+        현재(또는 지정 시각)가 일몰 ~ 일출 사이인지 여부
+
+        Args:
+            moment (datetime, optional): 시각 (시간대 정보가 있으면 현지 시각으로 변환, 기본값: 현재 현지 시각)
+
+        Returns:
+            bool: 야간 여부
+        """
+        local_timezone = timezone(timedelta(hours=self.utc_offset_hours))
+        if moment is None:
+            moment = datetime.now(local_timezone)
+        elif moment.tzinfo is not None:
+            moment = moment.astimezone(local_timezone)
+        date = np.datetime64(moment.date(), 'D')
+        hours = moment.hour + moment.minute / 60 + moment.second / 3600
+        return bool(hours < self.sunrise_hours(date) or hours >= self.sunset_hours(date))
+
+    @staticmethod
+    def format_hours(hours):
+        """소수 시간 → 'HH:MM' 문자열"""
+        minutes = int(round(float(hours) * 60))
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
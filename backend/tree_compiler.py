@@ -0,0 +1,265 @@
+"""
+트리 모델 컴파일 모듈 - 학습된 RandomForest/GradientBoosting 회귀 모델을 평면 배열로 변환
+- 전체 트리의 노드를 연속된 NumPy 배열(feature, threshold, children, value)로 합쳐 (행 수, 트리 수) 단위로 동시에 순회
+- 파이프라인 전처리(SimpleImputer 결측 대체, StandardScaler 표준화)도 배열 연산으로 수행
+- sklearn과 같은 연산 순서를 유지 (입력 float32 변환 후 float64 임계값과 <= 비교, 트리 값 순차 합산)
+- 로드 시 검증 입력에서 sklearn 예측과 비트 단위로 같은지 확인하고, 다르면 사용하지 않음
+"""
+import numpy as np
+from sklearn.pipeline import Pipeline
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.dummy import DummyRegressor
+
+# 검증 입력 행 수
+VERIFY_ROWS = 2000
+
+
+class CompiledTreeModel:
+    """
+    평면 배열 트리 앙상블 회귀 모델
+
+    잎 노드는 자기 자신을 자식으로 가리키므로 최대 깊이만큼 반복하면 모든 경로가 잎에 도달합니다.
+
+    Attributes:
+        kind (str): 'forest' (트리 평균) 또는 'boosting' (초기값 + 학습률 x 트리 값 누적)
+        feature (np.ndarray): 노드별 분기 특성 인덱스 (잎은 0)
+        threshold (np.ndarray): 노드별 분기 임계값 (float64)
+        children (np.ndarray): (노드 수, 2) 왼쪽/오른쪽 자식 전역 인덱스 (잎은 자기 자신)
+        value (np.ndarray): 노드별 값 (boosting은 학습률을 곱한 값)
+        roots (np.ndarray): 트리별 루트 노드 전역 인덱스
+        max_depth (int): 최대 트리 깊이
+        init_value (float): boosting 초기 예측값
+        impute_values (np.ndarray | None): 결측 대체값 (SimpleImputer)
+        scale_mean (np.ndarray | None): 표준화 평균 (StandardScaler)
+        scale_std (np.ndarray | None): 표준화 척도 (StandardScaler)
+    """
+
+    def __init__(self, kind, trees, n_features, init_value=0.0, tree_scale=None, impute_values=None, scale_mean=None, scale_std=None):
+        self.kind = kind
+        self.n_features = n_features
+        self.init_value = float(init_value)
+        self.impute_values = impute_values
+        self.scale_mean = scale_mean
+        self.scale_std = scale_std
+
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees])
+        self.roots = offsets[:-1].astype(np.intp)
+        self.max_depth = max(int(tree.max_depth) for tree in trees)
+
+        features, thresholds, children, values = [], [], [], []
+        for offset, tree in zip(offsets[:-1].tolist(), trees):
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            children.append(np.stack([
+                np.where(is_leaf, nodes, tree.children_left) + offset,
+                np.where(is_leaf, nodes, tree.children_right) + offset
+            ], axis=1))
+            tree_values = tree.value[:, 0, 0]
+            # boosting: predict_stages와 같이 학습률 x 값을 먼저 계산
+            values.append(tree_values * tree_scale if tree_scale is not None else tree_values)
+
+        self.feature = np.ascontiguousarray(np.concatenate(features), dtype=np.intp)
+        self.threshold = np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64)
+        self.children = np.ascontiguousarray(np.concatenate(children), dtype=np.intp)
+        self.value = np.ascontiguousarray(np.concatenate(values), dtype=np.float64)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    def split_thresholds(self, feature):
+        """
+        특성별 분기 임계값 (원본 입력 공간, 중복 제거)
+
+        Args:
+            feature (int): 특성 인덱스
+
+        Returns:
+            np.ndarray: 임계값 (표준화 전 값, 오름차순)
+        """
+        thresholds = np.unique(self.threshold[np.isfinite(self.threshold) & (self.feature == feature)])
+        if self.scale_std is not None:
+            thresholds = thresholds * self.scale_std[feature]
+        if self.scale_mean is not None:
+            thresholds = thresholds + self.scale_mean[feature]
+        return thresholds
+
+    def transform(self, X):
+        """파이프라인 전처리 (결측 대체 → 표준화, sklearn과 같은 연산 순서)"""
+        X = np.array(X, dtype=np.float64, ndmin=2)
+        if self.impute_values is not None:
+            X = np.where(np.isnan(X), self.impute_values, X)
+        if self.scale_mean is not None:
+            X = X - self.scale_mean
+        if self.scale_std is not None:
+            X = X / self.scale_std
+        return X
+
+    def leaves(self, X):
+        """
+        행별 트리별 잎 노드 전역 인덱스
+
+        Args:
+            X (np.ndarray): 전처리된 입력 (행 수, 특성 수)
+
+        Returns:
+            np.ndarray: (행 수, 트리 수) 잎 노드 인덱스
+        """
+        # sklearn 트리는 입력을 float32로 변환한 뒤 float64 임계값과 비교
+        X = X.astype(np.float32)
+        rows = np.arange(len(X))[:, np.newaxis]
+        nodes = np.broadcast_to(self.roots, (len(X), self.n_trees)).copy()
+        for _ in range(self.max_depth):
+            go_right = X[rows, self.feature[nodes]] > self.threshold[nodes]
+            nodes = self.children[nodes, go_right.view(np.int8)]
+        return nodes
+
+    def predict(self, X):
+        """
+        예측 (sklearn Pipeline.predict와 같은 값)
+
+        Args:
+            X (array-like): 원본 입력 (행 수, 특성 수), NaN = 결측
+
+        Returns:
+            np.ndarray: 예측값 (행 수,)
+        """
+        X = self.transform(X)
+        leaf_values = self.value[self.leaves(X)]
+
+        if self.kind == 'forest':
+            # 트리 순서대로 0부터 누적한 뒤 트리 수로 나눔 (누적합 마지막 값 = 순차 합)
+            return np.cumsum(leaf_values, axis=1)[:, -1] / self.n_trees
+
+        # 초기값부터 단계 순서대로 누적
+        init = np.full((len(X), 1), self.init_value)
+        return np.cumsum(np.concatenate([init, leaf_values], axis=1), axis=1)[:, -1]
+
+
+def compile_tree_model(model):
+    """
+    학습된 모델(파이프라인 포함) → CompiledTreeModel
+
+    지원: [SimpleImputer(missing_values=NaN)] → [StandardScaler] → RandomForestRegressor / GradientBoostingRegressor
+
+    Args:
+        model: sklearn 회귀 모델 또는 Pipeline
+
+    Returns:
+        CompiledTreeModel: 컴파일된 모델
+
+    Raises:
+        ValueError: 지원되지 않는 구성
+    """
+    steps = model.steps if isinstance(model, Pipeline) else [('model', model)]
+    *preprocessors, (_, estimator) = steps
+
+    impute_values = scale_mean = scale_std = None
+    for name, step in preprocessors:
+        if isinstance(step, SimpleImputer) and impute_values is None and scale_mean is None and scale_std is None:
+            statistics = np.asarray(step.statistics_, dtype=np.float64)
+            if not (isinstance(step.missing_values, float) and np.isnan(step.missing_values)) or step.add_indicator \
+                    or not np.all(np.isfinite(statistics)):
+                raise ValueError(f"지원되지 않는 결측 대체 설정: {name}")
+            impute_values = statistics
+        elif isinstance(step, StandardScaler) and scale_mean is None and scale_std is None:
+            scale_mean = np.asarray(step.mean_, dtype=np.float64) if step.with_mean else None
+            scale_std = np.asarray(step.scale_, dtype=np.float64) if step.with_std else None
+        else:
+            raise ValueError(f"지원되지 않는 전처리 단계: {name} ({type(step).__name__})")
+
+    if isinstance(estimator, RandomForestRegressor):
+        if estimator.n_outputs_ != 1:
+            raise ValueError("단일 출력 모델만 지원합니다.")
+        trees = [tree.tree_ for tree in estimator.estimators_]
+        return CompiledTreeModel('forest', trees, estimator.n_features_in_,
+                                 impute_values=impute_values, scale_mean=scale_mean, scale_std=scale_std)
+
+    if isinstance(estimator, GradientBoostingRegressor):
+        if estimator.init_ == 'zero':
+            init_value = 0.0
+        elif isinstance(estimator.init_, DummyRegressor) and estimator.init_.constant_.size == 1:
+            init_value = float(np.asarray(estimator.init_.constant_, dtype=np.float64).ravel()[0])
+        else:
+            raise ValueError("지원되지 않는 초기 예측 모델입니다.")
+        trees = [tree.tree_ for tree in estimator.estimators_[:, 0]]
+        return CompiledTreeModel('boosting', trees, estimator.n_features_in_, init_value=init_value,
+                                 tree_scale=estimator.learning_rate,
+                                 impute_values=impute_values, scale_mean=scale_mean, scale_std=scale_std)
+
+    raise ValueError(f"지원되지 않는 모델: {type(estimator).__name__}")
+
+
+def verification_inputs(compiled, num_rows=VERIFY_ROWS, seed=0):
+    """
+    검증 입력 생성 (원본 입력 공간)
+
+    분기 임계값을 원본 공간으로 되돌린 값과 그 주변 값(float32 인접값), 임계값 범위의 무작위 값,
+    결측값(NaN)을 섞어 모든 분기 방향이 나오도록 구성합니다.
+
+    Args:
+        compiled (CompiledTreeModel): 컴파일된 모델
+        num_rows (int): 행 수
+        seed (int): 난수 시드
+
+    Returns:
+        np.ndarray: (행 수, 특성 수) 입력
+    """
+    rng = np.random.default_rng(seed)
+    n_features = compiled.n_features
+    scale = compiled.scale_std if compiled.scale_std is not None else np.ones(n_features)
+    shift = compiled.scale_mean if compiled.scale_mean is not None else np.zeros(n_features)
+
+    X = np.empty((num_rows, n_features))
+    internal = np.isfinite(compiled.threshold)
+    for j in range(n_features):
+        thresholds = compiled.threshold[internal & (compiled.feature == j)]
+        if thresholds.size == 0:
+            X[:, j] = rng.normal(shift[j], scale[j] if scale[j] > 0 else 1.0, num_rows)
+            continue
+        raw = thresholds * scale[j] + shift[j]
+        near = np.concatenate([
+            thresholds, np.nextafter(thresholds.astype(np.float32), np.float32(np.inf)),
+            np.nextafter(thresholds.astype(np.float32), np.float32(-np.inf))
+        ]).astype(np.float64) * scale[j] + shift[j]
+        low, high = raw.min(), raw.max()
+        margin = max(high - low, 1.0) * 0.1
+        uniform = rng.uniform(low - margin, high + margin, num_rows)
+        X[:, j] = np.where(rng.random(num_rows) < 0.5, rng.choice(near, num_rows), uniform)
+
+    if compiled.impute_values is not None:
+        X[rng.random(X.shape) < 0.05] = np.nan
+    return X
+
+
+def verify_compiled_model(compiled, model, X=None):
+    """
+    컴파일된 모델과 sklearn 모델의 예측이 비트 단위로 같은지 확인
+
+    Args:
+        compiled (CompiledTreeModel): 컴파일된 모델
+        model: 원본 sklearn 모델/파이프라인
+        X (np.ndarray, optional): 검증 입력 (기본값: verification_inputs)
+
+    Returns:
+        dict: rows, mismatches, max_abs_error, identical
+    """
+    if X is None:
+        X = verification_inputs(compiled)
+    expected = np.asarray(model.predict(X), dtype=np.float64).ravel()
+    actual = compiled.predict(X)
+    mismatches = int(np.count_nonzero(expected.view(np.int64) != actual.view(np.int64)))
+    return {
+        'rows': len(X),
+        'mismatches': mismatches,
+        'max_abs_error': float(np.max(np.abs(expected - actual))) if len(X) else 0.0,
+        'identical': mismatches == 0
+    }
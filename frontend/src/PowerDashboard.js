@@ -91,7 +91,7 @@ const PowerDashboard = () => {
     setError(null);
     
     try {
-      const data = await fetchData(`${API_BASE_URL}/power/weekly/${selectedLocation}?avg_wind_speed=${windSpeed}`);
+      const data = await fetchData(`${API_BASE_URL}/power/weekly/${selectedLocation}?avg_wind_speed=${windSpeed}&detail=day`);
       setWeeklyPower(data);
     } catch (err) {
       console.error('주간 전력 데이터 조회 오류:', err);
@@ -107,7 +107,7 @@ const PowerDashboard = () => {
     setError(null);
     
     try {
-      const data = await fetchData(`${API_BASE_URL}/power/monthly/${selectedLocation}?avg_wind_speed=${windSpeed}&min_temp=5&max_temp=25`);
+      const data = await fetchData(`${API_BASE_URL}/power/monthly/${selectedLocation}?avg_wind_speed=${windSpeed}&min_temp=5&max_temp=25&detail=week`);
       setMonthlyPower(data);
     } catch (err) {
       console.error('월간 전력 데이터 조회 오류:', err);
@@ -123,7 +123,7 @@ const PowerDashboard = () => {
     setError(null);
     
     try {
-      const data = await fetchData(`${API_BASE_URL}/power/annual/${selectedLocation}`);
+      const data = await fetchData(`${API_BASE_URL}/power/annual/${selectedLocation}?detail=month&year=${new Date().getFullYear()}`);
       setAnnualPower(data);
     } catch (err) {
       console.error('연간 전력 데이터 조회 오류:', err);
@@ -1051,7 +1051,7 @@ const PowerDashboard = () => {
             <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
               <div>
                 <p className="text-xs text-gray-500">가로등 개수</p>
-                <p className="font-semibold">{annualPower.streetlight_consumption_wh / (150 * 12 * 365)} 개</p>
+                <p className="font-semibold">{Math.round(annualPower.streetlight_consumption_wh / (150 * (annualPower.streetlight_hours || 12 * (annualPower.days || 365))))} 개</p>
               </div>
               <div>
                 <p className="text-xs text-gray-500">소비 전력</p>
@@ -1063,7 +1063,7 @@ const PowerDashboard = () => {
               </div>
               <div>
                 <p className="text-xs text-gray-500">일평균 발전량</p>
-                <p className="font-semibold">{formatEnergy(annualPower.annual_total_power_wh / 365, 'Wh')}</p>
+                <p className="font-semibold">{formatEnergy(annualPower.annual_total_power_wh / (annualPower.days || 365), 'Wh')}</p>
               </div>
             </div>
           </div>